@@ -6,16 +6,23 @@ from agents import Agent, Runner, AsyncOpenAI,  OpenAIChatCompletionsModel, RunR
 
 load_dotenv()
 
-external_client: AsyncOpenAI = AsyncOpenAI(base_url = "https://generativelanguage.googleapis.com/v1beta/openai/",
-                        api_key = os.getenv("GEMINI_API_KEY"))
 
+def main():
+    # Clients are built here rather than at import, so importing this module has no side effects
+    external_client: AsyncOpenAI = AsyncOpenAI(base_url = "https://generativelanguage.googleapis.com/v1beta/openai/",
+                            api_key = os.getenv("GEMINI_API_KEY"))
 
-llm_model: OpenAIChatCompletionsModel = OpenAIChatCompletionsModel(openai_client= external_client,model = "gemini-2.0-flash")
 
-config: RunConfig = RunConfig(model=llm_model,max_tokens=1000,temperature=0.)
+    llm_model: OpenAIChatCompletionsModel = OpenAIChatCompletionsModel(openai_client= external_client,model = "gemini-2.0-flash")
 
-chat_agent: Agent = Agent(name = "chat-agent", model = llm_model, tools = [])
+    config: RunConfig = RunConfig(model=llm_model,max_tokens=1000,temperature=0.)
 
-runner: RunResult = Runner.run_sync(starting_agent = chat_agent,input = "What is the capital of France?")
+    chat_agent: Agent = Agent(name = "chat-agent", model = llm_model, tools = [])
 
-print(runner.final_output)
\ No newline at end of file
+    runner: RunResult = Runner.run_sync(starting_agent = chat_agent,input = "What is the capital of France?")
+
+    print(runner.final_output)
+
+
+if __name__ == "__main__":
+    main()
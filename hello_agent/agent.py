@@ -6,14 +6,42 @@ This module contains pre-configured specialized agents for different domains.
 These agents can be imported and used in other parts of the application.
 """
 
-from agents import Agent
+from typing import Any, Callable
+
+from agents import Agent, Model
+
+from router import create_router
+from scenarios import ScenarioRecord, demo_concurrency, format_record, format_summary, run_scenarios
+
+# Educational demo questions, labelled with the tutor that should answer each one
+EDUCATIONAL_QUESTIONS = [
+    {"question": "How do I solve quadratic equations?", "expected_agent": "Mathematics Tutor"},
+    {"question": "What were the causes of World War I?", "expected_agent": "History Tutor"},
+    {"question": "Explain the process of photosynthesis", "expected_agent": "Science Tutor"},
+    {"question": "Analyze the themes in Shakespeare's Hamlet", "expected_agent": "Literature Tutor"},
+]
+
+# Subject keywords that the handoff descriptions and instructions do not mention, for the local router.
+# Kept free of the demo questions' own words, so routing them measures the router rather than the hints.
+ROUTING_HINTS = {
+    "Mathematics Tutor": "formula number proof theorem arithmetic fraction probability integral matrix percentage trigonometry",
+    "History Tutor": "revolution century dynasty civilization president king treaty medieval colonial monarchy battle",
+    "Science Tutor": "physics chemistry biology cell atom molecule energy evolution experiment force reaction organism",
+    "Literature Tutor": "novel poetry author character plot essay book literary verse playwright narrator sonnet",
+}
 
 # Educational Domain Agents
-def create_educational_agents():
-    """Create a set of educational agents for different subjects."""
+def create_educational_agents(model: str | Model | None = None) -> tuple[Agent, Agent, Agent, Agent]:
+    """
+    Create a set of educational agents for different subjects.
+
+    Args:
+        model: Model shared by every agent; defaults to the SDK's default model.
+    """
     
     math_tutor = Agent(
         name="Mathematics Tutor",
+        model=model,
         handoff_description="Specialist agent for mathematical problems and concepts",
         instructions="""
         You are an expert mathematics tutor with deep knowledge in:
@@ -29,6 +57,7 @@ def create_educational_agents():
     
     history_tutor = Agent(
         name="History Tutor",
+        model=model,
         handoff_description="Specialist agent for historical questions and analysis",
         instructions="""
         You are a knowledgeable history tutor specializing in:
@@ -44,6 +73,7 @@ def create_educational_agents():
     
     science_tutor = Agent(
         name="Science Tutor",
+        model=model,
         handoff_description="Specialist agent for scientific concepts and experiments",
         instructions="""
         You are a science tutor with expertise in:
@@ -59,6 +89,7 @@ def create_educational_agents():
     
     literature_tutor = Agent(
         name="Literature Tutor",
+        model=model,
         handoff_description="Specialist agent for literary analysis and writing",
         instructions="""
         You are a literature tutor specializing in:
@@ -75,11 +106,17 @@ def create_educational_agents():
     return math_tutor, history_tutor, science_tutor, literature_tutor
 
 # Professional Domain Agents
-def create_professional_agents():
-    """Create a set of professional agents for business and technical tasks."""
+def create_professional_agents(model: str | Model | None = None) -> tuple[Agent, Agent, Agent, Agent]:
+    """
+    Create a set of professional agents for business and technical tasks.
+
+    Args:
+        model: Model shared by every agent; defaults to the SDK's default model.
+    """
     
     business_analyst = Agent(
         name="Business Analyst",
+        model=model,
         handoff_description="Specialist agent for business analysis and strategy",
         instructions="""
         You are a business analyst with expertise in:
@@ -95,6 +132,7 @@ def create_professional_agents():
     
     software_architect = Agent(
         name="Software Architect",
+        model=model,
         handoff_description="Specialist agent for software design and architecture",
         instructions="""
         You are a software architect with expertise in:
@@ -110,6 +148,7 @@ def create_professional_agents():
     
     data_scientist = Agent(
         name="Data Scientist",
+        model=model,
         handoff_description="Specialist agent for data analysis and machine learning",
         instructions="""
         You are a data scientist with expertise in:
@@ -125,6 +164,7 @@ def create_professional_agents():
     
     project_manager = Agent(
         name="Project Manager",
+        model=model,
         handoff_description="Specialist agent for project planning and management",
         instructions="""
         You are a project manager with expertise in:
@@ -141,14 +181,20 @@ def create_professional_agents():
     return business_analyst, software_architect, data_scientist, project_manager
 
 # Specialized Coordinator Agents
-def create_coordinator_agents():
-    """Create coordinator agents that can route tasks to appropriate specialists."""
+def create_coordinator_agents(model: str | Model | None = None) -> tuple[Agent, Agent]:
+    """
+    Create coordinator agents that can route tasks to appropriate specialists.
+
+    Args:
+        model: Model shared by every agent; defaults to the SDK's default model.
+    """
     
     # Educational coordinator
-    math_tutor, history_tutor, science_tutor, literature_tutor = create_educational_agents()
+    math_tutor, history_tutor, science_tutor, literature_tutor = create_educational_agents(model)
     
     educational_coordinator = Agent(
         name="Educational Coordinator",
+        model=model,
         instructions="""
         You are an educational coordinator responsible for:
         - Analyzing student questions and determining the appropriate subject specialist
@@ -163,10 +209,11 @@ def create_coordinator_agents():
     )
     
     # Professional coordinator
-    business_analyst, software_architect, data_scientist, project_manager = create_professional_agents()
+    business_analyst, software_architect, data_scientist, project_manager = create_professional_agents(model)
     
     professional_coordinator = Agent(
         name="Professional Coordinator",
+        model=model,
         instructions="""
         You are a professional coordinator responsible for:
         - Analyzing business and technical requests
@@ -183,32 +230,45 @@ def create_coordinator_agents():
     return educational_coordinator, professional_coordinator
 
 # Demo function
-async def run_educational_demo():
-    """Run a demo of the educational agents."""
-    educational_coordinator, _ = create_coordinator_agents()
+async def run_educational_demo(concurrency: int | None = None) -> list[ScenarioRecord]:
+    """
+    Run a demo of the educational agents.
+
+    Args:
+        concurrency: Questions run at once; defaults to DEMO_CONCURRENCY (1). Output stays in question order.
+    """
+    import time
+    from agents import Runner
     
-    demo_questions = [
-        "How do I solve quadratic equations?",
-        "What were the causes of World War I?",
-        "Explain the process of photosynthesis",
-        "Analyze the themes in Shakespeare's Hamlet"
-    ]
+    educational_coordinator, _ = create_coordinator_agents()
+    router = create_router(educational_coordinator, ROUTING_HINTS)
+    concurrency = concurrency or demo_concurrency()
     
     print("🎓 Educational Agents Demo")
     print("=" * 40)
     
-    for question in demo_questions:
-        print(f"\n📝 Question: {question}")
+    async def answer(question: str, log: Callable[[str], None]) -> Any:
+        agent = router.agent_for(question, educational_coordinator) if router else educational_coordinator
+        if agent is not educational_coordinator:
+            log(f"🧭 Routed locally to {agent.name}")
+        return await Runner.run(agent, question)
+    
+    def show(record: ScenarioRecord) -> None:
+        print(f"\n📝 Question: {record.query}")
         print("-" * 30)
-        
-        try:
-            from agents import Runner
-            result = await Runner.run(educational_coordinator, question)
-            print(f"🤖 Response: {result.final_output}")
-        except Exception as e:
-            print(f"❌ Error: {str(e)}")
-        
+        for line in record.log:
+            print(line)
+        if record.error:
+            print(f"❌ Error: {record.error}")
+        else:
+            print(f"🤖 Response: {record.output}")
+        print(f"📊 {format_record(record)}")
         print("\n" + "="*40)
+    
+    start = time.perf_counter()
+    records = await run_scenarios([item["question"] for item in EDUCATIONAL_QUESTIONS], answer, concurrency, show)
+    print(format_summary(records, time.perf_counter() - start))
+    return records
 
 if __name__ == "__main__":
     import asyncio
@@ -0,0 +1,74 @@
+"""
+Fan-out and merge for the multi-domain demo scenario: concurrent vs sequential branches.
+
+The "Complex Multi-Domain Task" scenario from main.py is planned into three
+sub-tasks whose specialists take different times (stand-in model). The
+branches then run one after another, concurrently, and concurrently with a
+per-branch timeout shorter than the slowest branch, which leaves a partial
+answer. Concurrent wall time should be planner + slowest branch + merge.
+
+Run from the hello_agent directory:
+    uv run python -m benchmarks.bench_fanout
+"""
+
+import asyncio
+import time
+
+from agents import Runner, set_tracing_disabled
+
+import main as demo
+from benchmarks.routing_model import RoutingModel
+from fanout import BranchResult, FanoutOrchestrator
+
+LATENCY = 0.3
+QUERY = next(scenario["query"] for scenario in demo.DEMO_SCENARIOS if scenario["expected_agent"].startswith("Task Coordinator"))
+# (specialist, task, seconds the specialist takes)
+SUBTASKS = [
+    ("Technical Specialist", "Plan the technical implementation of a gamified mathematics learning app.", 0.6),
+    ("Research Specialist", "Outline an educational content strategy for teaching mathematics through games.", 0.4),
+    ("Creative Director", "Propose user engagement features for a gamified mathematics learning app.", 0.5),
+]
+SHORT_TIMEOUT = 0.55
+
+
+def print_result(label: str, seconds: float, branches: list[BranchResult], tokens: int) -> None:
+    print(f"\n  {label}: {seconds * 1000:.0f} ms, {tokens} tokens")
+    for branch in branches:
+        status = "✅" if branch.error is None else f"❌ {branch.error}"
+        print(f"    {branch.specialist:<22} {branch.seconds * 1000:5.0f} ms  {status}")
+
+
+async def main() -> None:
+    set_tracing_disabled(True)
+    plan = {"subtasks": [{"specialist": name, "task": task} for name, task, _ in SUBTASKS]}
+    model = RoutingModel({}, LATENCY, plans={QUERY: plan}, latencies={task: seconds for _, task, seconds in SUBTASKS})
+    coordinator = demo.create_agents(model)[0]
+
+    print("🔀 Fan-out and merge: multi-domain scenario")
+    print("=" * 60)
+    print(f"  planner {LATENCY * 1000:.0f} ms, merge {LATENCY * 1000:.0f} ms, branches "
+          + ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, _, seconds in SUBTASKS))
+    print(f"  sum of branches {sum(s for *_, s in SUBTASKS) * 1000:.0f} ms, slowest {max(s for *_, s in SUBTASKS) * 1000:.0f} ms")
+
+    fanout = FanoutOrchestrator.from_coordinator(coordinator)
+    await fanout.run(QUERY)  # warm-up
+
+    # Same steps as FanoutOrchestrator.run, but one branch at a time
+    start = time.perf_counter()
+    sequential_plan, tokens = await fanout.plan(QUERY)
+    branches = [await fanout.run_branch(subtask) for subtask in sequential_plan.subtasks]
+    merged = await Runner.run(fanout.merger, fanout.merge_input(QUERY, branches))
+    tokens += sum(branch.tokens for branch in branches) + merged.context_wrapper.usage.total_tokens
+    print_result("sequential branches", time.perf_counter() - start, branches, tokens)
+
+    result = await fanout.run(QUERY)
+    print_result("concurrent branches", result.seconds, result.branches, result.tokens)
+
+    fanout.branch_timeout = SHORT_TIMEOUT
+    result = await fanout.run(QUERY)
+    print_result(f"concurrent, {SHORT_TIMEOUT * 1000:.0f} ms branch timeout", result.seconds, result.branches, result.tokens)
+    print(f"    partial: {result.partial}; merged answer still returned: {bool(result.final_output)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+"""
+Local pre-router vs coordinator handoff: routing agreement and latency.
+
+Both demo sets (``DEMO_SCENARIOS`` from main.py, ``EDUCATIONAL_QUESTIONS``
+from agent.py) run against a labelled stand-in model, once always starting at
+the coordinator (a routing round trip, then the specialist's) and once
+starting wherever the local router sends them. Agreement is the share of
+queries the router sends where the coordinator would have handed off
+(queries it is unsure about count as agreeing when the coordinator keeps
+them too); a misroute is a query sent straight to the wrong specialist.
+Each set is followed by held-out queries (``routing_queries.py``) written
+without reading the hints or the agents' instructions, since the hints were
+written next to the demo sets and agreement on those alone overstates the
+router, and by queries
+that mix two specialists' vocabularies, which the router has to defer.
+
+Run from the hello_agent directory:
+    uv run python -m benchmarks.bench_router
+"""
+
+import asyncio
+import statistics
+import time
+
+from agents import Agent, Runner, set_tracing_disabled
+
+import agent as educational
+import main as demo
+from benchmarks.routing_model import RoutingModel
+from benchmarks.routing_queries import CROSS_DOMAIN_DEMO, HELD_OUT_DEMO, HELD_OUT_EDUCATIONAL, index_overlap
+from router import LocalRouter
+
+LATENCY = 0.3
+ROUTE_REPEATS = 1000
+
+
+async def run_set(title: str, coordinator: Agent, queries: list[str], hints: dict[str, str]) -> None:
+    router = LocalRouter.from_coordinator(coordinator, hints=hints)
+
+    start = time.perf_counter()
+    for _ in range(ROUTE_REPEATS):
+        for query in queries:
+            router.route(query)
+    route_us = (time.perf_counter() - start) / (ROUTE_REPEATS * len(queries)) * 1e6
+
+    print(f"\n{title}: {len(queries)} queries, {LATENCY * 1000:.0f} ms per model call, route() {route_us:.0f} µs")
+    print("-" * 78)
+    agree = skipped = misrouted = 0
+    baseline_times, routed_times = [], []
+    baseline_tokens = routed_tokens = 0
+    for query in queries:
+        start = time.perf_counter()
+        baseline = await Runner.run(coordinator, query)
+        baseline_times.append(time.perf_counter() - start)
+        baseline_tokens += baseline.context_wrapper.usage.total_tokens
+
+        start = time.perf_counter()
+        first = router.agent_for(query, coordinator)
+        routed = await Runner.run(first, query)
+        routed_times.append(time.perf_counter() - start)
+        routed_tokens += routed.context_wrapper.usage.total_tokens
+
+        agree += routed.last_agent.name == baseline.last_agent.name
+        skipped += first is not coordinator
+        misrouted += first is not coordinator and first.name != baseline.last_agent.name
+        mark = "✅" if routed.last_agent.name == baseline.last_agent.name else "❌"
+        print(
+            f"  {mark} {query[:40]:<40} → {(first.name if first is not coordinator else 'coordinator'):<20}"
+            f" {baseline_times[-1] * 1000:5.0f} → {routed_times[-1] * 1000:4.0f} ms"
+        )
+    print("-" * 78)
+    print(f"  agreement with coordinator   {agree}/{len(queries)}")
+    print(f"  coordinator hops skipped     {skipped}/{len(queries)}")
+    print(f"  misrouted                    {misrouted}/{len(queries)}")
+    print(
+        f"  mean latency                 {statistics.mean(baseline_times) * 1000:.0f} ms → "
+        f"{statistics.mean(routed_times) * 1000:.0f} ms"
+    )
+    print(f"  tokens                       {baseline_tokens} → {routed_tokens}")
+
+
+async def run_held_out(title: str, coordinator: Agent, queries: list[tuple[str, str]], hints: dict[str, str]) -> None:
+    shared, hint_terms, phrases = index_overlap(queries, coordinator, hints)
+    if hint_terms or phrases:
+        print(f"\n⚠️ {title} are not held out: {', '.join(sorted(hint_terms | phrases))} come from the router's text")
+    await run_set(title, coordinator, [query for query, _ in queries], hints)
+
+
+async def main() -> None:
+    set_tracing_disabled(True)
+    print("🧭 Local pre-router vs coordinator handoff")
+    print("=" * 78)
+
+    labels = {scenario["query"]: scenario["expected_agent"] for scenario in demo.DEMO_SCENARIOS}
+    coordinator = demo.create_agents(RoutingModel(labels | dict(HELD_OUT_DEMO) | dict(CROSS_DOMAIN_DEMO), LATENCY))[0]
+    await run_set("Demo scenarios (main.py)", coordinator, list(labels), demo.ROUTING_HINTS)
+    await run_held_out("Held-out demo queries", coordinator, HELD_OUT_DEMO, demo.ROUTING_HINTS)
+    await run_set("Cross-domain demo queries", coordinator, [query for query, _ in CROSS_DOMAIN_DEMO], demo.ROUTING_HINTS)
+
+    labels = {item["question"]: item["expected_agent"] for item in educational.EDUCATIONAL_QUESTIONS}
+    coordinator = educational.create_coordinator_agents(RoutingModel(labels | dict(HELD_OUT_EDUCATIONAL), LATENCY))[0]
+    await run_set("Educational questions (agent.py)", coordinator, list(labels), educational.ROUTING_HINTS)
+    await run_held_out("Held-out educational questions", coordinator, HELD_OUT_EDUCATIONAL, educational.ROUTING_HINTS)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
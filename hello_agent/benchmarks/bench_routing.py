@@ -0,0 +1,257 @@
+"""
+Routing regression baseline and latency suite for the coordinator agents.
+
+Labelled query sets run through the agent graphs of ``create_agents()``
+(main.py) and ``create_coordinator_agents()`` (agent.py, educational and
+professional) against the ``DescriptionRoutingModel`` stand-in, once starting
+at the coordinator and once through the local pre-router. The stand-in
+coordinator picks a handoff from the handoff descriptions and its own
+instructions, never from the labels. Its background vocabulary
+(``TOPIC_WORDS``) was written alongside these queries, though, so how many
+labels are met is not a routing accuracy: it is a baseline pinned in
+``BASELINE``, per set and mode, together with how many queries the local
+router sent straight to a specialist. Everything is deterministic, so any
+change to either count is a change in the router, the hints or the agents'
+descriptions and instructions, and fails the run until the baseline is
+updated on purpose.
+
+The held-out sets (``routing_queries.py``) are written without the routing
+hints or the agents' instructions. The router defers all of them to the
+coordinator, so their local-router rows match coordinator mode exactly: they
+show the router stays out of the way on queries it has not seen, not that it
+routes them. Exits non-zero if a count moves off the baseline, if the local
+router sends any query straight to the wrong specialist, if per-hop overhead
+is outside its budget, or if a held-out set uses hint words or copies a phrase
+the router indexes.
+
+Run from the hello_agent directory:
+    uv run python -m benchmarks.bench_routing
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from agents import Agent, ModelResponse, RunContextWrapper, RunHooks, Runner, TResponseInputItem, set_tracing_disabled
+
+import agent as educational
+import main as demo
+from benchmarks.routing_model import DescriptionRoutingModel
+from benchmarks.routing_queries import CROSS_DOMAIN_DEMO, HELD_OUT_DEMO, HELD_OUT_EDUCATIONAL, HELD_OUT_PROFESSIONAL, index_overlap
+from router import LocalRouter
+
+# (set, mode) -> (queries whose label is met, queries the local router sent straight to a specialist).
+# Not accuracy: the stand-in coordinator's vocabulary was written next to these queries. Update
+# deliberately, with the reason in the commit, when a router, hint or description change moves them.
+BASELINE: dict[tuple[str, str], tuple[int, int]] = {
+    ("demo", "coordinator"): (4, 0),
+    ("demo", "local router"): (5, 3),
+    ("demo held-out", "coordinator"): (8, 0),
+    ("demo held-out", "local router"): (8, 0),
+    ("demo cross-domain", "coordinator"): (1, 0),
+    ("demo cross-domain", "local router"): (1, 0),
+    ("educational", "coordinator"): (4, 0),
+    ("educational", "local router"): (4, 1),
+    ("educational held-out", "coordinator"): (6, 0),
+    ("educational held-out", "local router"): (6, 0),
+    ("professional held-out", "coordinator"): (3, 0),
+    ("professional held-out", "local router"): (3, 0),
+}
+
+
+class HopTimer(RunHooks):
+    """Times every model call (hop) of a run, by agent."""
+
+    def __init__(self) -> None:
+        self.hops: list[tuple[str, float]] = []
+        self._started = 0.0
+
+    async def on_llm_start(
+        self,
+        context: RunContextWrapper[Any],
+        agent: Agent[Any],
+        system_prompt: str | None,
+        input_items: list[TResponseInputItem],
+    ) -> None:
+        self._started = time.perf_counter()
+
+    async def on_llm_end(self, context: RunContextWrapper[Any], agent: Agent[Any], response: ModelResponse) -> None:
+        self.hops.append((agent.name, time.perf_counter() - self._started))
+
+
+@dataclass
+class QueryResult:
+    query: str
+    expected: str
+    answered_by: str
+    routed_to: str
+    seconds: float
+    hops: list[tuple[str, float]]
+    handoffs: int
+    tokens: int
+
+    @property
+    def correct(self) -> bool:
+        return self.answered_by == self.expected
+
+
+@dataclass
+class SetResult:
+    name: str
+    mode: str
+    coordinator: str
+    results: list[QueryResult] = field(default_factory=list)
+
+    @property
+    def correct(self) -> int:
+        return sum(result.correct for result in self.results)
+
+    @property
+    def routed(self) -> int:
+        """Queries the local router sent straight to a specialist."""
+        return sum(result.routed_to != self.coordinator for result in self.results)
+
+    def hop_seconds(self, coordinator: bool) -> list[float]:
+        return [
+            seconds for result in self.results for name, seconds in result.hops if (name == self.coordinator) == coordinator
+        ]
+
+
+async def run_set(name: str, mode: str, coordinator: Agent, queries: list[tuple[str, str]], router: LocalRouter | None) -> SetResult:
+    outcome = SetResult(name, mode, coordinator.name)
+    for query, label in queries:
+        # "Task Coordinator (will route to multiple specialists)" means the coordinator answers
+        expected = label.split(" (")[0]
+        timer = HopTimer()
+        start = time.perf_counter()
+        first = router.agent_for(query, coordinator) if router is not None else coordinator
+        result = await Runner.run(first, query, hooks=timer)
+        outcome.results.append(
+            QueryResult(
+                query=query,
+                expected=expected,
+                answered_by=result.last_agent.name,
+                routed_to=first.name,
+                seconds=time.perf_counter() - start,
+                hops=timer.hops,
+                handoffs=sum(1 for item in result.new_items if item.type == "handoff_output_item"),
+                tokens=result.context_wrapper.usage.total_tokens,
+            )
+        )
+    return outcome
+
+
+def _ms(values: list[float]) -> str:
+    return f"{statistics.mean(values) * 1000:6.1f}ms" if values else f"{'-':>8}"
+
+
+def print_set(outcome: SetResult) -> None:
+    results = outcome.results
+    counts = f"{outcome.correct:>3}/{len(results):<3} {outcome.routed:>3}/{len(results):<3}"
+    print(
+        f"  {outcome.name:<22} {outcome.mode:<12} {counts}"
+        f" {_ms([result.seconds for result in results])}"
+        f" {_ms(outcome.hop_seconds(True))} {_ms(outcome.hop_seconds(False))}"
+        f" {statistics.mean(len(result.hops) for result in results):>5.2f}"
+        f" {statistics.mean(result.handoffs for result in results):>5.2f}"
+        f" {statistics.mean(result.tokens for result in results):>7.0f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per stand-in model call")
+    parser.add_argument("--max-hop-overhead-ms", type=float, default=5.0, help="fail if a hop takes longer than the model call by more")
+    args = parser.parse_args()
+    set_tracing_disabled(True)
+
+    demo_queries = [(scenario["query"], scenario["expected_agent"]) for scenario in demo.DEMO_SCENARIOS]
+    educational_queries = [(item["question"], item["expected_agent"]) for item in educational.EDUCATIONAL_QUESTIONS]
+    # The coordinators decide from their handoff descriptions and instructions; the labels only score the result
+    main_coordinator = demo.create_agents(DescriptionRoutingModel(args.latency))[0]
+    educational_coordinator, professional_coordinator = educational.create_coordinator_agents(DescriptionRoutingModel(args.latency))
+    # (name, coordinator, routing hints, queries, held out)
+    sets = [
+        ("demo", main_coordinator, demo.ROUTING_HINTS, demo_queries, False),
+        ("demo held-out", main_coordinator, demo.ROUTING_HINTS, HELD_OUT_DEMO, True),
+        ("demo cross-domain", main_coordinator, demo.ROUTING_HINTS, CROSS_DOMAIN_DEMO, False),
+        ("educational", educational_coordinator, educational.ROUTING_HINTS, educational_queries, False),
+        ("educational held-out", educational_coordinator, educational.ROUTING_HINTS, HELD_OUT_EDUCATIONAL, True),
+        ("professional held-out", professional_coordinator, None, HELD_OUT_PROFESSIONAL, True),
+    ]
+
+    await run_set("warm-up", "coordinator", main_coordinator, demo_queries[:1], None)
+    print(f"🎯 Routing regression baseline and latency ({args.latency * 1000:.0f} ms per model call)")
+    print("=" * 94)
+    print(
+        f"  {'set':<22} {'mode':<12} {'labels':>7} {'local':>7} {'query':>8} {'coord hop':>8} {'spec hop':>8}"
+        f" {'hops':>5} {'hands':>5} {'tokens':>7}"
+    )
+    outcomes = []
+    for name, coordinator, hints, queries, _ in sets:
+        router = LocalRouter.from_coordinator(coordinator, hints=hints)
+        for mode, mode_router in (("coordinator", None), ("local router", router)):
+            outcome = await run_set(name, mode, coordinator, queries, mode_router)
+            outcomes.append(outcome)
+            print_set(outcome)
+
+    wrong = [(outcome, result) for outcome in outcomes for result in outcome.results if not result.correct]
+    if wrong:
+        print("-" * 94)
+        for outcome, result in wrong:
+            print(f"  ✗ [{outcome.name}, {outcome.mode}] {result.query[:40]!r}: {result.answered_by}, expected {result.expected}")
+
+    print("-" * 94)
+    failed = False
+    for name, coordinator, hints, queries, held_out in sets:
+        if not held_out:
+            continue
+        shared, hint_terms, phrases = index_overlap(queries, coordinator, hints)
+        if hint_terms or phrases:
+            print(f"❌ {name} is not held out: {', '.join(sorted(hint_terms | phrases))} come from the router's text")
+            failed = True
+        else:
+            print(f"  {name} shares {len(shared)} words with the router's text: {', '.join(sorted(shared)) or '-'}")
+    moved = [
+        (outcome, BASELINE.get((outcome.name, outcome.mode)))
+        for outcome in outcomes
+        if BASELINE.get((outcome.name, outcome.mode)) != (outcome.correct, outcome.routed)
+    ]
+    for outcome, pinned in moved:
+        expected = f"{pinned[0]} labels met, {pinned[1]} routed locally" if pinned else "no baseline"
+        print(
+            f"❌ [{outcome.name}, {outcome.mode}] {outcome.correct} labels met, {outcome.routed} routed locally;"
+            f" baseline {expected}"
+        )
+        failed = True
+    if not moved:
+        print(f"✅ All {len(outcomes)} set/mode counts match the baseline")
+    # Deferred queries are the coordinator's to get right; a local route is the router's own decision
+    misrouted = [
+        result
+        for outcome in outcomes
+        for result in outcome.results
+        if outcome.mode == "local router" and result.routed_to != outcome.coordinator and not result.correct
+    ]
+    if misrouted:
+        print(f"❌ The local router sends {len(misrouted)} queries straight to the wrong specialist")
+        failed = True
+    else:
+        print("✅ The local router sends no query straight to the wrong specialist")
+    hops = [seconds for outcome in outcomes for result in outcome.results for _, seconds in result.hops]
+    overhead_ms = (statistics.mean(hops) - args.latency) * 1000
+    if overhead_ms > args.max_hop_overhead_ms:
+        print(f"❌ Each hop takes {overhead_ms:.2f} ms beyond the model call (budget {args.max_hop_overhead_ms:.1f} ms)")
+        failed = True
+    else:
+        print(f"✅ Each hop takes {overhead_ms:.2f} ms beyond the model call (budget {args.max_hop_overhead_ms:.1f} ms)")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+"""
+Speculative specialists vs plain coordinator handoff: time to first token and token cost.
+
+Both demo sets run against a labelled, streaming stand-in model: once through
+the coordinator alone (handoff round trip, then the specialist's), then with
+``SpeculativeRunner`` starting the top one and two specialists alongside the
+coordinator, and finally with a small wasted-token budget to show
+speculation switching itself off. Extra tokens are the tokens of every run
+started for a query compared to the plain handoff.
+
+Run from the hello_agent directory:
+    uv run python -m benchmarks.bench_speculative
+"""
+
+import asyncio
+import statistics
+import time
+
+from agents import Agent, Runner, set_tracing_disabled
+
+import agent as educational
+import main as demo
+from benchmarks.routing_model import RoutingModel
+from router import LocalRouter
+from speculative import SpeculativeRunner
+
+LATENCY = 0.3
+CHUNK_DELAY = 0.02
+SMALL_BUDGET = 300
+
+
+async def plain_run(coordinator: Agent, query: str) -> tuple[float, int]:
+    """Time to first answer token and total tokens of a plain streamed coordinator run."""
+    start = time.perf_counter()
+    first_token = None
+    result = Runner.run_streamed(coordinator, query)
+    async for event in result.stream_events():
+        if first_token is None and event.type == "raw_response_event" and event.data.type == "response.output_text.delta":
+            first_token = time.perf_counter() - start
+    return first_token or time.perf_counter() - start, result.context_wrapper.usage.total_tokens
+
+
+async def run_set(title: str, coordinator: Agent, queries: list[str], hints: dict[str, str]) -> None:
+    router = LocalRouter.from_coordinator(coordinator, hints=hints)
+    print(f"\n{title}: {len(queries)} queries, {LATENCY * 1000:.0f} ms to first token per model call")
+    print("-" * 78)
+    print(f"  {'mode':<28} {'TTFT mean':>10} {'TTFT max':>9} {'tokens':>7} {'extra':>7} {'kept':>6}")
+
+    await plain_run(coordinator, queries[0])  # warm-up
+    plain = [await plain_run(coordinator, query) for query in queries]
+    plain_ttft = [ttft for ttft, _ in plain]
+    plain_tokens = sum(tokens for _, tokens in plain)
+    print(
+        f"  {'coordinator handoff':<28} {statistics.mean(plain_ttft) * 1000:>8.0f}ms {max(plain_ttft) * 1000:>7.0f}ms"
+        f" {plain_tokens:>7} {'':>7} {'':>6}"
+    )
+
+    for label, candidates, budget in (
+        ("speculative, top 1", 1, None),
+        ("speculative, top 2", 2, None),
+        (f"top 2, budget {SMALL_BUDGET} tokens", 2, SMALL_BUDGET),
+    ):
+        speculative = SpeculativeRunner(coordinator, router, candidates=candidates)
+        if budget is not None:
+            speculative.token_budget = budget
+        outcomes = [await speculative.run(query) for query in queries]
+        ttft = [outcome.first_token for outcome in outcomes]
+        tokens = sum(outcome.total_tokens for outcome in outcomes)
+        speculated = sum(1 for outcome in outcomes if outcome.speculated)
+        extra = (tokens - plain_tokens) / plain_tokens * 100
+        print(
+            f"  {label:<28} {statistics.mean(ttft) * 1000:>8.0f}ms {max(ttft) * 1000:>7.0f}ms"
+            f" {tokens:>7} {extra:>+6.0f}% {speculative.hits:>2}/{speculated:<3}"
+        )
+
+
+async def main() -> None:
+    set_tracing_disabled(True)
+    print("⚡ Speculative specialists vs coordinator handoff")
+    print("=" * 78)
+
+    labels = {scenario["query"]: scenario["expected_agent"] for scenario in demo.DEMO_SCENARIOS}
+    coordinator = demo.create_agents(RoutingModel(labels, LATENCY, CHUNK_DELAY))[0]
+    await run_set("Demo scenarios (main.py)", coordinator, list(labels), demo.ROUTING_HINTS)
+
+    labels = {item["question"]: item["expected_agent"] for item in educational.EDUCATIONAL_QUESTIONS}
+    coordinator = educational.create_coordinator_agents(RoutingModel(labels, LATENCY, CHUNK_DELAY))[0]
+    await run_set("Educational questions (agent.py)", coordinator, list(labels), educational.ROUTING_HINTS)
+    print("\n  kept = speculative runs used / queries with speculative runs")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
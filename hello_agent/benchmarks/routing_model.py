@@ -0,0 +1,285 @@
+"""
+A labelled stand-in for the LLM, for offline routing benchmarks.
+
+``RoutingModel`` knows which specialist should handle each benchmark query
+(the labels of ``DEMO_SCENARIOS`` / ``EDUCATIONAL_QUESTIONS``). Called as a
+coordinator (an agent with handoffs) it hands off to the labelled specialist,
+or answers itself when the label names no handoff target; called as a
+specialist it answers; called with an output schema (a planner) it returns
+the structured output given for the query in ``plans``. Each call waits
+``latency`` seconds (or the query's entry in ``latencies``) before its first
+token, to stand in for a model round trip, then produces the answer in chunks
+``chunk_delay`` seconds apart. Streamed runs get the answer as text deltas,
+so time to first token can be measured. Round trips and (estimated) token
+usage are counted so benchmarks can compare routing strategies.
+
+``DescriptionRoutingModel`` is the same stand-in without labels: as a
+coordinator it picks the handoff from the handoff tools' descriptions and its
+instructions, so routing accuracy can be measured against the labels.
+"""
+
+import asyncio
+import json
+import math
+from typing import Any, AsyncIterator
+
+from agents import (
+    AgentOutputSchemaBase,
+    Handoff,
+    ModelResponse,
+    ModelSettings,
+    ModelTracing,
+    Tool,
+    TResponseInputItem,
+    Usage,
+)
+from agents.models.interface import Model
+from openai.types.responses import (
+    Response,
+    ResponseCompletedEvent,
+    ResponseFunctionToolCall,
+    ResponseOutputItemAddedEvent,
+    ResponseOutputItemDoneEvent,
+    ResponseOutputMessage,
+    ResponseOutputText,
+    ResponseTextDeltaEvent,
+    ResponseUsage,
+)
+from openai.types.responses.response_usage import InputTokensDetails, OutputTokensDetails
+
+from router import tokenize
+
+CHUNK_SIZE = 8
+
+
+def _estimate_tokens(value: Any) -> int:
+    return max(1, len(value if isinstance(value, str) else json.dumps(value, default=str)) // 4)
+
+
+def user_query(input: str | list[Any]) -> str:
+    """The first user message of a run's input."""
+    if isinstance(input, str):
+        return input
+    for item in input:
+        if isinstance(item, dict) and item.get("role") == "user":
+            content = item.get("content")
+            return content if isinstance(content, str) else " ".join(part.get("text", "") for part in content or [])
+    return ""
+
+
+class RoutingModel(Model):
+    """Hands each query off to its labelled specialist, then answers as that specialist."""
+
+    def __init__(
+        self,
+        labels: dict[str, str],
+        latency: float = 0.3,
+        chunk_delay: float = 0.0,
+        plans: dict[str, Any] | None = None,
+        latencies: dict[str, float] | None = None,
+    ):
+        """
+        Args:
+            labels: Query -> name of the agent that should answer it.
+            latency: Seconds before each model call's first token.
+            chunk_delay: Seconds between chunks of an answer.
+            plans: Query -> structured output (JSON-serializable) for agents with an output type.
+            latencies: Query -> seconds before the first token, overriding ``latency``.
+        """
+        self.labels = labels
+        self.latency = latency
+        self.chunk_delay = chunk_delay
+        self.plans = plans or {}
+        self.latencies = latencies or {}
+        self.round_trips = 0
+        self.handoffs = 0
+
+    def _target(self, query: str, system_instructions: str | None, handoffs: list[Handoff]) -> Handoff | None:
+        """The handoff this call takes, or None to answer."""
+        return next((handoff for handoff in handoffs if handoff.agent_name == self.labels.get(query)), None)
+
+    def _output(
+        self,
+        system_instructions: str | None,
+        input: str | list[Any],
+        output_schema: AgentOutputSchemaBase | None,
+        handoffs: list[Handoff],
+    ) -> tuple[list[Any], int, int, float]:
+        """This call's output items, estimated (input, output) tokens and latency."""
+        self.round_trips += 1
+        query = user_query(input)
+        target = self._target(query, system_instructions, handoffs)
+        text = json.dumps(self.plans.get(query, {})) if output_schema is not None else f"Answer to: {query}"
+        output: list[Any]
+        if target is not None:
+            self.handoffs += 1
+            output = [
+                ResponseFunctionToolCall(
+                    id=f"fc_{self.round_trips}",
+                    call_id=f"call_{self.round_trips}",
+                    name=target.tool_name,
+                    arguments="{}",
+                    type="function_call",
+                )
+            ]
+        else:
+            output = [
+                ResponseOutputMessage(
+                    id=f"msg_{self.round_trips}",
+                    content=[ResponseOutputText(text=text, type="output_text", annotations=[])],
+                    role="assistant",
+                    status="completed",
+                    type="message",
+                )
+            ]
+        input_tokens = _estimate_tokens(input) + _estimate_tokens(system_instructions or "")
+        output_tokens = sum(_estimate_tokens(item.model_dump()) for item in output)
+        return output, input_tokens, output_tokens, self.latencies.get(query, self.latency)
+
+    def _chunks(self, item: Any) -> list[str]:
+        if item.type != "message":
+            return []
+        text = item.content[0].text
+        return [text[i:i + CHUNK_SIZE] for i in range(0, len(text), CHUNK_SIZE)]
+
+    async def get_response(
+        self,
+        system_instructions: str | None,
+        input: str | list[TResponseInputItem],
+        model_settings: ModelSettings,
+        tools: list[Tool],
+        output_schema: AgentOutputSchemaBase | None,
+        handoffs: list[Handoff],
+        tracing: ModelTracing,
+        *,
+        previous_response_id: str | None = None,
+        conversation_id: str | None = None,
+        prompt: Any = None,
+    ) -> ModelResponse:
+        output, input_tokens, output_tokens, latency = self._output(system_instructions, input, output_schema, handoffs)
+        await asyncio.sleep(latency + self.chunk_delay * max(0, len(self._chunks(output[0])) - 1))
+        usage = Usage(requests=1, input_tokens=input_tokens, output_tokens=output_tokens, total_tokens=input_tokens + output_tokens)
+        return ModelResponse(output=output, usage=usage, response_id=None)
+
+    async def stream_response(
+        self,
+        system_instructions: str | None,
+        input: str | list[TResponseInputItem],
+        model_settings: ModelSettings,
+        tools: list[Tool],
+        output_schema: AgentOutputSchemaBase | None,
+        handoffs: list[Handoff],
+        tracing: ModelTracing,
+        *,
+        previous_response_id: str | None = None,
+        conversation_id: str | None = None,
+        prompt: Any = None,
+    ) -> AsyncIterator[Any]:
+        output, input_tokens, output_tokens, latency = self._output(system_instructions, input, output_schema, handoffs)
+        item = output[0]
+        sequence = iter(range(1_000_000))
+        await asyncio.sleep(latency)
+        if item.type == "message":
+            empty = item.model_copy(update={"content": [], "status": "in_progress"})
+            yield ResponseOutputItemAddedEvent(
+                item=empty, output_index=0, sequence_number=next(sequence), type="response.output_item.added"
+            )
+            for i, chunk in enumerate(self._chunks(item)):
+                if i:
+                    await asyncio.sleep(self.chunk_delay)
+                yield ResponseTextDeltaEvent(
+                    content_index=0,
+                    delta=chunk,
+                    item_id=item.id,
+                    logprobs=[],
+                    output_index=0,
+                    sequence_number=next(sequence),
+                    type="response.output_text.delta",
+                )
+        yield ResponseOutputItemDoneEvent(
+            item=item, output_index=0, sequence_number=next(sequence), type="response.output_item.done"
+        )
+        usage = ResponseUsage(
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_tokens=input_tokens + output_tokens,
+            input_tokens_details=InputTokensDetails(cached_tokens=0),
+            output_tokens_details=OutputTokensDetails(reasoning_tokens=0),
+        )
+        response = Response(
+            id=f"resp_{self.round_trips}",
+            created_at=0,
+            model="routing-mock",
+            object="response",
+            output=output,
+            tool_choice="auto",
+            tools=[],
+            parallel_tool_calls=True,
+            usage=usage,
+        )
+        yield ResponseCompletedEvent(response=response, sequence_number=next(sequence), type="response.completed")
+
+
+# Background knowledge for DescriptionRoutingModel: words of a field -> words a model knows belong to it.
+# Keyed by field, never by agent, so whether a field reaches a specialist depends only on the handoff
+# tools and the coordinator's instructions. It shares words with the benchmark queries (it has to, to
+# stand in for a model's knowledge), so the labels it meets are a pinned baseline (BASELINE in bench_routing), not an accuracy.
+TOPIC_WORDS = {
+    "mathematics mathematical calculation": """algebra arithmetic calculus geometry equation derivative integral
+        angle triangle circle area radius probability number fraction percent sum solve proof theorem formula""",
+    "history historical": """war empire republic revolution dynasty ancient medieval century king emperor
+        civilization treaty colonial independence reign""",
+    "science scientific experiment": """physics chemistry biology atom molecule cell energy light gravity star
+        planet orbit photosynthesis evolution climate gene element reaction force""",
+    "literature literary writing": """novel poem poetry author character theme symbolism plot tragedy comedy
+        essay narrative metaphor""",
+    "creative artistic innovative": "story tale lyrics song slogan brand logo design campaign fiction imagine",
+    "business strategy": "market revenue price customer profit sales competitor growth cost budget investment",
+    "software design architecture": "microservices monolith api database scalable service system component cloud",
+    "programming engineering technical": "code bug python javascript sql docker container server network deploy compile",
+    "data analysis machine learning": "dataset statistics predict model regression classification cluster trend",
+    "project planning management": "deadline schedule milestone team launch timeline scope risk sprint stakeholder",
+    "research information": "study evidence source cause effect fact summarize overview report",
+}
+
+
+class DescriptionRoutingModel(RoutingModel):
+    """Routes like a coordinator that only reads the handoff tools and its instructions, not the labels.
+
+    A real coordinator decides from what it is shown: each handoff tool's name
+    and description (the target's ``handoff_description``) and its own system
+    instructions, read with what it knows about words. This stand-in expands
+    the query with the fields of ``TOPIC_WORDS`` it touches, scores it against
+    the tool name and description plus every instruction line that names the
+    target agent, weighting each shared term by how few targets use it, and
+    hands off to the clear winner; with no shared term or a tie it answers
+    itself. Rewording a ``handoff_description`` or the coordinator's
+    instructions therefore changes where queries go, which the labels alone
+    never would. It is a crude reader, so its accuracy is a regression
+    signal, not an estimate of the real model's.
+    """
+
+    def __init__(self, latency: float = 0.3, **kwargs: Any):
+        super().__init__({}, latency, **kwargs)
+        self.topics = [(set(tokenize(field)), set(tokenize(words))) for field, words in TOPIC_WORDS.items()]
+
+    @staticmethod
+    def _handoff_text(handoff: Handoff, system_instructions: str | None) -> str:
+        named = [line for line in (system_instructions or "").splitlines() if handoff.agent_name.lower() in line.lower()]
+        return " ".join([handoff.tool_name.replace("_", " "), handoff.tool_description or "", *named])
+
+    def _target(self, query: str, system_instructions: str | None, handoffs: list[Handoff]) -> Handoff | None:
+        if not handoffs:
+            return None
+        terms = set(tokenize(query))
+        for field, words in self.topics:
+            if terms & words:
+                terms |= field
+        profiles = [set(tokenize(self._handoff_text(handoff, system_instructions))) for handoff in handoffs]
+        # Terms every target shares (e.g. "transfer") weigh nothing
+        weights = {term: math.log(len(profiles) / df) for term in terms if (df := sum(term in profile for profile in profiles))}
+        scores = sorted(((sum(weights.get(term, 0.0) for term in profile), i) for i, profile in enumerate(profiles)), reverse=True)
+        best, runner_up = scores[0], scores[1] if len(scores) > 1 else (0.0, -1)
+        if best[0] <= 0 or best[0] == runner_up[0]:
+            return None
+        return handoffs[best[1]]
@@ -0,0 +1,81 @@
+"""
+Held-out routing queries for the routing benchmarks.
+
+The labelled demo sets (``DEMO_SCENARIOS``, ``EDUCATIONAL_QUESTIONS``) are
+the queries the routing hints were written next to. These queries are not:
+they are questions people ask, written without reading the specialists'
+names, descriptions, instructions or hints. ``index_overlap`` checks them
+against all of that text, as the router indexes it: a held-out query may not
+use a hint word or copy a two-word phrase, and the single words it shares
+with the instructions are reported. Most of them share no words, and the
+router has to defer them to the coordinator; sending one to the wrong
+specialist is a misroute.
+
+``CROSS_DOMAIN_DEMO`` queries use one specialist's words for another's task
+("a marketing slogan for my software startup"). They do use hint words; the
+router has to defer them, or send them where the label says.
+"""
+
+from agents import Agent
+
+from router import profile_text, tokenize
+
+# (query, the agent that should answer it)
+HELD_OUT_DEMO = [
+    ("How do vaccines work?", "Research Specialist"),
+    ("What caused the 2008 financial crisis?", "Research Specialist"),
+    ("Is intermittent fasting good for longevity? Summarize what studies say", "Research Specialist"),
+    ("What is the sum of the interior angles of a hexagon?", "Mathematics Expert"),
+    ("Find the derivative of x squared times sine x", "Mathematics Expert"),
+    ("How many ways can 5 people sit around a round table?", "Mathematics Expert"),
+    ("Write song lyrics about a summer road trip", "Creative Director"),
+    ("What should I call my new bakery?", "Creative Director"),
+    ("Draft a bedtime tale about a brave turtle", "Creative Director"),
+    ("Explain how TCP works", "Technical Specialist"),
+    ("Why does my Docker container exit immediately?", "Technical Specialist"),
+    ("My SQL query is slow on a large table, how can I speed it up?", "Technical Specialist"),
+]
+CROSS_DOMAIN_DEMO = [
+    ("Create a marketing slogan for my software startup", "Creative Director"),
+    ("What is the probability that my code has a bug?", "Mathematics Expert"),
+]
+HELD_OUT_EDUCATIONAL = [
+    ("How do I simplify algebraic expressions?", "Mathematics Tutor"),
+    ("Calculate the area of a circle with radius 4", "Mathematics Tutor"),
+    ("What led to the fall of the Berlin Wall?", "History Tutor"),
+    ("Who was Genghis Khan?", "History Tutor"),
+    ("Why did the Roman Republic become an empire?", "History Tutor"),
+    ("Why is the sky blue?", "Science Tutor"),
+    ("What happens inside a star when it runs out of fuel?", "Science Tutor"),
+    ("How should I interpret the symbolism in The Great Gatsby?", "Literature Tutor"),
+    ("Why does Romeo and Juliet end in tragedy?", "Literature Tutor"),
+]
+HELD_OUT_PROFESSIONAL = [
+    ("Estimate the revenue impact of raising our subscription price by 10%", "Business Analyst"),
+    ("Should our app use microservices or a monolith?", "Software Architect"),
+    ("Which customers are likely to cancel next month, based on their usage history?", "Data Scientist"),
+    ("Our launch keeps slipping; how do we get the team back on track for the deadline?", "Project Manager"),
+]
+
+
+def index_overlap(
+    queries: list[tuple[str, str]], coordinator: Agent, hints: dict[str, str] | None
+) -> tuple[set[str], set[str], set[str]]:
+    """
+    What the queries share with the text the router indexes for the coordinator's specialists.
+
+    Returns:
+        The shared terms, the hint terms among them and the two-term phrases the queries
+        copy; a held-out set has no hint terms and no phrases.
+    """
+    documents = [tokenize(profile_text(agent, hints)) for agent in coordinator.handoffs if isinstance(agent, Agent)]
+    hint_terms = {term for text in (hints or {}).values() for term in tokenize(text)}
+    index_terms = {term for terms in documents for term in terms}
+    index_phrases = {pair for terms in documents for pair in zip(terms, terms[1:])}
+    shared: set[str] = set()
+    phrases: set[str] = set()
+    for query, _ in queries:
+        terms = tokenize(query)
+        shared.update(term for term in terms if term in index_terms)
+        phrases.update(" ".join(pair) for pair in zip(terms, terms[1:]) if pair in index_phrases)
+    return shared, shared & hint_terms, phrases
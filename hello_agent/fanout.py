@@ -0,0 +1,204 @@
+"""
+Fan-out and Merge
+=================
+
+With handoffs, exactly one specialist answers, even when a request spans
+several domains ("plan the technical implementation, the educational content
+and the user engagement features"). ``FanoutOrchestrator`` instead has a
+planner agent (structured output) split the request into self-contained
+sub-tasks, one per specialist needed, runs those specialists concurrently
+with ``Runner.run``, and has a merger agent combine their answers. Wall time
+is the planner, the slowest branch and the merge, not the sum of the
+branches.
+
+Every branch has its own timeout. A branch that times out or fails is
+reported as missing and the merge goes ahead with the answers that did
+arrive. A plan with a single sub-task skips the merge, and an empty plan
+falls back to the coordinator.
+
+    fanout = FanoutOrchestrator.from_coordinator(coordinator, branch_timeout=60)
+    result = await fanout.run(query)
+    print(result.final_output)
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel
+
+from agents import Agent, Model, Runner
+
+DEFAULT_BRANCH_TIMEOUT = 60.0
+DEFAULT_MAX_BRANCHES = 4
+
+
+class SubTask(BaseModel):
+    specialist: str
+    task: str
+
+
+class FanoutPlan(BaseModel):
+    subtasks: list[SubTask]
+
+
+@dataclass
+class BranchResult:
+    """One specialist's part of the answer."""
+
+    specialist: str
+    task: str
+    output: str | None
+    error: str | None
+    seconds: float
+    tokens: int
+
+
+@dataclass
+class FanoutResult:
+    """The merged answer and how each branch went."""
+
+    final_output: str
+    plan: FanoutPlan
+    branches: list[BranchResult]
+    seconds: float
+    tokens: int
+    # The agent that answered instead when there was nothing to fan out
+    fallback: str | None = None
+
+    @property
+    def partial(self) -> bool:
+        return any(branch.error for branch in self.branches)
+
+    def summary(self) -> str:
+        if not self.branches:
+            return f"Nothing to fan out; answered by {self.fallback}"
+        answered = sum(1 for branch in self.branches if branch.error is None)
+        names = ", ".join(branch.specialist for branch in self.branches)
+        return f"Fanned out to {names} ({answered}/{len(self.branches)} answered, {self.seconds:.1f} s)"
+
+
+class FanoutOrchestrator:
+    """Plans sub-tasks, runs the specialists for them concurrently, and merges their answers."""
+
+    def __init__(
+        self,
+        specialists: list[Agent],
+        model: str | Model | None = None,
+        fallback: Agent | None = None,
+        branch_timeout: float | None = DEFAULT_BRANCH_TIMEOUT,
+        max_branches: int = DEFAULT_MAX_BRANCHES,
+    ):
+        """
+        Args:
+            specialists: The agents sub-tasks can be given to.
+            model: Model of the planner and merger agents.
+            fallback: Agent that answers when the planner finds nothing to fan out.
+            branch_timeout: Seconds each specialist gets before its part is left out.
+            max_branches: Most sub-tasks the planner may create.
+        """
+        self.specialists = {agent.name: agent for agent in specialists}
+        self.fallback = fallback
+        self.branch_timeout = branch_timeout
+        self.max_branches = max_branches
+        roster = "\n".join(f"- {agent.name}: {agent.handoff_description or ''}" for agent in specialists)
+        self.planner = Agent(
+            name="Fan-out Planner",
+            model=model,
+            instructions=f"""
+            You split a user's request into independent sub-tasks for specialist agents.
+            Available specialists:
+            {roster}
+
+            Create one sub-task per specialist the request actually needs (at most {max_branches}),
+            using the specialist's exact name. Each task must be self-contained: the specialist sees
+            only its task, not the original request or the other tasks.
+            If a single specialist can handle the whole request, create a single sub-task.
+            """,
+            output_type=FanoutPlan,
+        )
+        self.merger = Agent(
+            name="Answer Merger",
+            model=model,
+            instructions="""
+            You combine the answers of several specialists into one coherent response to the user's
+            original request. Keep every specialist's substance, remove repetition, and organize the
+            result by the parts of the request. If a specialist's answer is missing, say which part
+            is not covered instead of making it up.
+            """,
+        )
+
+    @classmethod
+    def from_coordinator(cls, coordinator: Agent, **kwargs: Any) -> "FanoutOrchestrator":
+        """An orchestrator over the coordinator's handoff targets, using the coordinator's model."""
+        specialists = [handoff for handoff in coordinator.handoffs if isinstance(handoff, Agent)]
+        return cls(specialists, model=coordinator.model, fallback=coordinator, **kwargs)
+
+    @classmethod
+    def from_env(cls, coordinator: Agent) -> "FanoutOrchestrator | None":
+        """An orchestrator if ``FANOUT=1``, with ``FANOUT_BRANCH_TIMEOUT`` seconds per branch."""
+        if os.getenv("FANOUT", "0") != "1":
+            return None
+        return cls.from_coordinator(
+            coordinator, branch_timeout=float(os.getenv("FANOUT_BRANCH_TIMEOUT", DEFAULT_BRANCH_TIMEOUT))
+        )
+
+    async def plan(self, query: str) -> tuple[FanoutPlan, int]:
+        """The planner's sub-tasks for ``query`` (unknown specialists and extra tasks dropped), and its tokens."""
+        result = await Runner.run(self.planner, query)
+        plan = result.final_output_as(FanoutPlan)
+        subtasks = [subtask for subtask in plan.subtasks if subtask.specialist in self.specialists]
+        return FanoutPlan(subtasks=subtasks[: self.max_branches]), result.context_wrapper.usage.total_tokens
+
+    async def run_branch(self, subtask: SubTask) -> BranchResult:
+        """Run one sub-task on its specialist; a timeout or error becomes a missing part, not an exception."""
+        start = time.perf_counter()
+        output = error = None
+        tokens = 0
+        try:
+            result = await asyncio.wait_for(Runner.run(self.specialists[subtask.specialist], subtask.task), self.branch_timeout)
+        except asyncio.TimeoutError:
+            error = f"timed out after {self.branch_timeout:g} s"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        else:
+            output = str(result.final_output)
+            tokens = result.context_wrapper.usage.total_tokens
+        return BranchResult(subtask.specialist, subtask.task, output, error, time.perf_counter() - start, tokens)
+
+    def merge_input(self, query: str, branches: list[BranchResult]) -> str:
+        parts = [f"Original request: {query}"]
+        for branch in branches:
+            answer = branch.output if branch.error is None else f"(missing: {branch.error})"
+            parts.append(f"## {branch.specialist}\nTask: {branch.task}\n\n{answer}")
+        return "\n\n".join(parts)
+
+    async def run(self, query: str) -> FanoutResult:
+        """Plan, run the branches concurrently, and merge what came back."""
+        start = time.perf_counter()
+        plan, tokens = await self.plan(query)
+        if not plan.subtasks:
+            if self.fallback is None:
+                raise ValueError("The planner found no sub-tasks and there is no fallback agent")
+            result = await Runner.run(self.fallback, query)
+            tokens += result.context_wrapper.usage.total_tokens
+            return FanoutResult(
+                str(result.final_output), plan, [], time.perf_counter() - start, tokens, result.last_agent.name
+            )
+
+        branches = list(await asyncio.gather(*(self.run_branch(subtask) for subtask in plan.subtasks)))
+        tokens += sum(branch.tokens for branch in branches)
+        answered = [branch for branch in branches if branch.error is None]
+        if not answered:
+            final_output = "No specialist answered in time: " + "; ".join(
+                f"{branch.specialist} {branch.error}" for branch in branches
+            )
+        elif len(branches) == 1:
+            final_output = answered[0].output or ""
+        else:
+            merged = await Runner.run(self.merger, self.merge_input(query, branches))
+            tokens += merged.context_wrapper.usage.total_tokens
+            final_output = str(merged.final_output)
+        return FanoutResult(final_output, plan, branches, time.perf_counter() - start, tokens)
@@ -8,8 +8,16 @@ It showcases different specialized agents working together to solve complex prob
 
 import asyncio
 import os
+import time
+from functools import lru_cache
+from typing import Any, Callable
 from dotenv import load_dotenv
-from agents import Agent, AsyncOpenAI, OpenAIChatCompletionsModel, Runner
+from agents import Agent, AsyncOpenAI, Model, OpenAIChatCompletionsModel, Runner
+
+from fanout import FanoutOrchestrator
+from router import LocalRouter, create_router
+from scenarios import ScenarioRecord, demo_concurrency, format_record, format_summary, run_scenarios
+from speculative import SpeculativeRunner
 
 # Load environment variables
 load_dotenv()
@@ -17,30 +25,79 @@ load_dotenv()
 # Configuration
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 
-if not GEMINI_API_KEY:
-    print("❌ Error: GEMINI_API_KEY not found in environment variables.")
-    print("Please create a .env file with your GEMINI_API_KEY")
-    exit(1)
+@lru_cache(maxsize=1)
+def get_llm_model() -> OpenAIChatCompletionsModel:
+    """Build the Gemini client and model on first use (importing this module stays cheap)."""
+    if not GEMINI_API_KEY:
+        print("❌ Error: GEMINI_API_KEY not found in environment variables.")
+        print("Please create a .env file with your GEMINI_API_KEY")
+        exit(1)
+
+    # Initialize OpenAI client for Gemini
+    external_client = AsyncOpenAI(
+        api_key=GEMINI_API_KEY, 
+        base_url="https://generativelanguage.googleapis.com/v1beta/openai/"
+    )
+
+    # Configure the language model
+    return OpenAIChatCompletionsModel(
+        model="gemini-2.0-flash-exp",
+        openai_client=external_client,
+    )
 
-# Initialize OpenAI client for Gemini
-external_client = AsyncOpenAI(
-    api_key=GEMINI_API_KEY, 
-    base_url="https://generativelanguage.googleapis.com/v1beta/openai/"
-)
+# Demo scenarios, labelled with the specialist that should handle each one
+DEMO_SCENARIOS = [
+    {
+        "title": "📊 Mathematical Problem Solving",
+        "query": "Solve this complex equation: 2x³ - 5x² + 3x - 1 = 0. Show all steps and explain the solution method.",
+        "expected_agent": "Mathematics Expert"
+    },
+    {
+        "title": "🔬 Research and Analysis",
+        "query": "Research the impact of artificial intelligence on modern education. Provide a comprehensive analysis with key findings and trends.",
+        "expected_agent": "Research Specialist"
+    },
+    {
+        "title": "💡 Creative Brainstorming",
+        "query": "Help me brainstorm innovative ideas for a sustainable smart city project. Think creatively about technology, environment, and community.",
+        "expected_agent": "Creative Director"
+    },
+    {
+        "title": "💻 Technical Solution",
+        "query": "Design a scalable microservices architecture for an e-commerce platform. Include database design, API structure, and deployment strategy.",
+        "expected_agent": "Technical Specialist"
+    },
+    {
+        "title": "🎯 Complex Multi-Domain Task",
+        "query": "I want to create an educational app that teaches mathematics through gamification. Help me plan the technical implementation, educational content strategy, and user engagement features.",
+        "expected_agent": "Task Coordinator (will route to multiple specialists)"
+    }
+]
 
-# Configure the language model
-llm_model = OpenAIChatCompletionsModel(
-    model="gemini-2.0-flash-exp",
-    openai_client=external_client,
-)
+# Domain keywords that the handoff descriptions and instructions do not mention, for the local router.
+# Kept free of the demo scenarios' own words, so routing them measures the router rather than the hints.
+ROUTING_HINTS = {
+    "Research Specialist": "survey sources evidence history facts compare report review literature investigate overview citation",
+    "Mathematics Expert": "formula number proof theorem arithmetic geometry percentage fraction matrix probability integral",
+    "Creative Director": "slogan name campaign imagine poem brand logo narrative character plot artwork story",
+    "Technical Specialist": "code software server bug python cloud backend frontend network protocol framework compiler",
+}
 
 # Define specialized agents
-def create_agents():
-    """Create and configure specialized agents for different tasks."""
+def create_agents(model: str | Model | None = None) -> tuple[Agent, Agent, Agent, Agent, Agent]:
+    """
+    Create and configure specialized agents for different tasks.
+
+    Args:
+        model: Model shared by every agent; defaults to the Gemini model from get_llm_model().
+    """
+    if model is None:
+        model = get_llm_model()
     
     # Research Agent - Specialized in gathering and analyzing information
     research_agent = Agent(
         name="Research Specialist",
+        model=model,
         instructions="""
         You are a research specialist with expertise in:
         - Gathering and analyzing information from various sources
@@ -56,6 +113,7 @@ def create_agents():
     # Math Agent - Specialized in mathematical problems and calculations
     math_agent = Agent(
         name="Mathematics Expert",
+        model=model,
         instructions="""
         You are a mathematics expert specializing in:
         - Solving complex mathematical problems
@@ -71,6 +129,7 @@ def create_agents():
     # Creative Agent - Specialized in creative tasks and brainstorming
     creative_agent = Agent(
         name="Creative Director",
+        model=model,
         instructions="""
         You are a creative director with expertise in:
         - Creative writing and storytelling
@@ -86,6 +145,7 @@ def create_agents():
     # Technical Agent - Specialized in programming and technical solutions
     technical_agent = Agent(
         name="Technical Specialist",
+        model=model,
         instructions="""
         You are a technical specialist with expertise in:
         - Programming and software development
@@ -101,6 +161,7 @@ def create_agents():
     # Coordinator Agent - Routes tasks to appropriate specialists
     coordinator_agent = Agent(
         name="Task Coordinator",
+        model=model,
         instructions="""
         You are a task coordinator responsible for:
         - Analyzing user requests and determining the best approach
@@ -116,60 +177,83 @@ def create_agents():
     
     return coordinator_agent, research_agent, math_agent, creative_agent, technical_agent
 
-async def run_demo_scenarios():
-    """Run various demo scenarios to showcase the multi-agent system."""
+async def answer_query(
+    query: str,
+    coordinator: Agent,
+    router: LocalRouter | None = None,
+    speculative: SpeculativeRunner | None = None,
+    fanout: FanoutOrchestrator | None = None,
+    log: Callable[[str], None] = print,
+) -> Any:
+    """
+    Run ``query`` on the specialist the local router is sure about, else through the coordinator.
+
+    With ``fanout``, the query is split over several specialists running concurrently instead;
+    with ``speculative``, the likeliest specialists start alongside the coordinator.
+    ``log`` gets the routing notes (default: printed).
+    """
+    agent = router.agent_for(query, coordinator) if router else coordinator
+    if agent is not coordinator:
+        log(f"🧭 Routed locally to {agent.name}")
+        return await Runner.run(agent, query)
+    if fanout:
+        result = await fanout.run(query)
+        log(f"🔀 {result.summary()}")
+        return result
+    if speculative:
+        outcome = await speculative.run(query)
+        log(f"⚡ {outcome.summary()}")
+        return outcome.result
+    return await Runner.run(coordinator, query)
+
+async def run_demo_scenarios(concurrency: int | None = None) -> list[ScenarioRecord]:
+    """
+    Run various demo scenarios to showcase the multi-agent system.
+
+    Args:
+        concurrency: Scenarios run at once; defaults to DEMO_CONCURRENCY (1). Output stays in scenario order.
+    """
     
     coordinator, research, math, creative, technical = create_agents()
+    router = create_router(coordinator, ROUTING_HINTS)
+    speculative = SpeculativeRunner.from_env(coordinator, router, ROUTING_HINTS)
+    fanout = FanoutOrchestrator.from_env(coordinator)
+    concurrency = concurrency or demo_concurrency()
     
     print("🤖 Hello Agent - Multi-Agent AI System Demo")
+    if concurrency > 1:
+        print(f"Running up to {concurrency} scenarios at a time")
     print("=" * 50)
     
-    # Demo scenarios
-    scenarios = [
-        {
-            "title": "📊 Mathematical Problem Solving",
-            "query": "Solve this complex equation: 2x³ - 5x² + 3x - 1 = 0. Show all steps and explain the solution method.",
-            "expected_agent": "Mathematics Expert"
-        },
-        {
-            "title": "🔬 Research and Analysis",
-            "query": "Research the impact of artificial intelligence on modern education. Provide a comprehensive analysis with key findings and trends.",
-            "expected_agent": "Research Specialist"
-        },
-        {
-            "title": "💡 Creative Brainstorming",
-            "query": "Help me brainstorm innovative ideas for a sustainable smart city project. Think creatively about technology, environment, and community.",
-            "expected_agent": "Creative Director"
-        },
-        {
-            "title": "💻 Technical Solution",
-            "query": "Design a scalable microservices architecture for an e-commerce platform. Include database design, API structure, and deployment strategy.",
-            "expected_agent": "Technical Specialist"
-        },
-        {
-            "title": "🎯 Complex Multi-Domain Task",
-            "query": "I want to create an educational app that teaches mathematics through gamification. Help me plan the technical implementation, educational content strategy, and user engagement features.",
-            "expected_agent": "Task Coordinator (will route to multiple specialists)"
-        }
-    ]
+    async def answer(query: str, log: Callable[[str], None]) -> Any:
+        return await answer_query(query, coordinator, router, speculative, fanout, log)
     
-    for i, scenario in enumerate(scenarios, 1):
-        print(f"\n{i}. {scenario['title']}")
+    def show(record: ScenarioRecord) -> None:
+        scenario = DEMO_SCENARIOS[record.index]
+        print(f"\n{record.index + 1}. {scenario['title']}")
         print(f"Query: {scenario['query']}")
         print(f"Expected Agent: {scenario['expected_agent']}")
         print("-" * 50)
-        
-        try:
-            result = await Runner.run(coordinator, scenario['query'])
-            print(f"🤖 Agent Response:\n{result.final_output}")
-        except Exception as e:
-            print(f"❌ Error: {str(e)}")
-        
+        for line in record.log:
+            print(line)
+        if record.error:
+            print(f"❌ Error: {record.error}")
+        else:
+            print(f"🤖 Agent Response:\n{record.output}")
+        print(f"📊 {format_record(record)}")
         print("\n" + "="*50)
+    
+    start = time.perf_counter()
+    records = await run_scenarios([scenario['query'] for scenario in DEMO_SCENARIOS], answer, concurrency, show)
+    print(format_summary(records, time.perf_counter() - start))
+    return records
 
-async def interactive_mode():
+async def interactive_mode() -> None:
     """Run the system in interactive mode for user queries."""
     coordinator, _, _, _, _ = create_agents()
+    router = create_router(coordinator, ROUTING_HINTS)
+    speculative = SpeculativeRunner.from_env(coordinator, router, ROUTING_HINTS)
+    fanout = FanoutOrchestrator.from_env(coordinator)
     
     print("\n🎮 Interactive Mode")
     print("Ask me anything! Type 'quit' to exit.")
@@ -187,7 +271,7 @@ async def interactive_mode():
                 continue
                 
             print("🤖 Processing...")
-            result = await Runner.run(coordinator, user_input)
+            result = await answer_query(user_input, coordinator, router, speculative, fanout)
             print(f"\n🤖 Response:\n{result.final_output}")
             
         except KeyboardInterrupt:
@@ -196,7 +280,7 @@ async def interactive_mode():
         except Exception as e:
             print(f"❌ Error: {str(e)}")
 
-async def main():
+async def main() -> None:
     """Main function to run the demo."""
     print("🚀 Starting Hello Agent Demo...")
     
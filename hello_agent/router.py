@@ -0,0 +1,171 @@
+"""
+Local Pre-Router
+================
+
+Every query normally goes to the coordinator model first, just so it can pick
+a handoff target: a full model round trip before any useful work starts.
+``LocalRouter`` makes that choice locally for obvious queries. It builds a
+TF-IDF profile of each specialist from its name, ``handoff_description``,
+instructions and optional keyword hints, scores the query against every
+profile by cosine similarity, and routes straight to the best specialist only
+when it is clearly ahead and shares at least ``min_terms`` domain terms with
+the query; anything ambiguous (or spanning several domains) still goes to the
+coordinator. Instruction words every domain uses ("explain", "step by step",
+"how does it work") are ignored, so they never decide a route on their own.
+Set ``LOCAL_ROUTER=0`` to always use the coordinator.
+
+    router = LocalRouter.from_coordinator(coordinator, hints=ROUTING_HINTS)
+    result = await Runner.run(router.agent_for(query, coordinator), query)
+"""
+
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from agents import Agent
+
+# Minimum cosine similarity of the best specialist
+DEFAULT_MIN_SCORE = 0.12
+# Minimum ratio between the best and the second-best score; the specialists cannot hand a
+# query back, so a query that also reads like another domain goes to the coordinator
+DEFAULT_MIN_MARGIN = 2.0
+# Minimum number of distinct query terms the best specialist's profile must contain; one
+# term is not evidence ("software" in "a marketing slogan for my software startup")
+DEFAULT_MIN_TERMS = 2
+
+ENABLED = os.getenv("LOCAL_ROUTER", "1") != "0"
+
+_WORD = re.compile(r"[a-z]+")
+_SUFFIXES = ("yses", "ysis", "yze", "ations", "ation", "ities", "ity", "ings", "ing", "ical", "ics", "ic", "es", "ed", "al", "ly", "s", "e")
+STOPWORDS = frozenset(
+    """a about an and any are as at be been but by can do does for from had has have help how i if in
+    into is it its me my of on or our should so that the their them then there these they this to
+    up us was we were what when where which while who why will with you your always provide
+    expert specialist specialized specializing agent expertise including various""".split()
+)
+# Words of requests and instructions in any domain; compared after stemming, so "explaining" is one too
+GENERIC_WORDS = frozenset(
+    """explain explanation describe show tell give make need want know understand learn teach step problem solution
+    answer question work way thing example detail clear simple complex comprehensive approach method
+    process processes concept principle technique basic key main good best practice proper accurate""".split()
+)
+
+
+def _stem(word: str) -> str:
+    """Crude suffix stripping, so "equation"/"equations" and "solve"/"solving" share a term."""
+    if word.endswith("ies") and len(word) > 5:
+        return word[:-3] + "y"
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+            return word[: -len(suffix)]
+    return word
+
+
+_GENERIC_TERMS = frozenset(_stem(word) for word in GENERIC_WORDS)
+
+
+def tokenize(text: str) -> list[str]:
+    terms = (_stem(word) for word in _WORD.findall(text.lower()) if len(word) > 1 and word not in STOPWORDS)
+    return [term for term in terms if term not in _GENERIC_TERMS]
+
+
+def profile_text(agent: Agent, hints: dict[str, str] | None = None) -> str:
+    """The text a specialist's profile is built from: name, handoff description, instructions and hints."""
+    return " ".join([
+        agent.name,
+        agent.handoff_description or "",
+        agent.instructions if isinstance(agent.instructions, str) else "",
+        (hints or {}).get(agent.name, ""),
+    ])
+
+
+@dataclass
+class RouteDecision:
+    """The router's pick; ``agent`` is None when the query should go to the coordinator."""
+
+    agent: Agent | None
+    scores: dict[str, float]
+
+
+class LocalRouter:
+    """TF-IDF nearest-profile classifier over a coordinator's handoff targets."""
+
+    def __init__(
+        self,
+        specialists: list[Agent],
+        min_score: float = DEFAULT_MIN_SCORE,
+        min_margin: float = DEFAULT_MIN_MARGIN,
+        hints: dict[str, str] | None = None,
+        min_terms: int = DEFAULT_MIN_TERMS,
+    ):
+        """
+        Args:
+            specialists: The agents queries can be routed to.
+            min_score: Cosine similarity the best specialist needs to be picked.
+            min_margin: How many times the runner-up's score the best one needs.
+            hints: Extra text (e.g. keywords) per specialist name, added to its profile.
+            min_terms: Distinct query terms the best specialist's profile needs to contain.
+        """
+        self.specialists = {agent.name: agent for agent in specialists}
+        self.min_score = min_score
+        self.min_margin = min_margin
+        self.min_terms = min_terms
+        documents = {agent.name: tokenize(profile_text(agent, hints)) for agent in specialists}
+        document_frequency = Counter(term for terms in documents.values() for term in set(terms))
+        n_documents = len(documents)
+        self.idf = {term: math.log((1 + n_documents) / (1 + count)) + 1.0 for term, count in document_frequency.items()}
+        self.profiles = {name: self._vector(terms) for name, terms in documents.items()}
+
+    @classmethod
+    def from_coordinator(cls, coordinator: Agent, **kwargs: Any) -> "LocalRouter":
+        """A router over the coordinator's handoff targets (Agent handoffs only)."""
+        return cls([handoff for handoff in coordinator.handoffs if isinstance(handoff, Agent)], **kwargs)
+
+    def _vector(self, terms: list[str]) -> dict[str, float]:
+        """L2-normalized TF-IDF weights of the known terms (sublinear term frequency)."""
+        weights = {
+            term: (1.0 + math.log(count)) * self.idf[term] for term, count in Counter(terms).items() if term in self.idf
+        }
+        norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+        return {term: weight / norm for term, weight in weights.items()}
+
+    def _scores(self, vector: dict[str, float]) -> dict[str, float]:
+        scores = {
+            name: sum(weight * profile.get(term, 0.0) for term, weight in vector.items())
+            for name, profile in self.profiles.items()
+        }
+        return dict(sorted(scores.items(), key=lambda item: -item[1]))
+
+    def scores(self, query: str) -> dict[str, float]:
+        """Cosine similarity of the query to every specialist's profile, best first."""
+        return self._scores(self._vector(tokenize(query)))
+
+    def route(self, query: str) -> RouteDecision:
+        """
+        Pick a specialist if the best score is high enough, clearly ahead of the runner-up
+        and backed by at least ``min_terms`` shared terms (the margin alone always passes
+        when the runner-up scores zero).
+        """
+        vector = self._vector(tokenize(query))
+        scores = self._scores(vector)
+        ranked = list(scores.items())
+        if not ranked:
+            return RouteDecision(None, scores)
+        best_name, best = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        shared = sum(1 for term in vector if term in self.profiles[best_name])
+        if best >= self.min_score and best >= self.min_margin * runner_up and shared >= self.min_terms:
+            return RouteDecision(self.specialists[best_name], scores)
+        return RouteDecision(None, scores)
+
+    def agent_for(self, query: str, coordinator: Agent) -> Agent:
+        """The specialist to start ``query`` on, or ``coordinator`` if the router is unsure."""
+        return self.route(query).agent or coordinator
+
+
+def create_router(coordinator: Agent, hints: dict[str, str] | None = None) -> LocalRouter | None:
+    """A router over the coordinator's specialists, or None if ``LOCAL_ROUTER=0``."""
+    return LocalRouter.from_coordinator(coordinator, hints=hints) if ENABLED else None
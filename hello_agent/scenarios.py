@@ -0,0 +1,203 @@
+"""
+Concurrent Scenario Runner
+==========================
+
+Runs a list of queries through the agent graph, at most ``concurrency`` at a
+time, and records each one's latency, token usage and handoff path (the
+agents that worked on it, in order). Results are reported in scenario order
+as soon as a scenario and every one before it are done, so concurrent output
+reads like a sequential run. The demos in main.py and agent.py use it
+(``DEMO_CONCURRENCY``, default 1). Run on its own it is a smoke-load test of
+the agent graph: every scenario set, repeated, at high concurrency, exiting
+non-zero if any query fails.
+
+    uv run python scenarios.py --set demo --concurrency 8 --repeat 5
+    uv run python scenarios.py --set educational --offline 0.3   # stand-in model, no API calls
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from fanout import FanoutResult
+
+# answer(query, log) -> run result; ``log`` collects the scenario's progress lines
+Answer = Callable[[str, Callable[[str], None]], Awaitable[Any]]
+
+
+@dataclass
+class ScenarioRecord:
+    """How one scenario went."""
+
+    index: int
+    query: str
+    output: str | None = None
+    error: str | None = None
+    seconds: float = 0.0
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    path: list[str] = field(default_factory=list)
+    log: list[str] = field(default_factory=list)
+
+
+def demo_concurrency() -> int:
+    return max(1, int(os.getenv("DEMO_CONCURRENCY", "1")))
+
+
+def handoff_path(result: Any) -> list[str]:
+    """The agents that worked on a run, in order; concurrent fan-out branches are joined with "+"."""
+    if isinstance(result, FanoutResult):
+        planned = ["Fan-out Planner"]
+        if not result.branches:
+            return planned + [result.fallback] if result.fallback else planned
+        planned.append(" + ".join(branch.specialist for branch in result.branches))
+        return planned + ["Answer Merger"] if len(result.branches) > 1 else planned
+    path: list[str] = []
+    for item in getattr(result, "new_items", []):
+        names = [item.agent.name]
+        if item.type == "handoff_output_item":
+            names.append(item.target_agent.name)
+        for name in names:
+            if not path or path[-1] != name:
+                path.append(name)
+    return path or [result.last_agent.name]
+
+
+def _record_result(record: ScenarioRecord, result: Any) -> None:
+    record.output = str(result.final_output)
+    record.path = handoff_path(result)
+    if isinstance(result, FanoutResult):
+        record.total_tokens = result.tokens
+        return
+    usage = result.context_wrapper.usage
+    record.requests = usage.requests
+    record.input_tokens = usage.input_tokens
+    record.output_tokens = usage.output_tokens
+    record.total_tokens = usage.total_tokens
+
+
+async def run_scenarios(
+    queries: list[str],
+    answer: Answer,
+    concurrency: int = 1,
+    emit: Callable[[ScenarioRecord], None] | None = None,
+) -> list[ScenarioRecord]:
+    """
+    Answer every query, at most ``concurrency`` at a time.
+
+    Args:
+        queries: The scenario queries, in order.
+        answer: Runs one query; its ``log`` argument collects progress lines for the record.
+        concurrency: Queries in flight at once.
+        emit: Called with each record in scenario order, once it and all earlier ones are done.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    records = [ScenarioRecord(index, query) for index, query in enumerate(queries)]
+    done = [asyncio.Event() for _ in queries]
+
+    async def run_one(record: ScenarioRecord) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                _record_result(record, await answer(record.query, record.log.append))
+            except Exception as e:
+                record.error = f"{type(e).__name__}: {e}"
+            finally:
+                record.seconds = time.perf_counter() - start
+                done[record.index].set()
+
+    async def emit_in_order() -> None:
+        for record, finished in zip(records, done):
+            await finished.wait()
+            if emit is not None:
+                emit(record)
+
+    await asyncio.gather(emit_in_order(), *(run_one(record) for record in records))
+    return records
+
+
+def format_record(record: ScenarioRecord) -> str:
+    """One line of latency, tokens and handoff path."""
+    status = "❌" if record.error else "✅"
+    return (
+        f"{status} {record.seconds:.2f} s, {record.total_tokens} tokens ({record.requests} requests), "
+        f"path: {' → '.join(record.path) or '-'}"
+    )
+
+
+def format_summary(records: list[ScenarioRecord], seconds: float) -> str:
+    """Wall time against the sequential sum, latency percentiles, tokens and errors."""
+    if not records:
+        return f"⏱️ No scenarios were run ({seconds:.2f} s)"
+    latencies = sorted(record.seconds for record in records)
+    sequential = sum(latencies)
+    failed = [record for record in records if record.error]
+    lines = [
+        f"⏱️ {len(records)} scenarios in {seconds:.2f} s (one after another: {sequential:.2f} s, "
+        f"{sequential / seconds if seconds else 0:.1f}x)",
+        f"   latency p50 {statistics.median(latencies):.2f} s, p95 {latencies[int(0.95 * (len(latencies) - 1))]:.2f} s, "
+        f"max {latencies[-1]:.2f} s",
+        f"   🔢 {sum(record.total_tokens for record in records)} tokens, "
+        f"{sum(record.requests for record in records)} model requests",
+    ]
+    if failed:
+        lines.append(f"   ❌ {len(failed)} failed: " + "; ".join(f"#{record.index + 1} {record.error}" for record in failed[:5]))
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Smoke-load test: run the demo scenarios concurrently")
+    parser.add_argument("--set", choices=["demo", "educational"], default="demo", help="scenario set to run")
+    parser.add_argument("--concurrency", type=int, default=8, help="scenarios in flight at once")
+    parser.add_argument("--repeat", type=int, default=1, help="times to run the set")
+    parser.add_argument("--offline", type=float, metavar="LATENCY", help="use a stand-in model with this latency (s)")
+    args = parser.parse_args()
+
+    import agent as educational
+    import main as demo
+    from agents import Model
+
+    from router import create_router
+
+    if args.set == "demo":
+        labels = {scenario["query"]: scenario["expected_agent"] for scenario in demo.DEMO_SCENARIOS}
+    else:
+        labels = {item["question"]: item["expected_agent"] for item in educational.EDUCATIONAL_QUESTIONS}
+    if args.offline is not None:
+        from agents import set_tracing_disabled
+        from benchmarks.routing_model import RoutingModel
+
+        set_tracing_disabled(True)
+        model: Model = RoutingModel(labels, args.offline)
+    else:
+        model = demo.get_llm_model()
+    if args.set == "demo":
+        coordinator, hints = demo.create_agents(model)[0], demo.ROUTING_HINTS
+    else:
+        coordinator, hints = educational.create_coordinator_agents(model)[0], educational.ROUTING_HINTS
+    router = create_router(coordinator, hints)
+
+    async def answer(query: str, log: Callable[[str], None]) -> Any:
+        return await demo.answer_query(query, coordinator, router, log=log)
+
+    def emit(record: ScenarioRecord) -> None:
+        print(f"  #{record.index + 1:<3} {record.query[:40]:<40} {format_record(record)}", flush=True)
+
+    queries = list(labels) * args.repeat
+    print(f"🔥 {len(queries)} {args.set} scenarios, {args.concurrency} at a time")
+    start = time.perf_counter()
+    records = asyncio.run(run_scenarios(queries, answer, args.concurrency, emit))
+    print(format_summary(records, time.perf_counter() - start))
+    if any(record.error for record in records):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Speculative Specialists
+=======================
+
+A handed-off specialist cannot start until the coordinator's handoff call has
+come back, so its answer arrives two model round trips after the question.
+``SpeculativeRunner`` starts the one or two specialists the local router
+ranks highest at the same time as the coordinator. When the coordinator hands
+off to one of them, the coordinator run is cancelled and the already running
+specialist run is kept; the other speculative runs are cancelled. When it
+hands off elsewhere, or answers itself, every speculative run is cancelled and
+the coordinator run continues as usual.
+
+Cancelled runs still cost tokens. Their (estimated) tokens are counted as
+wasted, and once ``token_budget`` wasted tokens have been spent the runner
+stops speculating. Each speculative run is also cut off if it alone would go
+over what is left of the budget. Specialists should not have side effects
+(tools that write, send or buy), since a speculative run can be thrown away.
+A kept run answers from the question alone; it does not see the coordinator's
+handoff call.
+
+    speculative = SpeculativeRunner(coordinator, candidates=2)
+    outcome = await speculative.run(query)
+    print(outcome.result.final_output)
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from agents import Agent, RunResultStreaming, Runner
+
+from router import LocalRouter
+
+DEFAULT_CANDIDATES = 2
+DEFAULT_TOKEN_BUDGET = 20_000
+# Specialists the router scores lower than this are not worth starting
+DEFAULT_MIN_SCORE = 0.05
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class _Run:
+    """One streamed run, drained in the background, with its first-token time and token count."""
+
+    def __init__(self, agent: Agent, query: str, token_limit: float | None = None, **kwargs: Any):
+        self.agent = agent
+        self.result: RunResultStreaming = Runner.run_streamed(agent, query, **kwargs)
+        self.token_limit = token_limit
+        self.input_tokens = _estimate_tokens(query) + _estimate_tokens(agent.instructions if isinstance(agent.instructions, str) else "")
+        self.streamed_chars = 0
+        self.first_token: float | None = None
+        self.finished: float | None = None
+        self.dropped = False
+        self.handoff: asyncio.Future[Agent] = asyncio.get_running_loop().create_future()
+        self.task = asyncio.create_task(self._drain())
+
+    def tokens(self) -> int:
+        """Tokens used so far: the reported usage, or an estimate while the first response streams."""
+        return self.result.context_wrapper.usage.total_tokens or self.input_tokens + self.streamed_chars // 4
+
+    async def _drain(self) -> None:
+        try:
+            async for event in self.result.stream_events():
+                if event.type == "agent_updated_stream_event":
+                    if event.new_agent is not self.agent and not self.handoff.done():
+                        self.handoff.set_result(event.new_agent)
+                elif event.type == "raw_response_event" and event.data.type == "response.output_text.delta":
+                    if self.first_token is None:
+                        self.first_token = time.perf_counter()
+                    self.streamed_chars += len(event.data.delta)
+                    if self.token_limit is not None and self.tokens() > self.token_limit:
+                        self.dropped = True
+                        self.result.cancel()
+        finally:
+            self.finished = time.perf_counter()
+
+    def cancel(self) -> None:
+        self.dropped = True
+        self.result.cancel()
+        # stream_events() only notices a cancel between events, so also wake the drain
+        self.task.cancel()
+
+
+@dataclass
+class SpeculationOutcome:
+    """How one speculative run went."""
+
+    # The run that produced the answer: a kept speculative run, or the coordinator's
+    result: RunResultStreaming
+    # Specialists started speculatively
+    speculated: list[str]
+    # The coordinator's handoff target (None if it answered itself)
+    handoff: str | None
+    # Whether the handoff target's speculative run was kept
+    hit: bool
+    # Estimated tokens of the cancelled speculative runs
+    wasted_tokens: int
+    # Tokens of every run started for the query, wasted ones included
+    total_tokens: int
+    # Seconds until the first token of the answer could be shown
+    first_token: float
+
+    def summary(self) -> str:
+        if not self.speculated:
+            return "No specialists started speculatively"
+        started = ", ".join(self.speculated)
+        if self.hit:
+            return f"Started {started} early; kept {self.handoff} ({self.wasted_tokens} tokens wasted)"
+        target = f"handed off to {self.handoff}" if self.handoff else "coordinator answered itself"
+        return f"Started {started} early; {target} ({self.wasted_tokens} tokens wasted)"
+
+
+class SpeculativeRunner:
+    """Runs the coordinator and its likeliest specialists side by side, keeping the one it hands off to."""
+
+    def __init__(
+        self,
+        coordinator: Agent,
+        router: LocalRouter | None = None,
+        candidates: int = DEFAULT_CANDIDATES,
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+        min_score: float = DEFAULT_MIN_SCORE,
+        hints: dict[str, str] | None = None,
+    ):
+        """
+        Args:
+            coordinator: The agent whose handoffs decide which specialist answers.
+            router: Ranks the specialists; defaults to a LocalRouter over the coordinator's handoffs.
+            candidates: How many specialists to start per query.
+            token_budget: Wasted tokens after which no more specialists are started.
+            min_score: Router score a specialist needs to be started.
+            hints: Keyword hints for the default router.
+        """
+        self.coordinator = coordinator
+        self.router = router or LocalRouter.from_coordinator(coordinator, hints=hints)
+        self.candidates = candidates
+        self.token_budget = token_budget
+        self.min_score = min_score
+        self.wasted_tokens = 0
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(
+        cls, coordinator: Agent, router: LocalRouter | None = None, hints: dict[str, str] | None = None
+    ) -> "SpeculativeRunner | None":
+        """
+        A runner configured from ``SPECULATIVE_SPECIALISTS`` (specialists per query, default 0 = off)
+        and ``SPECULATIVE_TOKEN_BUDGET``, or None if speculation is off.
+        """
+        candidates = int(os.getenv("SPECULATIVE_SPECIALISTS", "0"))
+        if candidates <= 0:
+            return None
+        return cls(
+            coordinator,
+            router,
+            candidates=candidates,
+            token_budget=int(os.getenv("SPECULATIVE_TOKEN_BUDGET", DEFAULT_TOKEN_BUDGET)),
+            hints=hints,
+        )
+
+    def pick(self, query: str) -> list[Agent]:
+        """The specialists worth starting for ``query``; none once the budget is spent."""
+        if self.wasted_tokens >= self.token_budget:
+            return []
+        ranked = [name for name, score in self.router.scores(query).items() if score >= self.min_score]
+        return [self.router.specialists[name] for name in ranked[: self.candidates]]
+
+    async def run(self, query: str, **kwargs: Any) -> SpeculationOutcome:
+        """
+        Answer ``query`` through the coordinator, with speculative specialist runs alongside.
+
+        Extra keyword arguments are passed to ``Runner.run_streamed`` for every run.
+        """
+        start = time.perf_counter()
+        picked = self.pick(query)
+        # Each speculative run may spend an equal share of what is left of the budget
+        share = (self.token_budget - self.wasted_tokens) / len(picked) if picked else None
+        branches = {agent.name: _Run(agent, query, share, **kwargs) for agent in picked}
+        coordinator = _Run(self.coordinator, query, **kwargs)
+        kept: _Run | None = None
+        try:
+            decision: set[asyncio.Future[Any]] = {coordinator.task, coordinator.handoff}
+            await asyncio.wait(decision, return_when=asyncio.FIRST_COMPLETED)
+            decided = time.perf_counter()
+            target = coordinator.handoff.result() if coordinator.handoff.done() else None
+            candidate = branches.pop(target.name, None) if target is not None else None
+            usable = candidate is not None and not candidate.dropped and not (
+                candidate.task.done() and candidate.task.exception() is not None
+            )
+            if usable and candidate is not None:
+                kept = candidate
+                kept.token_limit = None
+                coordinator.cancel()
+            elif candidate is not None:
+                branches[candidate.agent.name] = candidate
+        except BaseException:
+            coordinator.cancel()
+            raise
+        finally:
+            for branch in branches.values():
+                branch.cancel()
+            await asyncio.gather(*(branch.task for branch in branches.values()), return_exceptions=True)
+            wasted = sum(branch.tokens() for branch in branches.values())
+            self.wasted_tokens += wasted
+
+        answer = kept or coordinator
+        if kept is not None:
+            await asyncio.gather(coordinator.task, return_exceptions=True)
+        try:
+            await answer.task
+        except asyncio.CancelledError:
+            answer.cancel()
+            raise
+        if picked:
+            if kept is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        # The drain has finished (and set ``finished``) once its task has been awaited
+        first_token = answer.first_token or answer.finished or time.perf_counter()
+        total_tokens = answer.tokens() + wasted
+        if kept is not None:
+            first_token = max(first_token, decided)
+            total_tokens += coordinator.tokens()
+        return SpeculationOutcome(
+            result=answer.result,
+            speculated=[agent.name for agent in picked],
+            handoff=target.name if target is not None else None,
+            hit=kept is not None,
+            wasted_tokens=wasted,
+            total_tokens=total_tokens,
+            first_token=first_token - start,
+        )
@@ -0,0 +1,82 @@
+"""
+Wall time of one model response's tool calls: sequential, SDK default, dispatcher.
+
+Slow stand-in tools (sync ones that block, async ones that await) are called
+the way a response with several parallel tool calls would call them, one
+call being a duplicate. Plain ``@function_tool`` tools gathered together still
+run sync tools one after another; the dispatcher runs everything concurrently
+and collapses the duplicate, so wall time approaches the slowest call.
+
+Run from the hello_settings directory:
+    uv run python -m benchmarks.bench_dispatcher
+"""
+
+import asyncio
+import json
+import time
+
+from agents import RunContextWrapper, function_tool
+
+from dispatcher import ToolDispatcher
+
+
+def slow_lookup(key: str, seconds: float) -> str:
+    """Stand-in for a blocking tool (e.g. a sync HTTP client or database call)."""
+    time.sleep(seconds)
+    return f"lookup {key}"
+
+
+async def slow_fetch(key: str, seconds: float) -> str:
+    """Stand-in for an async tool (e.g. an async HTTP call)."""
+    await asyncio.sleep(seconds)
+    return f"fetch {key}"
+
+
+# One model response: (tool, arguments); the last call repeats the first
+CALLS = [
+    ("slow_lookup", {"key": "weather", "seconds": 0.30}),
+    ("slow_lookup", {"key": "rates", "seconds": 0.20}),
+    ("slow_fetch", {"key": "news", "seconds": 0.25}),
+    ("slow_lookup", {"key": "translate", "seconds": 0.15}),
+    ("slow_fetch", {"key": "search", "seconds": 0.10}),
+    ("slow_lookup", {"key": "weather", "seconds": 0.30}),
+]
+
+
+async def timed(label: str, coro) -> float:
+    start = time.perf_counter()
+    results = await coro
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<30} {elapsed * 1000:7.0f} ms   ({len(results)} results)")
+    return elapsed
+
+
+async def main():
+    plain = {fn.__name__: function_tool(fn) for fn in (slow_lookup, slow_fetch)}
+    dispatcher = ToolDispatcher()
+    for fn in (slow_lookup, slow_fetch):
+        dispatcher.tool(fn)
+    ctx = RunContextWrapper(context=None)
+
+    total = sum(arguments["seconds"] for _, arguments in CALLS)
+    slowest = max(arguments["seconds"] for _, arguments in CALLS)
+    print(f"🚦 {len(CALLS)} tool calls from one response: sum {total * 1000:.0f} ms, slowest {slowest * 1000:.0f} ms")
+    print("=" * 60)
+
+    async def sequential():
+        return [await plain[name].on_invoke_tool(ctx, json.dumps(arguments)) for name, arguments in CALLS]
+
+    await timed("sequential", sequential())
+    await timed("gathered @function_tool (SDK)", asyncio.gather(*(
+        plain[name].on_invoke_tool(ctx, json.dumps(arguments)) for name, arguments in CALLS
+    )))
+    await timed("dispatcher", dispatcher.dispatch(CALLS, ctx))
+
+    print("-" * 60)
+    for record in dispatcher.records:
+        print(f"  • {record}")
+    dispatcher.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,163 @@
+"""
+Tool-call dispatcher: run the tool calls of one model response concurrently.
+
+The Agents SDK already gathers the calls of a response, but a sync
+``@function_tool`` runs inline on the event loop, so sync tools still run one
+after another. Tools created with ``ToolDispatcher.tool`` instead run sync
+functions on a thread pool and async ones on the loop. Identical calls
+(same tool, same arguments) from the same run that are in flight together
+are collapsed into one execution, and every call's timing is recorded.
+
+    dispatcher = ToolDispatcher()
+
+    @dispatcher.tool
+    def get_weather(city: str) -> str: ...
+
+``dispatch`` runs a list of calls directly (e.g. for benchmarks) and returns
+their results in the order given.
+"""
+
+import asyncio
+import functools
+import inspect
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from agents import FunctionTool, RunContextWrapper, function_tool
+
+
+@dataclass
+class CallRecord:
+    """Timing of one tool call; ``deduplicated`` calls shared another call's execution."""
+
+    tool: str
+    call_id: str | None
+    arguments: str
+    started: float
+    seconds: float
+    deduplicated: bool
+    error: str | None = None
+
+    def __str__(self) -> str:
+        shared = " (deduplicated)" if self.deduplicated else ""
+        failed = f" ❌ {self.error}" if self.error else ""
+        return f"{self.tool}({self.arguments}) {self.seconds * 1000:.0f} ms{shared}{failed}"
+
+
+def _canonical(arguments: str) -> str:
+    """Arguments JSON with sorted keys and no whitespace, so equal calls compare equal."""
+    try:
+        return json.dumps(json.loads(arguments or "{}"), sort_keys=True, separators=(",", ":"))
+    except ValueError:
+        return arguments
+
+
+class ToolDispatcher:
+    """Creates dispatched FunctionTools and keeps per-call timing records."""
+
+    def __init__(self, max_workers: int = 8, max_records: int = 1000):
+        self.records: deque[CallRecord] = deque(maxlen=max_records)
+        # Calls recorded so far, including those the bounded ``records`` has dropped
+        self.calls = 0
+        self.tools: dict[str, FunctionTool] = {}
+        self._max_workers = max_workers
+        self._pool: ThreadPoolExecutor | None = None
+        self._inflight: dict[tuple, asyncio.Future] = {}
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="tool")
+        return self._pool
+
+    def tool(self, fn: Callable[..., Any]) -> FunctionTool:
+        """
+        Like ``@function_tool``, but calls go through this dispatcher.
+
+        Sync functions run on the dispatcher's thread pool; async functions run on the loop.
+        The schema is the same as ``@function_tool`` would generate for ``fn``.
+        """
+        if not inspect.iscoroutinefunction(fn):
+            sync_fn = fn
+
+            @functools.wraps(sync_fn)
+            async def fn(*args: Any, **kwargs: Any) -> Any:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._get_pool(), functools.partial(sync_fn, *args, **kwargs))
+
+        tool = function_tool(fn)
+        invoke = tool.on_invoke_tool
+
+        async def on_invoke_tool(ctx: RunContextWrapper[Any], arguments: str) -> Any:
+            return await self._invoke(tool.name, invoke, ctx, arguments)
+
+        tool.on_invoke_tool = on_invoke_tool
+        self.tools[tool.name] = tool
+        return tool
+
+    async def _invoke(
+        self,
+        name: str,
+        invoke: Callable[[RunContextWrapper[Any], str], Any],
+        ctx: RunContextWrapper[Any] | None,
+        arguments: str,
+    ) -> Any:
+        # Calls of one run share its usage object, so it scopes deduplication to the run
+        key = (id(ctx.usage) if ctx is not None else None, name, _canonical(arguments))
+        started = time.perf_counter()
+        shared = self._inflight.get(key)
+        deduplicated = shared is not None
+        if shared is None:
+            shared = self._inflight[key] = asyncio.ensure_future(invoke(ctx, arguments))
+            shared.add_done_callback(functools.partial(self._forget, key))
+
+        error = None
+        try:
+            return await asyncio.shield(shared)
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            self.records.append(CallRecord(
+                tool=name,
+                call_id=getattr(ctx, "tool_call_id", None),
+                arguments=arguments,
+                started=started,
+                seconds=time.perf_counter() - started,
+                deduplicated=deduplicated,
+                error=error,
+            ))
+            self.calls += 1
+
+    def records_since(self, calls: int) -> list[CallRecord]:
+        """Records of the calls made since ``self.calls`` was ``calls`` (those still kept)."""
+        new = min(self.calls - calls, len(self.records))
+        return list(self.records)[len(self.records) - new:]
+
+    def _forget(self, key: tuple, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+    async def dispatch(
+        self,
+        calls: list[tuple[str, dict[str, Any]]],
+        ctx: RunContextWrapper[Any] | None = None,
+    ) -> list[Any]:
+        """
+        Run ``(tool name, arguments)`` calls concurrently, like the calls of one model response.
+
+        Returns:
+            One result per call, in the order given.
+        """
+        ctx = ctx or RunContextWrapper(context=None)
+        return await asyncio.gather(*(
+            self.tools[name].on_invoke_tool(ctx, json.dumps(arguments)) for name, arguments in calls
+        ))
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
@@ -1,7 +1,18 @@
+import asyncio
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
-from agents import Agent, Runner, function_tool, ModelSettings, OpenAIChatCompletionsModel, AsyncOpenAI, set_tracing_disabled
+from agents import Agent, Runner, ModelSettings, OpenAIChatCompletionsModel, AsyncOpenAI, set_tracing_disabled
+
+from dispatcher import ToolDispatcher
+
+# 🧮 calculate_math uses hello_tools' expression engine, 💾 memoizer and 📦 batching helpers
+# (hello_tools' ``tools`` package is a path dependency, see pyproject.toml)
+from tools.batching import MAX_BATCH_ITEMS, format_table, gather_bounded
+from tools.executor import ToolExecutor, ToolTimeoutError
+from tools.expression import ExpressionCostError, ExpressionError, evaluate_expression
+from tools.memoize import memoize, memos
 
 # 🌿 Load environment variables from .env file
 load_dotenv()
@@ -14,22 +25,44 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")  # 🔑 Get your API key from envir
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")  # 🔑 Get your OpenAI API key from environment
 BASE_URL = "https://generativelanguage.googleapis.com/v1beta/openai/"  # 🌐 Gemini-compatible base URL (set this in .env file)
 
-# 🌐 Initialize clients for both Gemini and OpenAI
-gemini_client: AsyncOpenAI = AsyncOpenAI(api_key=GEMINI_API_KEY, base_url=BASE_URL)
-openai_client: AsyncOpenAI = AsyncOpenAI(api_key=OPENAI_API_KEY)
+# 🧠 2) Model Initialization (clients are built on first use, so importing this file stays cheap)
+@lru_cache(maxsize=1)
+def get_gemini_model() -> OpenAIChatCompletionsModel:
+    gemini_client: AsyncOpenAI = AsyncOpenAI(api_key=GEMINI_API_KEY, base_url=BASE_URL)
+    return OpenAIChatCompletionsModel(model="gemini-2.5-flash", openai_client=gemini_client)
+
+@lru_cache(maxsize=1)
+def get_openai_model() -> OpenAIChatCompletionsModel:
+    openai_client: AsyncOpenAI = AsyncOpenAI(api_key=OPENAI_API_KEY)
+    return OpenAIChatCompletionsModel(model="gpt-4o-mini", openai_client=openai_client)
+
+# 🚦 Every tool goes through one dispatcher: the tool calls of a response run
+# concurrently (sync tools on a thread pool), identical calls run once, and each
+# call's timing is recorded in dispatcher.records
+dispatcher = ToolDispatcher()
+
+# 💾 Pure tools are memoized: calls are keyed on their canonicalized arguments
+# ("London" given by position or by name is one entry), results expire after
+# TOOL_CACHE_TTL seconds, and identical calls in flight together (the parallel
+# tool calls of one model turn) run once; hit/miss counts are in memos[name]
+TOOL_CACHE_SIZE = 256
+TOOL_CACHE_TTL = 600.0
 
-# 🧠 2) Model Initialization
-gemini_model: OpenAIChatCompletionsModel = OpenAIChatCompletionsModel(model="gemini-2.5-flash", openai_client=gemini_client)
-openai_model: OpenAIChatCompletionsModel = OpenAIChatCompletionsModel(model="gpt-4o-mini", openai_client=openai_client)
+def cached_tool(fn):
+    """Like @dispatcher.tool, but memoized by arguments with a TTL; stats via memos[fn.__name__].stats()."""
+    memoized = memoize(maxsize=TOOL_CACHE_SIZE, ttl=TOOL_CACHE_TTL)(fn)
+    tool = dispatcher.tool(memoized)
+    tool.function = memoized  # 🔁 the memoized function, for reuse by batched tools
+    return tool
 
 # 🛠️ Tools for learning
-@function_tool
+@cached_tool
 def calculate_area(length: float, width: float) -> str:
     """Calculate the area of a rectangle."""
     area = length * width
     return f"Area = {length} × {width} = {area} square units"
 
-@function_tool
+@cached_tool
 def get_weather(city: str) -> str:
     """Get weather information for a city."""
     # Simulated weather data
@@ -41,21 +74,34 @@ def get_weather(city: str) -> str:
     }
     return f"Weather in {city}: {weather_data.get(city, 'Weather data not available')}"
 
-@function_tool
-def calculate_math(expression: str) -> str:
+# 🛡️ Safe math: hello_tools' expression engine (whitelisted AST + cost guard) instead of eval().
+# Oversized integer results (9**9**9, abs(9)**9**9) are rejected before they are computed, both
+# statically and before every power and product, so no calculation can pin a worker thread
+MATH_TIMEOUT_SECONDS = 2.0    # ⏱️ Wall-clock budget per calculation (queueing included)
+MATH_MAX_CONCURRENCY = 4      # 🚦 At most this many calculations run at once, the rest queue
+
+# 🧵 Dedicated worker threads for calculate_math, so math never runs on (or floods) the event loop
+MATH_EXECUTOR = ToolExecutor("calculate_math", "thread", MATH_TIMEOUT_SECONDS, MATH_MAX_CONCURRENCY)
+MATH_TIMEOUT_MESSAGE = "Calculation took too long and was stopped."
+
+@dispatcher.tool
+@memoize(maxsize=TOOL_CACHE_SIZE, ttl=TOOL_CACHE_TTL, cache_if=lambda result: result != MATH_TIMEOUT_MESSAGE)
+async def calculate_math(expression: str) -> str:
     """Calculate a mathematical expression safely."""
     try:
-        # Simple safe evaluation for basic math
-        allowed_chars = set('0123456789+-*/.() ')
-        if all(c in allowed_chars for c in expression):
-            result = eval(expression)
-            return f"{expression} = {result}"
-        else:
-            return "Invalid expression. Only numbers and basic operators allowed."
-    except:
+        result = await MATH_EXECUTOR.run(evaluate_expression, expression)
+        return f"{expression} = {result}"
+    except ToolTimeoutError:
+        return MATH_TIMEOUT_MESSAGE
+    except ExpressionCostError as e:
+        return f"Calculation rejected: {e}"
+    except ExpressionError:
+        return "Invalid expression. Only numbers and basic operators allowed."
+    except (ArithmeticError, TypeError, ValueError):
+        # Division by zero, sqrt(-1), sqrt(1, 2) and the like
         return "Error calculating expression."
 
-@function_tool
+@cached_tool
 def translate_text(text: str, language: str) -> str:
     """Translate text to a specified language."""
     # Simulated translation
@@ -67,8 +113,36 @@ def translate_text(text: str, language: str) -> str:
     }
     return translations.get(language.lower(), f"Translation to {language}: {text}")
 
+# 📦 Batched variant: one tool call (and one model round trip) for many items; batches
+# over MAX_BATCH_ITEMS are cut off, and the answer says how many items were skipped
+@dispatcher.tool
+async def translate_text_batch(texts: list[str], languages: list[str]) -> str:
+    """Translate every text into every language in one call (e.g. 3 phrases into Spanish and French)."""
+    pairs = [(text, language) for text in texts for language in languages]
+    if not pairs:
+        return "No texts or languages given."
+    skipped = max(0, len(pairs) - MAX_BATCH_ITEMS)
+    pairs = pairs[:MAX_BATCH_ITEMS]
+
+    async def translate_one(pair: tuple[str, str]) -> str:
+        # 🧵 The (memoized) sync translate_text runs on a worker thread, so the pairs run concurrently
+        return await asyncio.to_thread(translate_text.function, *pair)
+
+    translations = await gather_bounded(translate_one, pairs)
+    rows = [
+        [text, language, f"Error: {translation}" if isinstance(translation, Exception) else translation]
+        for (text, language), translation in zip(pairs, translations)
+    ]
+    lines = [format_table(["Text", "Language", "Translation"], rows)]
+    if skipped:
+        lines.append(f"⚠️ {skipped} more text/language pairs were skipped (at most {MAX_BATCH_ITEMS} per call)")
+    return "\n".join(lines)
+
 def main():
     """Learn Model Settings with simple examples."""
+    gemini_model = get_gemini_model()
+    openai_model = get_openai_model()
+
     # 🎯 Example 1: Temperature (Creativity Control)
     print("\n❄️🔥 Temperature Settings")
     print("-" * 30)
@@ -163,6 +237,20 @@ def main():
     print(result_multi.final_output)
     
     print("\n💡 Notice: Gemini uses tools sequentially (one after another)")
+
+    # 📦 Batched tools: one call covers every item, so Gemini needs a single round trip
+    batch_agent = Agent(
+        name="Batch Agent",
+        tools=[translate_text, translate_text_batch],
+        model_settings=ModelSettings(tool_choice="auto"),
+        model=gemini_model
+    )
+    batch_question = "Translate 'Hello', 'Thank you' and 'Good night' to Spanish, French and German"
+
+    print("\n📦 Batch Agent (Gemini - one batched call):")
+    result_batch = Runner.run_sync(batch_agent, batch_question)
+    print(result_batch.final_output)
+    print(f"🔁 Model round trips: {len(result_batch.raw_responses)}")
     
     # 🎯 Example 4: Parallel Tool Calls with OpenAI
     print("\n⚡ Parallel Tool Calls (OpenAI)")
@@ -195,8 +283,12 @@ def main():
     print(result_sequential.final_output)
     
     print("\n⚡ Parallel Agent (OpenAI - multiple tools simultaneously):")
+    calls_before = dispatcher.calls
     result_parallel = Runner.run_sync(parallel_agent, multi_task_question)
     print(result_parallel.final_output)
+    print("⏱️ Tool calls (run concurrently by the dispatcher):")
+    for record in dispatcher.records_since(calls_before):
+        print(f"  • {record}")
     
     print("\n💡 Notice:")
     print("• Sequential = tools called one after another")
@@ -284,6 +376,13 @@ def main():
     print()
     print("💡 Best Practice: Use Gemini for basic features, OpenAI for advanced features!")
 
+    # 💾 Memoized tools: identical calls across all the examples above ran only once
+    print("\n💾 Tool Cache Stats")
+    print("-" * 30)
+    for name, memo in memos.items():
+        stats = memo.stats()
+        print(f"  {name}: {stats['hits']} hits, {stats['misses']} misses, {stats['coalesced']} coalesced")
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,258 @@
+"""
+Batch runner: run a JSONL file of prompts through an agent, several at a time.
+
+Each input line is a JSON object with the prompt under ``input`` (or
+``prompt``) and an optional ``id`` (default: the line number). Results are
+appended to the output JSONL file as they complete, one object per prompt:
+``id``, ``input``, ``output``, ``error``, ``latency``, ``usage`` and the
+``tools`` called. Running the same command again resumes: prompts that
+already have a successful result in the output file are skipped, failed ones
+are retried (the last line for an id is its current result).
+
+    uv run python batch_runner.py prompts.jsonl results.jsonl --agent main:get_agent --concurrency 8
+
+``--agent`` names a ``module:attribute`` importable from the current
+directory: an Agent, or a function returning one (like ``main:get_agent``).
+The runner only needs the Agents SDK (python-dotenv is used when installed),
+so it can be run from another project's directory to batch that project's
+agent. Ids must be unique within the input file, since resuming is keyed on
+them.
+"""
+
+import argparse
+import asyncio
+import importlib
+import inspect
+import json
+import math
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from agents import Agent, Runner
+
+try:
+    from dotenv import load_dotenv
+except ImportError:  # not a dependency of every project whose agent is batched
+    load_dotenv = None
+
+
+@dataclass
+class BatchStats:
+    """Outcome counters and per-prompt latencies of one batch run."""
+
+    completed: int = 0
+    errors: int = 0
+    skipped: int = 0
+    latencies: list[float] = field(default_factory=list)
+    total_tokens: int = 0
+
+    def percentile(self, q: float) -> float:
+        """Nearest-rank percentile of the successful prompts' latency, in seconds."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))]
+
+
+def load_agent(spec: str) -> Agent:
+    """Resolve ``module:attribute`` to an Agent, calling the attribute if it is a factory."""
+    module_name, _, attribute = spec.partition(":")
+    if not attribute:
+        raise ValueError(f"--agent must look like module:attribute, not {spec!r}")
+    sys.path.insert(0, os.getcwd())
+    target = getattr(importlib.import_module(module_name), attribute)
+    agent = target if isinstance(target, Agent) else target()
+    if inspect.isawaitable(agent):
+        raise TypeError(f"{spec} is async; pass a sync factory or an Agent")
+    if not isinstance(agent, Agent):
+        raise TypeError(f"{spec} did not give an Agent (got {type(agent).__name__})")
+    return agent
+
+
+def read_prompts(path: str) -> list[tuple[str, str]]:
+    """(id, prompt) pairs from a JSONL file; blank lines are ignored and a repeated id is an error."""
+    prompts = []
+    seen: dict[str, int] = {}
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            prompt = record.get("input", record.get("prompt"))
+            if not isinstance(prompt, str):
+                raise ValueError(f"{path}:{line_number}: expected an 'input' or 'prompt' string")
+            id_ = str(record.get("id", line_number))
+            if id_ in seen:
+                raise ValueError(f"{path}:{line_number}: id {id_!r} already used on line {seen[id_]}")
+            seen[id_] = line_number
+            prompts.append((id_, prompt))
+    return prompts
+
+
+def completed_ids(path: str) -> set[str]:
+    """Ids whose latest result in ``path`` succeeded; a line cut short by a crash is ignored."""
+    latest: dict[str, bool] = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                latest[str(record.get("id"))] = record.get("error") is None
+    return {id_ for id_, succeeded in latest.items() if succeeded}
+
+
+def open_output(path: str):
+    """Open ``path`` for appending, starting on a fresh line if the last write was cut short."""
+    needs_newline = False
+    if os.path.exists(path) and os.path.getsize(path):
+        with open(path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) != b"\n"
+    output = open(path, "a", encoding="utf-8")
+    if needs_newline:
+        output.write("\n")
+    return output
+
+
+async def run_prompt(agent: Agent, prompt: str, timeout: float | None, max_turns: int) -> dict[str, Any]:
+    """Run one prompt and describe the outcome as an output record (without the id)."""
+    start = time.perf_counter()
+    record: dict[str, Any] = {"input": prompt, "output": None, "error": None}
+    try:
+        result = await asyncio.wait_for(Runner.run(agent, prompt, max_turns=max_turns), timeout)
+    except asyncio.TimeoutError:
+        record["error"] = f"TimeoutError: no answer after {timeout} s"
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    else:
+        usage = result.context_wrapper.usage
+        record["output"] = result.final_output if isinstance(result.final_output, (str, int, float, bool)) else str(result.final_output)
+        record["usage"] = {
+            "requests": usage.requests,
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+            "total_tokens": usage.total_tokens,
+        }
+        record["tools"] = [
+            getattr(item.raw_item, "name", item.raw_item.type) for item in result.new_items if item.type == "tool_call_item"
+        ]
+    record["latency"] = round(time.perf_counter() - start, 4)
+    return record
+
+
+async def run_batch(
+    agent: Agent,
+    prompts: list[tuple[str, str]],
+    output_path: str,
+    concurrency: int = 4,
+    timeout: float | None = None,
+    max_turns: int = 10,
+    progress: bool = True,
+) -> BatchStats:
+    """
+    Run every prompt not yet completed in ``output_path``, ``concurrency`` at a time.
+
+    Results are appended (and flushed) as each prompt finishes, in completion order.
+    """
+    stats = BatchStats()
+    done = completed_ids(output_path)
+    pending: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
+    for id_, prompt in prompts:
+        if id_ in done:
+            stats.skipped += 1
+        else:
+            pending.put_nowait((id_, prompt))
+    total = pending.qsize()
+
+    with open_output(output_path) as output:
+
+        async def worker():
+            while not pending.empty():
+                id_, prompt = pending.get_nowait()
+                record = {"id": id_, **await run_prompt(agent, prompt, timeout, max_turns)}
+                output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                output.flush()
+                if record["error"] is None:
+                    stats.completed += 1
+                    stats.latencies.append(record["latency"])
+                    stats.total_tokens += record["usage"]["total_tokens"]
+                else:
+                    stats.errors += 1
+                if progress:
+                    status = "❌" if record["error"] else "✅"
+                    print(f"  {status} [{stats.completed + stats.errors}/{total}] {id_} ({record['latency']:.2f} s)", flush=True)
+
+        await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, total)))))
+    return stats
+
+
+async def close_tool_clients():
+    """Close the pooled search and weather clients, if the batched agent's tools created any."""
+    # Only hello_tools' tool modules hold these clients, and only once a tool has loaded them
+    search_client = sys.modules.get("tools.search_client")
+    if search_client is not None:
+        await search_client.close_search_client()
+    weather_provider = sys.modules.get("tools.weather_provider")
+    if weather_provider is not None:
+        await weather_provider.close_weather_provider()
+
+
+async def run_batch_and_close(*args: Any) -> BatchStats:
+    """``run_batch``, closing the tools' HTTP clients before the event loop goes away."""
+    try:
+        return await run_batch(*args)
+    finally:
+        await close_tool_clients()
+
+
+def print_summary(stats: BatchStats, seconds: float):
+    finished = stats.completed + stats.errors
+    print("=" * 60)
+    print(f"📦 {finished} prompts in {seconds:.2f} s ({finished / seconds if seconds else 0:.2f} prompts/s)")
+    print(f"  ✅ {stats.completed} succeeded, ❌ {stats.errors} failed, ⏭️ {stats.skipped} already done")
+    if stats.latencies:
+        print(
+            f"  ⏱️ latency p50 {stats.percentile(50):.2f} s, p95 {stats.percentile(95):.2f} s,"
+            f" p99 {stats.percentile(99):.2f} s, max {max(stats.latencies):.2f} s"
+        )
+        print(f"  🔢 {stats.total_tokens} tokens")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a JSONL file of prompts through an agent concurrently")
+    parser.add_argument("input", help="JSONL file with an 'input' (or 'prompt') and optional 'id' per line")
+    parser.add_argument("output", help="JSONL file results are appended to (and resumed from)")
+    parser.add_argument("--agent", default="main:get_agent", help="module:attribute of an Agent or a function returning one")
+    parser.add_argument("--concurrency", type=int, default=4, help="prompts in flight at once")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds before a prompt is recorded as failed")
+    parser.add_argument("--max-turns", type=int, default=10)
+    parser.add_argument("--quiet", action="store_true", help="only print the summary")
+    args = parser.parse_args()
+
+    if load_dotenv is not None:
+        load_dotenv()
+    agent = load_agent(args.agent)
+    prompts = read_prompts(args.input)
+
+    start = time.perf_counter()
+    try:
+        stats = asyncio.run(
+            run_batch_and_close(
+                agent, prompts, args.output, args.concurrency, args.timeout, args.max_turns, not args.quiet
+            )
+        )
+    except KeyboardInterrupt:
+        print("\n⏹️ Interrupted; run the same command again to resume.")
+        sys.exit(130)
+    print_summary(stats, time.perf_counter() - start)
+    if stats.errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Model round trips and end-to-end latency for N-item questions, with and without batched tools.
+
+An offline scripted model (``scripted_model.py``, 300 ms per round trip by
+default) asks for N cities' weather, N calculations or N searches in three
+ways: one tool call per turn (how Gemini calls tools), all single calls in one
+turn (parallel tool calls), and one call to the ``*_batch`` tool. Searches go
+to a local Tavily stand-in with 50 ms latency.
+
+Run from the hello_tools directory:
+    uv run python -m benchmarks.bench_batch_tools [model_latency_seconds]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+from agents import Agent, Runner, set_tracing_disabled
+
+from benchmarks.scripted_model import ScriptedModel
+from benchmarks.standin import start_json_server
+from tools.registry import get_tools
+
+CITIES = ["London", "Paris", "Tokyo", "New York", "Sydney", "Berlin", "Madrid", "Moscow", "Dubai", "Mumbai"]
+EXPRESSIONS = ["15 * 8", "2 ^ 10", "square root of 81", "7 squared plus 1", "100 / 4", "3 * (4 + 5)", "2 ^ 20 - 1", "99 / 3", "12 * 12", "1 + 2 + 3"]
+TOPICS = [f"topic {i} history" for i in range(10)]
+
+WORKLOADS = {
+    "weather": ("weather_fetcher", "location", "weather_fetcher_batch", "locations", CITIES),
+    "calculator": ("calculator", "expression", "calculator_batch", "expressions", EXPRESSIONS),
+    "web search": ("web_search", "query", "web_search_batch", "queries", TOPICS),
+}
+
+
+async def run(turns: list, tool_names: list[str], latency: float) -> tuple[int, float]:
+    model = ScriptedModel(turns, latency=latency)
+    agent = Agent(name="Assistant", model=model, tools=get_tools(tool_names))
+    start = time.perf_counter()
+    await Runner.run(agent, "benchmark question", max_turns=len(turns) + 2)
+    return model.round_trips, time.perf_counter() - start
+
+
+def fake_search(path: str, params: dict) -> dict:
+    query = params.get("query", "")
+    return {
+        "query": query,
+        "results": [
+            {"title": f"{query} result {i}", "url": f"https://example.com/{i}", "content": "Lorem ipsum dolor sit amet. " * 20, "score": 1 - i / 10}
+            for i in range(5)
+        ],
+    }
+
+
+async def main():
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.3
+    set_tracing_disabled(True)
+    server = start_json_server(fake_search, latency=0.05)
+    os.environ["TAVILY_API_URL"] = server.url
+
+    print(f"📦 Batched vs single tools (scripted model, {latency * 1000:.0f} ms per round trip)")
+    print("=" * 86)
+    print(f"  {'workload':<11} {'N':>3}  {'sequential':>20}  {'parallel calls':>20}  {'batched':>20}")
+    for label, (single, argument, batch, batch_argument, items) in WORKLOADS.items():
+        for n in (1, 3, 5, 10):
+            results = []
+            for strategy in ("sequential", "parallel", "batched"):
+                # Fresh queries for every run, so the search cache does not answer for later strategies
+                chosen = [f"{item} ({strategy} {n})" if label == "web search" else item for item in items[:n]]
+                calls = [(single, {argument: item}) for item in chosen]
+                if strategy == "sequential":
+                    results.append(await run([[call] for call in calls], [single], latency))
+                elif strategy == "parallel":
+                    results.append(await run([calls], [single], latency))
+                else:
+                    results.append(await run([[(batch, {batch_argument: chosen})]], [batch], latency))
+            cells = [f"{trips:>2} trips {seconds * 1000:7.0f} ms" for trips, seconds in results]
+            print(f"  {label:<11} {n:>3}  {cells[0]:>20}  {cells[1]:>20}  {cells[2]:>20}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
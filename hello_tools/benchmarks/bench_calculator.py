@@ -0,0 +1,77 @@
+"""
+Microbenchmark for the calculator expression engine.
+
+Compares the per-call cost of the old regex + str.replace + eval path with the
+compiled engine, both cold (cache cleared before every call) and cached.
+
+Run from the hello_tools directory:
+    uv run python -m benchmarks.bench_calculator
+"""
+
+import math
+import re
+import timeit
+
+from tools.expression import compile_expression, evaluate_expression, normalize_expression
+
+EXPRESSIONS = [
+    "5 + 5",
+    "10 * 3",
+    "100 / 4",
+    "(17 + 25) * 3 - 8 / 2",
+    "2 ** 10 - 1",
+    "((1 + 2) * (3 + 4)) / (5 - 6)",
+    "12.5 * 4 + 0.75",
+    "3 squared plus 4 squared",
+]
+
+
+def legacy_calculator(expression: str):
+    """The pre-engine implementation: regex check, ten replace passes and eval."""
+    expression = expression.strip()
+    if not re.match(r'^[0-9+\-*/().\s]+$', expression):
+        return None
+    expression = expression.replace('plus', '+')
+    expression = expression.replace('minus', '-')
+    expression = expression.replace('times', '*')
+    expression = expression.replace('multiplied by', '*')
+    expression = expression.replace('divided by', '/')
+    expression = expression.replace('to the power of', '**')
+    expression = expression.replace('squared', '**2')
+    expression = expression.replace('cubed', '**3')
+    expression = expression.replace('square root of', 'sqrt(')
+    expression = expression.replace('sqrt(', 'math.sqrt(')
+    return eval(expression, {"math": math})
+
+
+def cold(expression: str):
+    normalize_expression.cache_clear()
+    compile_expression.cache_clear()
+    return evaluate_expression(expression)
+
+
+def per_call_us(fn, number: int) -> float:
+    def run():
+        for expression in EXPRESSIONS:
+            fn(expression)
+    best = min(timeit.repeat(run, number=number, repeat=5))
+    return best / (number * len(EXPRESSIONS)) * 1e6
+
+
+def main():
+    number = 2000
+    legacy = per_call_us(legacy_calculator, number)
+    cold_cost = per_call_us(cold, number)
+    cached = per_call_us(evaluate_expression, number)
+
+    print("🧮 Calculator engine microbenchmark")
+    print("=" * 50)
+    print(f"Expressions: {len(EXPRESSIONS)}, calls per expression: {number}")
+    print(f"  legacy regex + eval : {legacy:8.2f} µs/call")
+    print(f"  engine, cold        : {cold_cost:8.2f} µs/call")
+    print(f"  engine, cached      : {cached:8.2f} µs/call  ({legacy / cached:.1f}x vs legacy)")
+    print(f"  cache: {compile_expression.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
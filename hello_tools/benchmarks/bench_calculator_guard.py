@@ -0,0 +1,103 @@
+"""
+Adversarial-input benchmark for the calculator cost guard.
+
+Sends pathological expressions through the calculator tool while a heartbeat
+task measures event-loop stalls, and reports per-input latency plus the worst
+case. Every input must come back (rejected or evaluated) well within budget,
+and the integer-growth inputs must be rejected; exits non-zero if one is not.
+
+Run from the hello_tools directory:
+    uv run python -m benchmarks.bench_calculator_guard
+"""
+
+import asyncio
+import json
+import sys
+import time
+
+from tools import calculator
+from tools.calculator_tools import CALCULATOR_TIMEOUT_SECONDS
+
+# Inputs that would pin a worker thread on big-integer work; the guard must reject them
+MUST_REJECT = [
+    "9**9**9",
+    "2**2**2**2**2",
+    "99999**99999",
+    "10**100000",
+    "(2**64)**64 * (2**64)**64",
+    "2**4000 * 2**4000",
+    "((-1) % 2**4000) ** 4000",
+    "((-1) % (((-1) % 2**4000) ** 4000)) ** 4000",
+    # Calls that keep an integer exact must not hide it from the guard
+    "abs(9)**9**9",
+    "abs(2)**(2**24)",
+    "abs(-3)**abs(5000)",
+    "abs(abs(99999))**99999",
+    "round(abs(7))**99999",
+    "floor(9)**9**9",
+    "abs(2**4000) * abs(2**4000)",
+    # round() with a huge negative ndigits computes 10**ndigits however small the number
+    "round(5, -10**7)",
+    "round(5, -5000)",
+]
+
+ADVERSARIAL = MUST_REJECT + [
+    "(" * 90 + "1" + ")" * 90,
+    "1" + " + 1" * 99,
+    "9" * 999,
+    "1" * 5000,
+    "square root of 9**9**9",
+    "0.5 ** -100000",
+    "10**1000 // 3 % 7",
+    "(-1)**(10**1000)",
+    "2.0 ** 10000",
+]
+
+BASELINE = ["5 + 5", "2 ** 10", "3 squared plus 4 squared"]
+
+
+async def heartbeat(interval: float, stalls: list[float], stop: asyncio.Event):
+    """Record how late the loop wakes us up; large values mean the loop was blocked."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        stalls.append(time.perf_counter() - start - interval)
+
+
+async def run_case(expression: str) -> tuple[float, str]:
+    start = time.perf_counter()
+    output = await calculator.on_invoke_tool(None, json.dumps({"expression": expression}))
+    return time.perf_counter() - start, output
+
+
+async def main():
+    stalls: list[float] = []
+    stop = asyncio.Event()
+    beat = asyncio.create_task(heartbeat(0.001, stalls, stop))
+
+    print("🛡️ Calculator cost guard benchmark")
+    print("=" * 70)
+    worst = 0.0
+    accepted = []
+    for expression in BASELINE + ADVERSARIAL:
+        elapsed, output = await run_case(expression)
+        worst = max(worst, elapsed)
+        if expression in MUST_REJECT and not output.startswith("Error"):
+            accepted.append(expression)
+        label = expression if len(expression) <= 28 else expression[:25] + "..."
+        print(f"{elapsed * 1000:8.2f} ms  {label:<28}  {output[:60]}")
+
+    stop.set()
+    await beat
+    print("=" * 70)
+    print(f"Worst-case tool latency : {worst * 1000:.2f} ms (budget {CALCULATOR_TIMEOUT_SECONDS * 1000:.0f} ms)")
+    print(f"Worst event-loop stall  : {max(stalls) * 1000:.2f} ms over {len(stalls)} heartbeats")
+    if accepted:
+        for expression in accepted:
+            print(f"❌ Not rejected: {expression}")
+        sys.exit(1)
+    print(f"✅ All {len(MUST_REJECT)} integer-growth inputs were rejected")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+"""
+Lookup benchmark for the gazetteer index at 10, 10k and 100k places.
+
+Compares the old exact-dict + linear partial-match scan with the sorted-key
+index for exact, contained ("weather in X today"), word ("york" for "new
+york"), prefix, fuzzy and missing queries, and reports index file size and
+load time. The word index is built on the first word query, outside the timing.
+
+Run from the hello_tools directory:
+    uv run python -m benchmarks.bench_gazetteer
+"""
+
+import os
+import random
+import tempfile
+import time
+
+from tools.gazetteer import Gazetteer
+
+SYLLABLES = "ka lo ma ri to sa ne vi ber lin mad par syd mum dub ton ham ville burg port".split()
+
+
+def make_places(rng: random.Random, count: int) -> list[str]:
+    places: set[str] = set()
+    while len(places) < count:
+        words = ["".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))) for _ in range(rng.randint(1, 2))]
+        places.add(" ".join(words))
+    return sorted(places)
+
+
+def legacy_lookup(data: dict[str, str], location: str) -> str | None:
+    """The old weather_fetcher matching: exact dict hit, else a linear partial-match scan."""
+    location_lower = location.lower()
+    if location_lower in data:
+        return data[location_lower]
+    for city, weather in data.items():
+        if city in location_lower or location_lower in city:
+            return weather
+    return None
+
+
+def per_lookup_us(fn, queries: list[str]) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        fn(query)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def main():
+    rng = random.Random(3)
+    print("🗺️ Gazetteer lookup benchmark (µs per lookup)")
+    print("=" * 78)
+    print(f"{'places':>8} {'query':<10} {'legacy scan':>12} {'index':>10}   {'file KB':>8} {'load ms':>8}")
+    for count in (10, 10_000, 100_000):
+        places = make_places(rng, count)
+        data = {place: "sunny" for place in places}
+        gazetteer = Gazetteer.from_entries((place, [], "") for place in places)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "places.gaz")
+            gazetteer.save(path)
+            size_kb = os.path.getsize(path) / 1e3
+            start = time.perf_counter()
+            gazetteer = Gazetteer.load(path)
+            load_ms = (time.perf_counter() - start) * 1000
+
+        sample = rng.sample(places, min(50, count))
+        queries = {
+            "exact": sample,
+            "contained": [f"weather in {place} today" for place in sample],
+            "word": [place.split(" ")[-1] for place in sample if " " in place],
+            "prefix": [place[: max(3, len(place) - 2)] for place in sample],
+            "fuzzy": [place[:2] + place[3:] for place in sample if len(place) > 6],
+            "missing": ["qqqq zzzz"] * len(sample),
+        }
+        gazetteer.lookup("warm up the word index")
+        for kind, batch in queries.items():
+            legacy = per_lookup_us(lambda query: legacy_lookup(data, query), batch)
+            indexed = per_lookup_us(gazetteer.lookup, batch)
+            extra = f"   {size_kb:8.1f} {load_ms:8.1f}" if kind == "exact" else ""
+            print(f"{count:>8} {kind:<10} {legacy:12.1f} {indexed:10.1f}{extra}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Overhead of per-tool instrumentation on a tool call.
+
+Invokes the same tools many times through ``on_invoke_tool``, bare and wrapped
+by ``tools.instrumentation.instrument``, and reports the added cost per call:
+for a bare FunctionTool that does nothing (the pure recording cost) and for a
+``@function_tool`` tool (argument parsing and validation included, the
+smallest realistic tool). Exits non-zero if the added cost exceeds
+``--max-overhead-us``, so it stays cheap enough to leave on.
+
+Run from the hello_tools directory:
+    uv run python -m benchmarks.bench_instrumentation
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from agents import FunctionTool, function_tool
+from agents.tool_context import ToolContext
+
+from tools import instrumentation
+
+
+def make_tools() -> dict[str, FunctionTool]:
+    async def noop(ctx, input: str) -> str:
+        return "ok"
+
+    @function_tool
+    def echo(text: str) -> str:
+        """Echo the text back."""
+        return text
+
+    return {
+        "no-op FunctionTool": FunctionTool(
+            name="noop", description="Does nothing.", params_json_schema={"type": "object", "properties": {}},
+            on_invoke_tool=noop,
+        ),
+        "@function_tool echo": echo,
+    }
+
+
+async def per_call(tool: FunctionTool, arguments: str, calls: int) -> float:
+    """Best-of-5 seconds per call of ``tool.on_invoke_tool``."""
+    ctx = ToolContext(context=None, tool_name=tool.name, tool_call_id="call_bench", tool_arguments=arguments)
+    invoke = tool.on_invoke_tool
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(calls):
+            await invoke(ctx, arguments)
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--max-overhead-us", type=float, default=10.0, help="fail if instrumentation adds more per call")
+    args = parser.parse_args()
+
+    print(f"📊 Instrumentation overhead (best of 5 x {args.calls} calls)")
+    print("=" * 72)
+    print(f"  {'tool':<22} {'bare':>10} {'instrumented':>14} {'added':>10} {'relative':>9}")
+    worst = 0.0
+    arguments = '{"text": "hello"}'
+    for label, tool in make_tools().items():
+        bare = await per_call(tool, arguments, args.calls)
+        instrumented = await per_call(instrumentation.instrument(tool), arguments, args.calls)
+        added = instrumented - bare
+        worst = max(worst, added)
+        print(
+            f"  {label:<22} {bare * 1e6:>8.2f}µs {instrumented * 1e6:>12.2f}µs"
+            f" {added * 1e6:>8.2f}µs {added / bare:>8.0%}"
+        )
+
+    print("-" * 72)
+    if worst * 1e6 > args.max_overhead_us:
+        print(f"❌ Instrumentation adds {worst * 1e6:.2f} µs per call (budget {args.max_overhead_us:.1f} µs)")
+        sys.exit(1)
+    print(f"✅ Instrumentation adds at most {worst * 1e6:.2f} µs per call (budget {args.max_overhead_us:.1f} µs)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
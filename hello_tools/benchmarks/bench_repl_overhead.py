@@ -0,0 +1,122 @@
+"""
+Per-turn overhead of the interactive loop: run_sync per turn vs one async session.
+
+A local chat-completions stand-in answers every model request after a fixed
+delay, so whatever a turn costs beyond that delay is loop and client overhead.
+Compares the old REPL pattern (``Runner.run_sync`` for every turn) with the
+async REPL (one loop and one pooled client, ``await Runner.run`` per turn),
+then times several background requests in flight together.
+
+The two come out within noise of each other: ``run_sync`` reuses the default
+loop and the agent's client, so the async REPL saves no measurable per-turn
+overhead. What it adds is cancellation and requests running in the background.
+
+Run from the hello_tools directory:
+    uv run python -m benchmarks.bench_repl_overhead
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import warnings
+
+from agents import Agent, AsyncOpenAI, OpenAIChatCompletionsModel, Runner, set_tracing_disabled
+
+from benchmarks.standin import start_json_server
+
+UPSTREAM_LATENCY = 0.02
+
+
+def respond(path: str, params: dict) -> dict:
+    """Answer POST /chat/completions with a short assistant message."""
+    return {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion",
+        "created": 0,
+        "model": params.get("model", "stand-in"),
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": "Hello!"}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+    }
+
+
+def make_agent(client: AsyncOpenAI) -> Agent:
+    model = OpenAIChatCompletionsModel(openai_client=client, model="stand-in")
+    return Agent(name="Assistant", model=model)
+
+
+def report(label: str, samples: list[float]):
+    mean = statistics.mean(samples)
+    overhead = mean - UPSTREAM_LATENCY
+    print(
+        f"  {label:<34} mean {mean * 1000:6.1f} ms  p50 {statistics.median(samples) * 1000:6.1f} ms"
+        f"  overhead {overhead * 1000:6.1f} ms/turn"
+    )
+    return overhead
+
+
+def run_sync_turns(base_url: str, turns: int) -> list[float]:
+    agent = make_agent(AsyncOpenAI(base_url=base_url, api_key="benchmark"))
+    samples = []
+    for i in range(turns):
+        start = time.perf_counter()
+        Runner.run_sync(agent, f"question {i}")
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def session_turns(base_url: str, turns: int) -> list[float]:
+    client = AsyncOpenAI(base_url=base_url, api_key="benchmark")
+    agent = make_agent(client)
+    samples = []
+    for i in range(turns):
+        start = time.perf_counter()
+        await Runner.run(agent, f"question {i}")
+        samples.append(time.perf_counter() - start)
+    await client.close()
+    return samples
+
+
+async def in_flight(base_url: str, requests: int) -> float:
+    """Wall time for ``requests`` background requests in flight together in one session."""
+    client = AsyncOpenAI(base_url=base_url, api_key="benchmark")
+    agent = make_agent(client)
+    start = time.perf_counter()
+    await asyncio.gather(*(Runner.run(agent, f"question {i}") for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    await client.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=30)
+    parser.add_argument("--in-flight", type=int, default=5, help="background requests run together")
+    args = parser.parse_args()
+    set_tracing_disabled(True)
+    warnings.simplefilter("ignore", DeprecationWarning)  # run_sync's get_event_loop() on newer Pythons
+
+    server = start_json_server(respond, UPSTREAM_LATENCY)
+    base_url = f"{server.url}/v1"
+    # run_sync needs the implicit default loop, which asyncio.run() unsets, so it goes first;
+    # its first turn is untimed so imports and first-use setup are not counted
+    sync_samples = run_sync_turns(base_url, args.turns + 1)[1:]
+    asyncio.run(session_turns(base_url, 1))
+
+    print(f"🔁 REPL turn overhead ({args.turns} turns, stand-in latency {UPSTREAM_LATENCY * 1000:.0f} ms)")
+    print("=" * 86)
+    sync_overhead = report("Runner.run_sync per turn (old)", sync_samples)
+    async_overhead = report("one loop, pooled client (async)", asyncio.run(session_turns(base_url, args.turns)))
+    print("-" * 86)
+    # Expect about zero, either sign: differences under a millisecond are run-to-run noise
+    print(f"  Saved per turn vs run_sync: {(sync_overhead - async_overhead) * 1000:.1f} ms")
+    wall = asyncio.run(in_flight(base_url, args.in_flight))
+    print(
+        f"  {args.in_flight} requests in flight together: {wall * 1000:.0f} ms "
+        f"(one at a time: ~{args.in_flight * (UPSTREAM_LATENCY + async_overhead) * 1000:.0f} ms)"
+    )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
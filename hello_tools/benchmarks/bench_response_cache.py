@@ -0,0 +1,174 @@
+"""
+Hit rate, wrong-answer rate and latency of the semantic response cache.
+
+Replays a workload of paraphrased questions ("weather in london", "London
+weather?") mixed with near misses that must not share an answer ("weather in
+paris", "15% of 90"). Each question is looked up first and, on a miss, stored
+with its group as the answer, so a hit from another group is a wrong answer.
+This is repeated over a range of similarity thresholds, then end to end
+through a scripted model, and the lookup cost is timed against index size.
+Exits non-zero if a question that asks something else (another question word,
+a negation, swapped roles, one changed word in a pasted text) gets a cached
+answer at the default threshold.
+
+Run from the hello_tools directory:
+    uv run python -m benchmarks.bench_response_cache
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+import time
+
+from agents import Agent, Runner, set_tracing_disabled
+
+from benchmarks.scripted_model import ScriptedModel
+from response_cache import ResponseCache
+
+# A pasted text to summarize; one changed word reverses what the summary must say
+REPORT = (
+    "Summarize this text: The company reported that revenue grew by twelve percent in the third quarter, "
+    "driven by strong demand for its cloud services and new enterprise contracts. Management said margins "
+    "improved as costs were held flat, and the board expects continued growth through the end of the year "
+    "while investing in research."
+)
+
+# Questions in the same group have the same answer
+GROUPS = {
+    "weather-london": ["weather in london", "London weather?", "What's the weather in London?", "london weather please"],
+    "weather-paris": ["weather in paris", "Paris weather?", "what's the weather like in Paris"],
+    "weather-tokyo": ["weather in tokyo", "Tokyo weather"],
+    "percent-80": ["what is 15% of 80", "15% of 80?", "calculate 15% of 80"],
+    "percent-90": ["what is 15% of 90", "15% of 90"],
+    "power": ["what is 2^10", "2^10?"],
+    "product": ["what is 2*10", "2*10"],
+    "hamlet": ["who wrote hamlet", "Who wrote Hamlet?", "hamlet was written by who"],
+    "macbeth": ["who wrote macbeth", "Who wrote Macbeth?"],
+    "news-openai": ["latest news about openai", "OpenAI latest news", "what's the latest news on OpenAI"],
+    "news-google": ["latest news about google", "Google latest news"],
+    "summarize": ["summarize the history of the roman empire", "Summarize the history of the Roman Empire"],
+    "capital-france": ["capital of france", "What is the capital of France?"],
+    "capital-spain": ["capital of spain", "what is the capital of spain"],
+    # Same words in another order
+    "usd-to-eur": ["convert 10 usd to eur", "10 usd to eur"],
+    "eur-to-usd": ["convert 10 eur to usd"],
+    # Same words, another question word or a negation
+    "einstein-when": ["when was einstein born", "When was Einstein born?"],
+    "einstein-where": ["where was einstein born"],
+    "einstein-who": ["who was einstein born"],
+    "chicken-safe": ["is it safe to eat raw chicken", "Is it safe to eat raw chicken?"],
+    "chicken-not-safe": ["is it not safe to eat raw chicken", "isn't it safe to eat raw chicken"],
+    # A long text only hits on the same words
+    "report": [REPORT, REPORT.lower().replace(". ", ".  ")],
+}
+# (cached question, query) pairs that ask different things and must never share an answer
+MUST_NOT_MATCH = [
+    ("when was einstein born", "where was einstein born"),
+    ("when was einstein born", "who was einstein born"),
+    ("where is the eiffel tower", "why is the eiffel tower"),
+    ("how was the roman empire founded", "when was the roman empire founded"),
+    ("is it safe to eat raw chicken", "is it not safe to eat raw chicken"),
+    ("is it safe to eat raw chicken", "isn't it safe to eat raw chicken"),
+    ("do cats eat chocolate", "do cats never eat chocolate"),
+    ("did germany beat brazil in 2014", "did brazil beat germany in 2014"),
+    (REPORT, REPORT.replace("grew", "fell")),
+    (REPORT, REPORT.replace("expects continued growth", "expects a decline")),
+]
+THRESHOLDS = [0.8, 0.85, 0.9, 0.95]
+MODEL_LATENCY = 0.2
+
+
+def workload(seed: int = 7) -> list[tuple[str, str]]:
+    """Every (question, group) pair, shuffled so paraphrases arrive in random order."""
+    items = [(question, group) for group, questions in GROUPS.items() for question in questions]
+    random.Random(seed).shuffle(items)
+    return items
+
+
+def replay(cache: ResponseCache, items: list[tuple[str, str]]) -> tuple[int, int]:
+    """Look up then store each question; returns (hits, wrong answers)."""
+    hits = wrong = 0
+    for question, group in items:
+        hit = cache.lookup(question)
+        if hit is None:
+            cache.store(question, group, used_tools=False)
+        else:
+            hits += 1
+            wrong += hit.answer != group
+    return hits, wrong
+
+
+async def end_to_end(items: list[tuple[str, str]], use_cache: bool) -> list[float]:
+    """Per-question latency through a scripted model, with or without the cache in front."""
+    agent = Agent(name="Assistant", model=ScriptedModel([], latency=MODEL_LATENCY, final_output="answer"))
+    cache = ResponseCache()
+    samples = []
+    for question, _ in items:
+        start = time.perf_counter()
+        if not use_cache or cache.lookup(question) is None:
+            result = await Runner.run(agent, question)
+            if use_cache:
+                cache.store(question, str(result.final_output), used_tools=False, seconds=time.perf_counter() - start)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def false_matches() -> list[tuple[str, str, float]]:
+    """The MUST_NOT_MATCH pairs the default cache answers anyway, with their similarity."""
+    matches = []
+    for cached, query in MUST_NOT_MATCH:
+        cache = ResponseCache()
+        cache.store(cached, cached, used_tools=False)
+        hit = cache.lookup(query)
+        if hit is not None:
+            matches.append((cached, query, hit.similarity))
+    return matches
+
+
+def lookup_cost(entries: int, lookups: int = 500) -> float:
+    """Mean lookup time in milliseconds with ``entries`` questions cached."""
+    cache = ResponseCache(capacity=entries)
+    for i in range(entries):
+        cache.store(f"question number {i} about topic {i % 97} and detail {i % 13}", "answer", used_tools=False)
+    start = time.perf_counter()
+    for i in range(lookups):
+        cache.lookup(f"a question about topic {i}")
+    return (time.perf_counter() - start) / lookups * 1000
+
+
+async def main():
+    set_tracing_disabled(True)
+    items = workload()
+    repeats = len(items) - len(GROUPS)
+    print(f"💾 Response cache benchmark ({len(items)} questions, {len(GROUPS)} answers, {repeats} paraphrased repeats)")
+    print("=" * 64)
+    print(f"  {'threshold':>9} {'hits':>6} {'of repeats':>11} {'wrong answers':>14}")
+    for threshold in THRESHOLDS:
+        hits, wrong = replay(ResponseCache(threshold=threshold), items)
+        print(f"  {threshold:>9.2f} {hits:>6} {hits / repeats:>10.0%} {wrong:>14}")
+
+    print("-" * 64)
+    baseline = await end_to_end(items, use_cache=False)
+    cached = await end_to_end(items, use_cache=True)
+    print(f"  End to end, scripted model ({MODEL_LATENCY * 1000:.0f} ms per call), default threshold:")
+    print(f"    without cache: {sum(baseline):6.2f} s total, {statistics.mean(baseline) * 1000:6.1f} ms mean")
+    print(f"    with cache:    {sum(cached):6.2f} s total, {statistics.mean(cached) * 1000:6.1f} ms mean")
+
+    print("-" * 64)
+    for entries in (512, 4096):
+        print(f"  Lookup with {entries:>5} entries: {lookup_cost(entries):.3f} ms")
+
+    print("-" * 64)
+    _, wrong = replay(ResponseCache(), items)
+    matches = false_matches()
+    for cached, query, similarity in matches:
+        print(f"  ❌ {query[:48]!r} answered from {cached[:48]!r} (similarity {similarity:.2f})")
+    if wrong or matches:
+        print(f"❌ {wrong} wrong answers in the workload, {len(matches)}/{len(MUST_NOT_MATCH)} different questions matched")
+        sys.exit(1)
+    print(f"✅ No wrong answers; none of the {len(MUST_NOT_MATCH)} different questions matched")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+"""
+Size benchmark for web_search result compaction.
+
+Feeds Tavily-shaped responses (with duplicate hits and long page content)
+through compact_results and reports bytes/tokens before and after, plus the
+per-call compaction cost.
+
+Run from the hello_tools directory:
+    uv run python -m benchmarks.bench_search_compaction
+"""
+
+import random
+import time
+
+from tools.search_compaction import compact_results, reports
+
+WORDS = "agents tools models latency tokens cache search results context window stream handoff".split()
+
+
+def make_response(rng: random.Random, query: str, hits: int) -> dict:
+    results = []
+    for i in range(hits):
+        # Every fourth hit repeats an earlier URL with tracking noise, as aggregators often do
+        url = f"https://www.example{i % 4 if i % 4 == 3 else i}.com/article/{i % 4 if i % 4 == 3 else i}/"
+        content = " ".join(rng.choices(WORDS, k=rng.randint(150, 900)))
+        results.append({
+            "title": f"{query.title()} explained, part {i}",
+            "url": url,
+            "content": content,
+            "score": rng.random(),
+            "raw_content": None,
+        })
+    return {
+        "query": query,
+        "follow_up_questions": None,
+        "answer": None,
+        "images": [],
+        "results": results,
+        "response_time": 1.42,
+    }
+
+
+def main():
+    rng = random.Random(5)
+    queries = ["openai agents sdk", "python asyncio cancellation", "gemini function calling"]
+    print("✂️ web_search compaction benchmark")
+    print("=" * 92)
+    for query in queries:
+        for hits in (5, 10, 20):
+            compact_results(make_response(rng, query, hits), query)
+            print(f"  {reports[-1]}")
+
+    # Providers send null titles and page-long titles; both must stay inside the budget
+    odd = make_response(rng, "odd titles", 10)
+    odd["results"][0]["title"] = None
+    odd["results"][1]["title"] = " ".join(rng.choices(WORDS, k=120))
+    compact_results(odd, "odd titles")
+    print(f"  {reports[-1]}")
+
+    response = make_response(rng, "timing", 10)
+    runs = 500
+    start = time.perf_counter()
+    for _ in range(runs):
+        compact_results(response, "timing")
+    print("=" * 92)
+    print(f"Compaction cost: {(time.perf_counter() - start) / runs * 1e6:.0f} µs per call")
+
+
+if __name__ == "__main__":
+    main()
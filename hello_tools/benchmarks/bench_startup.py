@@ -0,0 +1,117 @@
+"""
+Cold-start benchmark: import time of the tool package and time to first prompt.
+
+Every measurement runs in a fresh interpreter. Compares importing every tool
+implementation up front (what ``tools/__init__.py`` used to do) with the lazy
+package and registry, then times ``main.py`` from process start until the
+interactive prompt appears. Exits non-zero if the prompt takes longer than
+``--max-startup-ms`` or if building the agent imported a tool implementation,
+so a regression in startup cost is caught.
+
+Run from the hello_tools directory:
+    uv run python -m benchmarks.bench_startup
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Clients are only constructed, never called, so a placeholder key is enough
+ENV = {**os.environ, "GEMINI_API_KEY": os.getenv("GEMINI_API_KEY") or "benchmark"}
+
+TIMED = "import time; _start = time.perf_counter(); {code}; print((time.perf_counter() - _start) * 1000)"
+
+IMPORT_CASES = {
+    "agents SDK": "import agents",
+    "eager (all tool modules)": "import tools; [tools.load_tool(name) for name in tools.TOOL_MODULES]",
+    "lazy package": "import tools",
+    "lazy registry + schemas": "from tools.registry import get_tools; get_tools()",
+}
+
+# Modules that must not be imported just to build the agent and show the prompt
+DEFERRED_MODULES = ["numpy", "tools.calculator_tools", "tools.summarizer_tools", "tools.weather_tools", "tools.search_tools"]
+
+
+def time_import(code: str, runs: int) -> float:
+    """Median in-process import time in milliseconds, one fresh interpreter per run."""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMED.format(code=code)], cwd=HERE, env=ENV, capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def time_first_prompt(runs: int) -> float:
+    """Median wall time in milliseconds from launching main.py until it asks for input."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-u", "main.py"],
+            cwd=HERE,
+            env=ENV,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        seen = ""
+        while "You:" not in seen:
+            char = process.stdout.read(1)
+            if not char:
+                raise RuntimeError("main.py exited before showing a prompt")
+            seen += char
+        samples.append((time.perf_counter() - start) * 1000)
+        process.communicate("quit\n")
+    return statistics.median(samples)
+
+
+def deferred_modules_loaded() -> list[str]:
+    """Modules from DEFERRED_MODULES that building the agent pulled in anyway."""
+    code = (
+        "import sys, main; main.get_agent(); "
+        f"print(','.join(name for name in {DEFERRED_MODULES!r} if name in sys.modules))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], cwd=HERE, env=ENV, capture_output=True, text=True, check=True).stdout
+    return [name for name in output.strip().split(",") if name]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-startup-ms", type=float, default=1000.0, help="fail if the first prompt is slower")
+    args = parser.parse_args()
+
+    print(f"🚀 Startup benchmark (median of {args.runs} fresh interpreters)")
+    print("=" * 60)
+    for label, code in IMPORT_CASES.items():
+        print(f"  {label:<26} {time_import(code, args.runs):8.1f} ms")
+
+    prompt_ms = time_first_prompt(args.runs)
+    print(f"  {'main.py to first prompt':<26} {prompt_ms:8.1f} ms")
+
+    loaded = deferred_modules_loaded()
+    print("-" * 60)
+    failed = False
+    if loaded:
+        print(f"❌ Building the agent imported: {', '.join(loaded)}")
+        failed = True
+    else:
+        print("✅ Building the agent imported no tool implementations")
+    if prompt_ms > args.max_startup_ms:
+        print(f"❌ First prompt took {prompt_ms:.0f} ms (budget {args.max_startup_ms:.0f} ms)")
+        failed = True
+    else:
+        print(f"✅ First prompt within budget ({args.max_startup_ms:.0f} ms)")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
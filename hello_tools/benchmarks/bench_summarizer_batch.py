@@ -0,0 +1,43 @@
+"""
+Benchmark for multi-document batch summarization.
+
+Summarizes the same batch (TF-IDF) serially and across the process pool (large
+documents shared via shared memory) and reports per-batch wall time and
+speedup.
+
+Run from the hello_tools directory:
+    uv run python -m benchmarks.bench_summarizer_batch [documents] [sentences_per_document]
+"""
+
+import asyncio
+import os
+import random
+import sys
+
+from benchmarks.bench_summarizer_tfidf import make_document
+from tools.batch_summarizer import summarize_batch
+
+
+async def main():
+    documents = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    sentences = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    rng = random.Random(11)
+    texts = [make_document(rng, sentences) for _ in range(documents)]
+    total_mb = sum(len(text) for text in texts) / 1e6
+
+    # Warm the pool so worker start-up is not billed to the first batch
+    await summarize_batch(texts[:2], method="tfidf", parallel=True)
+
+    serial, serial_time = await summarize_batch(texts, method="tfidf", parallel=False)
+    parallel, parallel_time = await summarize_batch(texts, method="tfidf", parallel=True)
+    assert serial == parallel, "parallel summaries differ from serial ones"
+
+    print(f"📚 Batch summarization: {documents} documents, {total_mb:.1f} MB, {os.cpu_count()} CPUs")
+    print("=" * 60)
+    print(f"  serial (one thread)      : {serial_time * 1000:9.1f} ms")
+    print(f"  process pool + shm       : {parallel_time * 1000:9.1f} ms")
+    print(f"  speedup                  : {serial_time / parallel_time:9.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
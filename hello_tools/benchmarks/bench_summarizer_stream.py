@@ -0,0 +1,64 @@
+"""
+Benchmark for streaming, memory-mapped summarization of large files.
+
+Writes a large synthetic document, then compares reading it into memory and
+summarizing the string (the old path) with summarize_file, which memory-maps
+the file and stops segmenting once the summary budget is full. The document is
+written twice, with sentences ending in ". " and in ".\n".
+
+Run from the hello_tools directory:
+    uv run python -m benchmarks.bench_summarizer_stream [size_mb]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from tools.summarizer_tools import summarize_file, summarize_text
+
+SENTENCE = "Agents call tools to act on the world and report back what they found."
+ENDINGS = {"space": " ", "newline": "\n"}
+
+
+def measure(fn, *args) -> tuple[float, float, str]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6, result
+
+
+def read_then_summarize(path: str, max_length: int) -> str:
+    with open(path, encoding="utf-8") as f:
+        return summarize_text(f.read(), max_length)
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, ending in ENDINGS.items():
+            path = os.path.join(tmp, f"large-{name}.txt")
+            block = (SENTENCE + ending) * (1_000_000 // (len(SENTENCE) + 1))
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                for _ in range(size_mb):
+                    f.write(block)
+
+            print(f"📝 Streaming summarizer benchmark ({os.path.getsize(path) / 1e6:.0f} MB file, {ending!r} endings)")
+            print("=" * 60)
+            for max_length in (150, 2000):
+                in_memory = measure(read_then_summarize, path, max_length)
+                streamed = measure(summarize_file, path, max_length)
+                assert in_memory[2] == streamed[2], "streaming changed the summary"
+                print(f"max_length={max_length}")
+                print(f"  read + summarize : {in_memory[0] * 1000:9.2f} ms, peak {in_memory[1]:8.2f} MB")
+                print(f"  mmap + streaming : {streamed[0] * 1000:9.2f} ms, peak {streamed[1]:8.2f} MB")
+                print(f"  summary          : {streamed[2][:60]}")
+            print()
+
+
+if __name__ == "__main__":
+    main()
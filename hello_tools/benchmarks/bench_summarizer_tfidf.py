@@ -0,0 +1,54 @@
+"""
+Throughput benchmark for the TF-IDF extractive summarizer.
+
+Summarizes a synthetic corpus with the leading-sentence path and the TF-IDF
+centrality path and reports documents/sec and MB/sec for each.
+
+Run from the hello_tools directory:
+    uv run python -m benchmarks.bench_summarizer_tfidf
+"""
+
+import random
+import time
+
+from tools.summarizer_tools import summarize_text
+
+WORDS = (
+    "agent tool model runner handoff guardrail prompt token context memory search weather "
+    "calculator summary stream latency cache batch python async loop result query answer "
+    "research science history network data vector index score rank budget cost speed"
+).split()
+
+
+def make_document(rng: random.Random, sentences: int) -> str:
+    parts = []
+    for _ in range(sentences):
+        words = rng.choices(WORDS, k=rng.randint(6, 20))
+        parts.append(" ".join(words).capitalize() + rng.choice([".", ".", ".", "!", "?"]))
+    return " ".join(parts)
+
+
+def throughput(documents: list[str], method: str, max_length: int) -> tuple[float, float]:
+    total_mb = sum(len(document) for document in documents) / 1e6
+    start = time.perf_counter()
+    for document in documents:
+        summarize_text(document, max_length, method)
+    elapsed = time.perf_counter() - start
+    return len(documents) / elapsed, total_mb / elapsed
+
+
+def main():
+    rng = random.Random(7)
+    print("📝 Summarizer throughput: leading sentences vs TF-IDF centrality")
+    print("=" * 66)
+    for sentences, count in ((20, 2000), (200, 300), (2000, 30)):
+        documents = [make_document(rng, sentences) for _ in range(count)]
+        avg_kb = sum(len(document) for document in documents) / count / 1e3
+        print(f"{count} docs x {sentences} sentences (~{avg_kb:.1f} KB each)")
+        for method in ("lead", "tfidf"):
+            docs_per_sec, mb_per_sec = throughput(documents, method, 300)
+            print(f"  {method:<5}: {docs_per_sec:10.1f} docs/s  {mb_per_sec:8.2f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Event-loop latency and throughput with many concurrent runs calling CPU-heavy tools.
+
+Each simulated run calls ``text_summarizer`` (TF-IDF) several times. The same
+workload is driven three ways: the sync function called inline on the event
+loop (how ``@function_tool`` runs a plain sync tool), and through the tool's
+executor in thread and in process mode. A ticker task measures how late the
+loop wakes up while the runs are in flight.
+
+Run from the hello_tools directory:
+    uv run python -m benchmarks.bench_tool_executor [runs] [calls_per_run] [sentences]
+"""
+
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+
+from benchmarks.bench_summarizer_tfidf import make_document
+from tools import text_summarizer
+from tools.executor import executors
+from tools.summarizer_tools import summarize_text
+
+TICK_SECONDS = 0.005
+
+
+async def measure_lag(stop: asyncio.Event, lags: list[float]) -> None:
+    """Record how much later than requested each short sleep returns."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(time.perf_counter() - start - TICK_SECONDS)
+
+
+async def inline_call(document: str) -> str:
+    return summarize_text(document, 200, "tfidf")
+
+
+async def executor_call(document: str) -> str:
+    return await text_summarizer.on_invoke_tool(None, json.dumps({"text": document, "max_length": 200, "method": "tfidf"}))
+
+
+async def drive(call, documents: list[str], runs: int, calls_per_run: int) -> tuple[float, list[float]]:
+    """Run ``runs`` concurrent sessions of ``calls_per_run`` tool calls; return wall time and loop lags."""
+
+    async def session(offset: int) -> None:
+        for i in range(calls_per_run):
+            await call(documents[(offset + i) % len(documents)])
+            await asyncio.sleep(0)  # the model's next turn would go here
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(measure_lag(stop, lags))
+    await asyncio.sleep(TICK_SECONDS * 2)
+    start = time.perf_counter()
+    await asyncio.gather(*(session(run) for run in range(runs)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    return elapsed, lags
+
+
+def report(label: str, elapsed: float, lags: list[float], calls: int) -> None:
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(
+        f"  {label:<18} {calls / elapsed:8.1f} calls/s   loop lag: "
+        f"median {statistics.median(lags_ms):7.1f} ms, p99 {p99:7.1f} ms, max {lags_ms[-1]:7.1f} ms"
+    )
+
+
+async def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    calls_per_run = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    sentences = int(sys.argv[3]) if len(sys.argv) > 3 else 400
+    rng = random.Random(5)
+    documents = [make_document(rng, sentences) for _ in range(16)]
+    calls = runs * calls_per_run
+    executor = executors["text_summarizer"]
+
+    print(f"⚙️ {runs} concurrent runs x {calls_per_run} text_summarizer calls ({sentences} sentences each)")
+    print("=" * 90)
+
+    elapsed, lags = await drive(inline_call, documents, runs, calls_per_run)
+    report("inline (sync)", elapsed, lags, calls)
+
+    for kind in ("thread", "process"):
+        executor.configure(kind=kind, timeout=600.0)
+        await executor_call(documents[0])  # start the pool outside the timed section
+        elapsed, lags = await drive(executor_call, documents, runs, calls_per_run)
+        report(f"{kind} executor", elapsed, lags, calls)
+        print(f"  {'':<18} {executor.stats()}")
+
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""
+Benchmark for the async weather provider against a local stand-in server.
+
+Starts an OpenWeatherMap-compatible HTTP server on localhost with artificial
+latency, then fires waves of concurrent weather_fetcher-style requests and
+reports wall time, cache hit rate, coalesced calls and upstream call counts.
+
+Run from the hello_tools directory:
+    uv run python -m benchmarks.bench_weather_provider
+"""
+
+import asyncio
+import time
+
+from benchmarks.standin import start_json_server
+from tools.weather_provider import WeatherProvider
+
+UPSTREAM_LATENCY = 0.05
+CITIES = ["london", "paris", "tokyo", "new york", "sydney"]
+
+
+def respond(path: str, params: dict) -> dict:
+    """Answer GET /weather?q=<city> like OpenWeatherMap."""
+    return {
+        "name": params.get("q", "unknown"),
+        "weather": [{"description": "scattered clouds"}],
+        "main": {"temp": 18.0, "humidity": 60},
+        "wind": {"speed": 3.5},
+    }
+
+
+async def wave(provider: WeatherProvider, requests: int) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(provider.get(CITIES[i % len(CITIES)]) for i in range(requests)))
+    return time.perf_counter() - start
+
+
+async def main():
+    server = start_json_server(respond, UPSTREAM_LATENCY)
+    provider = WeatherProvider(base_url=server.url, ttl=60)
+
+    print(f"🌤️ Weather provider benchmark (upstream latency {UPSTREAM_LATENCY * 1000:.0f} ms)")
+    print("=" * 64)
+    for label, requests in (("cold burst", 200), ("warm burst", 200), ("warm burst", 1000)):
+        elapsed = await wave(provider, requests)
+        stats = provider.stats()
+        print(
+            f"{label:<11} {requests:5d} requests in {elapsed * 1000:7.1f} ms | "
+            f"upstream {stats['upstream_calls']:3d}, coalesced {stats['coalesced']:4d}, "
+            f"hit rate {stats['hit_rate']:.1%}"
+        )
+    print(f"Stand-in server saw {server.requests} requests "
+          f"(naive: {200 + 200 + 1000})")
+
+    await provider.aclose()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+"""
+Offline benchmark for the async, cached web_search client.
+
+Runs a local Tavily stand-in endpoint with artificial latency and measures:
+the old blocking pattern (one synchronous request at a time), cold and warm
+async searches, concurrent throughput with duplicate queries, and SQLite cache
+hits after a simulated restart.
+
+Run from the hello_tools directory:
+    uv run python -m benchmarks.bench_web_search
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.standin import start_json_server
+from tools.search_client import SearchClient
+
+UPSTREAM_LATENCY = 0.12
+QUERIES = [f"openai agents sdk topic {i}" for i in range(20)]
+
+
+def respond(path: str, params: dict) -> dict:
+    """Answer POST /search like Tavily."""
+    query = params.get("query", "")
+    return {
+        "query": query,
+        "results": [
+            {"title": f"Result {i} for {query}", "url": f"https://example.com/{i}", "content": "lorem ipsum " * 40, "score": 1 / (i + 1)}
+            for i in range(5)
+        ],
+        "response_time": UPSTREAM_LATENCY,
+    }
+
+
+async def timed(coro) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = await coro
+    return time.perf_counter() - start, result
+
+
+async def main():
+    server = start_json_server(respond, UPSTREAM_LATENCY)
+    print(f"🔍 web_search benchmark (stand-in latency {UPSTREAM_LATENCY * 1000:.0f} ms, {len(QUERIES)} distinct queries)")
+    print("=" * 72)
+
+    # Old pattern: a blocking client called once per query, one after another
+    start = time.perf_counter()
+    with httpx.Client(base_url=server.url) as client:
+        for query in QUERIES:
+            client.post("/search", json={"query": query})
+    blocking = time.perf_counter() - start
+    print(f"blocking, sequential          : {blocking * 1000:8.1f} ms ({len(QUERIES) / blocking:6.1f} q/s)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "search.sqlite")
+        client = SearchClient(api_key=None, base_url=server.url, disk_cache_path=cache_path)
+
+        # 10 concurrent agents each issuing all 20 queries (with different casing/spacing)
+        requests = [f"  {query.upper()}?" if i % 2 else query for i in range(10) for query in QUERIES]
+        elapsed, _ = await timed(asyncio.gather(*(client.search(query) for query in requests)))
+        print(f"async, cold, {len(requests)} concurrent    : {elapsed * 1000:8.1f} ms ({len(requests) / elapsed:6.1f} q/s)")
+
+        elapsed, _ = await timed(asyncio.gather(*(client.search(query) for query in requests)))
+        print(f"async, warm (memory cache)    : {elapsed * 1000:8.1f} ms ({len(requests) / elapsed:6.0f} q/s)")
+        stats = client.stats()
+        print(f"  upstream calls {stats['upstream_calls']}, coalesced {stats['coalesced']}, hit rate {stats['hit_rate']:.1%}")
+        await client.aclose()
+
+        # Simulated restart: fresh process state, same SQLite file
+        restarted = SearchClient(api_key=None, base_url=server.url, disk_cache_path=cache_path)
+        elapsed, _ = await timed(asyncio.gather(*(restarted.search(query) for query in QUERIES)))
+        stats = restarted.stats()
+        print(f"after restart (SQLite cache)  : {elapsed * 1000:8.1f} ms, disk hits {stats['disk_hits']}, upstream {stats['upstream_calls']}")
+        await restarted.aclose()
+
+    print(f"Stand-in endpoint saw {server.requests} requests in total")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,92 @@
+"""
+A scripted stand-in for the LLM, for offline agent benchmarks.
+
+``ScriptedModel`` plays back a fixed plan of tool calls, one model turn at a
+time, sleeping ``latency`` seconds per turn to stand in for the network and
+generation time of a real model round trip. Once every planned call has a
+result in the conversation it answers with a final message. Round trips and
+(estimated) token usage are counted so benchmarks can compare strategies.
+"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator
+
+from agents import ModelResponse, Usage
+from agents.models.interface import Model
+from openai.types.responses import ResponseFunctionToolCall, ResponseOutputMessage, ResponseOutputText
+
+# One planned tool call: (tool name, arguments)
+ToolCall = tuple[str, dict[str, Any]]
+
+
+def _estimate_tokens(value: Any) -> int:
+    return max(1, len(value if isinstance(value, str) else json.dumps(value, default=str)) // 4)
+
+
+class ScriptedModel(Model):
+    """Replays ``turns`` (each a list of tool calls issued together), then a final answer."""
+
+    def __init__(self, turns: list[list[ToolCall]], latency: float = 0.3, final_output: str = "Done."):
+        self.turns = turns
+        self.latency = latency
+        self.final_output = final_output
+        self.round_trips = 0
+
+    def _next_turn(self, input: str | list[Any]) -> list[ToolCall]:
+        """The planned calls not answered yet in ``input``, as the next turn (empty when finished)."""
+        answered = 0 if isinstance(input, str) else sum(
+            1 for item in input if isinstance(item, dict) and item.get("type") == "function_call_output"
+        )
+        issued = 0
+        for turn in self.turns:
+            if issued == answered:
+                return turn
+            issued += len(turn)
+        return []
+
+    async def get_response(
+        self,
+        system_instructions,
+        input,
+        model_settings,
+        tools,
+        output_schema,
+        handoffs,
+        tracing,
+        *,
+        previous_response_id=None,
+        conversation_id=None,
+        prompt=None,
+    ) -> ModelResponse:
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+        turn = self._next_turn(input)
+        if turn:
+            output = [
+                ResponseFunctionToolCall(
+                    id=f"fc_{self.round_trips}_{i}",
+                    call_id=f"call_{self.round_trips}_{i}",
+                    name=name,
+                    arguments=json.dumps(arguments),
+                    type="function_call",
+                )
+                for i, (name, arguments) in enumerate(turn)
+            ]
+        else:
+            output = [
+                ResponseOutputMessage(
+                    id=f"msg_{self.round_trips}",
+                    content=[ResponseOutputText(text=self.final_output, type="output_text", annotations=[])],
+                    role="assistant",
+                    status="completed",
+                    type="message",
+                )
+            ]
+        input_tokens = _estimate_tokens(input)
+        output_tokens = sum(_estimate_tokens(item.model_dump()) for item in output)
+        usage = Usage(requests=1, input_tokens=input_tokens, output_tokens=output_tokens, total_tokens=input_tokens + output_tokens)
+        return ModelResponse(output=output, usage=usage, response_id=None)
+
+    def stream_response(self, *args, **kwargs) -> AsyncIterator[Any]:
+        raise NotImplementedError("ScriptedModel only supports non-streamed runs")
@@ -0,0 +1,67 @@
+"""
+Local stand-in HTTP servers for offline benchmarks.
+
+``start_json_server`` serves JSON from a plain function on a random localhost
+port, after an artificial delay, and counts the requests it receives.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlparse
+
+
+class _Server(ThreadingHTTPServer):
+    # The default backlog of 5 drops bursts of concurrent connections
+    request_queue_size = 256
+    daemon_threads = True
+
+
+class StandInServer:
+    """A running stand-in server; ``url`` is its base URL and ``requests`` its hit count."""
+
+    def __init__(self, server: ThreadingHTTPServer):
+        self._server = server
+        self.url = f"http://127.0.0.1:{server.server_address[1]}"
+        self.requests = 0
+
+    def shutdown(self) -> None:
+        self._server.shutdown()
+
+
+def start_json_server(respond: Callable[[str, dict[str, Any]], Any], latency: float = 0.05) -> StandInServer:
+    """
+    Start a threaded localhost server answering every GET/POST with ``respond(path, params)``.
+
+    ``params`` holds the query-string values for GET and the decoded JSON body for POST.
+    """
+    stand_in: StandInServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, params: dict[str, Any]):
+            stand_in.requests += 1
+            time.sleep(latency)
+            body = json.dumps(respond(urlparse(self.path).path, params)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            query = parse_qs(urlparse(self.path).query)
+            self._reply({key: values[0] for key, values in query.items()})
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            self._reply(json.loads(self.rfile.read(length) or b"{}"))
+
+        def log_message(self, format, *args):
+            pass
+
+    server = _Server(("127.0.0.1", 0), Handler)
+    stand_in = StandInServer(server)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return stand_in
@@ -1,48 +1,304 @@
+import asyncio
+import contextlib
 import os
+import signal
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING
+
 from dotenv import load_dotenv
 
-from agents import Agent, Runner, AsyncOpenAI, OpenAIChatCompletionsModel, RunResult
-from tools import calculator, text_summarizer, weather_fetcher, web_search
+if TYPE_CHECKING:
+    from agents import Agent, AsyncOpenAI, RunResult
+    from response_cache import ResponseCache
 
 load_dotenv()
 
-# Initialize external client
-external_client: AsyncOpenAI = AsyncOpenAI(
-    base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
-    api_key=os.getenv("GEMINI_API_KEY")
-)
-
-# Initialize LLM model
-llm_model: OpenAIChatCompletionsModel = OpenAIChatCompletionsModel(
-    openai_client=external_client,
-    model="gemini-2.0-flash"
-)
-
-# Create agent with all available tools
-agent: Agent = Agent(
-    name="Assistant",
-    model=llm_model,
-    tools=[calculator, text_summarizer, weather_fetcher, web_search]
-)
-
-def display_tool_usage(runner: RunResult):
-    """Display which tools were used during the conversation."""
-    if hasattr(runner, 'messages') and runner.messages:
-        print("\n🔧 Tools Used:")
-        print("=" * 50)
-        
-        tool_usage_found = False
-        for message in runner.messages:
-            if hasattr(message, 'tool_calls') and message.tool_calls:
-                for tool_call in message.tool_calls:
-                    tool_name = getattr(tool_call, 'function', {}).get('name', 'Unknown Tool')
-                    print(f"  🛠️  {tool_name}")
-                    tool_usage_found = True
-        
-        if not tool_usage_found:
-            print("  ℹ️  No tools were used - response based on LLM knowledge only")
-        
-        print("=" * 50)
+# The Agents SDK, the model client and the agent are only imported/built on first
+# use (warmed up in the background while the first prompt waits for input).
+_agent: "Agent | None" = None
+_client: "AsyncOpenAI | None" = None
+_agent_lock = threading.Lock()
+# False until the response cache has been created (it is None when disabled)
+_response_cache: "ResponseCache | None | bool" = False
+_response_cache_lock = threading.Lock()
+
+# Prefix for requests that run in the background while the prompt comes back
+BACKGROUND_PREFIX = "&"
+
+def get_agent() -> "Agent":
+    """Return the assistant, building it (and importing the Agents SDK) on first use."""
+    global _agent, _client
+    with _agent_lock:
+        if _agent is None:
+            from agents import Agent, AsyncOpenAI, OpenAIChatCompletionsModel
+            from tools.registry import get_tools
+
+            # Initialize external client
+            _client = AsyncOpenAI(
+                base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
+                api_key=os.getenv("GEMINI_API_KEY")
+            )
+
+            # Initialize LLM model
+            llm_model: OpenAIChatCompletionsModel = OpenAIChatCompletionsModel(
+                openai_client=_client,
+                model="gemini-2.0-flash"
+            )
+
+            # Create agent with all available tools (each implementation is imported on its first call)
+            _agent = Agent(
+                name="Assistant",
+                model=llm_model,
+                tools=get_tools()
+            )
+    return _agent
+
+def get_response_cache() -> "ResponseCache | None":
+    """The session's response cache (None if RESPONSE_CACHE=0), created (and NumPy imported) on first use."""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is False:
+            from response_cache import ResponseCache
+
+            _response_cache = ResponseCache.from_env()
+    return _response_cache
+
+def warm_up():
+    """Build the agent and response cache in a background thread; errors resurface on the first real request."""
+    def build():
+        try:
+            get_agent()
+            get_response_cache()
+        except Exception:
+            pass
+
+    threading.Thread(target=build, daemon=True).start()
+
+def display_tool_usage(runner: "RunResult"):
+    """Display which tools were used during the conversation, with each call's latency."""
+    from tools.instrumentation import call_latency
+
+    print("\n🔧 Tools Used:")
+    print("=" * 50)
+
+    tool_usage_found = False
+    for item in runner.new_items:
+        if item.type == "tool_call_item":
+            tool_name = getattr(item.raw_item, 'name', 'Unknown Tool')
+            seconds = call_latency.get(getattr(item.raw_item, 'call_id', None))
+            timing = f" ({seconds * 1000:.0f} ms)" if seconds is not None else ""
+            print(f"  🛠️  {tool_name}{timing}")
+            tool_usage_found = True
+
+    if not tool_usage_found:
+        print("  ℹ️  No tools were used - response based on LLM knowledge only")
+
+    print("=" * 50)
+
+class Repl:
+    """
+    The interactive session: one event loop and one model client for every request.
+
+    Stdin is read on a daemon thread, so the loop keeps running while you type:
+    a request prefixed with ``&`` runs in the background and its answer is
+    printed (tagged with its number) when ready, while the prompt comes back at
+    once. Ctrl-C cancels the requests in flight instead of exiting; at an idle
+    prompt it quits.
+    """
+
+    def __init__(self):
+        self.lines: asyncio.Queue[str | None] = asyncio.Queue()
+        self.runs: dict[int, asyncio.Task] = {}
+        self.foreground: int | None = None
+        self.prompting = False
+        self.closed = False
+        self.next_id = 1
+
+    def prompt(self):
+        print("\n👤 You: ", end="", flush=True)
+        self.prompting = True
+
+    def _read_stdin(self, loop: asyncio.AbstractEventLoop):
+        for line in sys.stdin:
+            loop.call_soon_threadsafe(self.lines.put_nowait, line)
+        loop.call_soon_threadsafe(self.lines.put_nowait, None)
+
+    def interrupt(self):
+        """Ctrl-C: cancel the foreground request, else every background one, else quit."""
+        if self.foreground is not None:
+            # The foreground request may have just finished and left self.runs
+            task = self.runs.get(self.foreground)
+            if task is not None:
+                task.cancel()
+        elif self.runs:
+            for task in self.runs.values():
+                task.cancel()
+        else:
+            self.lines.put_nowait(None)
+
+    @contextlib.contextmanager
+    def output(self):
+        """Print output between prompts, putting the prompt back if it was showing."""
+        if self.prompting:
+            print()
+            self.prompting = False
+        yield
+        if self.foreground is None and not self.closed:
+            self.prompt()
+
+    def say(self, text: str):
+        with self.output():
+            print(text)
+
+    async def ask(self, request_id: int, user_input: str):
+        """Run one request and print its (tagged) answer."""
+        from agents import Runner
+
+        tag = f"[#{request_id}]"
+        try:
+            # The first request may still be waiting for warm_up() to finish building the agent and cache
+            cache = await asyncio.to_thread(get_response_cache)
+            hit = cache.lookup(user_input) if cache is not None else None
+            if hit is not None:
+                self.say(f"\n🤖 Assistant {tag} (cached, {hit.similarity:.0%} match for {hit.query!r}): {hit.answer}")
+                return
+
+            agent = await asyncio.to_thread(get_agent)
+            start = time.perf_counter()
+            result: RunResult = await Runner.run(starting_agent=agent, input=user_input)
+        except asyncio.CancelledError:
+            self.say(f"\n⏹️ {tag} Cancelled.")
+        except Exception as e:
+            self.say(f"\n❌ {tag} Error: {str(e)}\nPlease try again with a different question.")
+        else:
+            if cache is not None:
+                used_tools = any(item.type == "tool_call_item" for item in result.new_items)
+                cache.store(user_input, str(result.final_output), used_tools, time.perf_counter() - start)
+            with self.output():
+                print(f"\n🤖 Assistant {tag}: {result.final_output}")
+                display_tool_usage(result)
+        finally:
+            del self.runs[request_id]
+
+    def submit(self, user_input: str) -> asyncio.Task:
+        request_id = self.next_id
+        self.next_id += 1
+        task = asyncio.create_task(self.ask(request_id, user_input))
+        self.runs[request_id] = task
+        return task
+
+    def command(self, user_input: str):
+        """Handle ``/jobs``, ``/cancel [n]``, ``/stats [json|prometheus|reset]`` and ``/cache [clear]``."""
+        name, _, argument = user_input.partition(" ")
+        argument = argument.strip()
+        if name == "/jobs":
+            print("\n".join(f"  [#{request_id}] running" for request_id in self.runs) or "  No requests in flight.")
+        elif name == "/cancel":
+            targets = [int(argument)] if argument.isdigit() else list(self.runs)
+            for request_id in targets:
+                if request_id in self.runs:
+                    self.runs[request_id].cancel()
+        elif name == "/stats":
+            from tools import instrumentation
+
+            if argument == "json":
+                print(instrumentation.to_json())
+            elif argument == "prometheus":
+                print(instrumentation.to_prometheus(), end="")
+            elif argument == "reset":
+                instrumentation.reset()
+                print("  Tool stats reset.")
+            else:
+                print("\n📊 Tool Stats:")
+                print(instrumentation.format_stats())
+        elif name == "/cache":
+            cache = get_response_cache()
+            if cache is None:
+                print("  The response cache is disabled (RESPONSE_CACHE=0).")
+            elif argument == "clear":
+                cache.clear()
+                print("  Response cache cleared.")
+            else:
+                stats = cache.stats()
+                print("\n💾 Response Cache:")
+                print(
+                    f"  {stats['entries']}/{stats['capacity']} entries, {stats['hits']} hits / {stats['lookups']} lookups"
+                    f" ({stats['hit_rate']:.0%}), {stats['evictions']} evictions"
+                )
+                print(
+                    f"  lookup {stats['lookup_ms_mean']:.2f} ms mean, {stats['lookup_ms_p95']:.2f} ms p95;"
+                    f" {stats['seconds_saved']:.1f} s of model time saved"
+                )
+        else:
+            print(f"Unknown command {name!r}; try /jobs, /cancel [n], /stats [json|prometheus|reset] or /cache [clear].")
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGINT, self.interrupt)
+        except NotImplementedError:  # Windows event loops
+            signal.signal(signal.SIGINT, lambda *_: loop.call_soon_threadsafe(self.interrupt))
+        threading.Thread(target=self._read_stdin, args=(loop,), daemon=True).start()
+
+        try:
+            while True:
+                self.prompt()
+                line = await self.lines.get()
+                self.prompting = False
+                if line is None:
+                    print("\n\n👋 Goodbye! Thanks for using the OpenAI Agents SDK demo.")
+                    break
+                user_input = line.strip()
+
+                # Check for exit commands
+                if user_input.lower() in ['quit', 'exit', 'bye', 'q']:
+                    print("\n👋 Goodbye! Thanks for using the OpenAI Agents SDK demo.")
+                    break
+
+                if user_input.startswith("/"):
+                    self.command(user_input)
+                    continue
+
+                background = user_input.startswith(BACKGROUND_PREFIX)
+                user_input = user_input.removeprefix(BACKGROUND_PREFIX).strip()
+                if not user_input:
+                    print("Please enter a question or request.")
+                    continue
+
+                task = self.submit(user_input)
+                request_id = self.next_id - 1
+                if background:
+                    print(f"🔄 [#{request_id}] Running in the background.")
+                    continue
+
+                print(f"\n🤖 Assistant [#{request_id}]: Thinking... (Ctrl-C to cancel)")
+                self.foreground = request_id
+                try:
+                    await asyncio.wait([task])
+                finally:
+                    self.foreground = None
+        finally:
+            self.closed = True
+            for task in self.runs.values():
+                task.cancel()
+            await asyncio.gather(*self.runs.values(), return_exceptions=True)
+            await close_clients()
+
+
+async def close_clients():
+    """Close the pooled model, search and weather clients at the end of the session."""
+    if _client is not None:
+        await _client.close()
+    # Only modules a tool has loaded can hold a client, and only clients already created are closed
+    search_client = sys.modules.get("tools.search_client")
+    if search_client is not None:
+        await search_client.close_search_client()
+    weather_provider = sys.modules.get("tools.weather_provider")
+    if weather_provider is not None:
+        await weather_provider.close_weather_provider()
+
 
 def interactive_mode():
     """Run the agent in interactive mode."""
@@ -54,42 +310,14 @@ def interactive_mode():
     print("  🌤️ Weather information")
     print("  🔍 Web searches")
     print("  💬 General questions")
-    print("\nType 'quit', 'exit', or 'bye' to stop the conversation.")
+    print(f"\nStart a request with '{BACKGROUND_PREFIX}' to run it in the background; /jobs lists and /cancel [n] cancels them.")
+    print("/stats shows per-tool call counts and latency (/stats json or /stats prometheus to export).")
+    print("Repeated questions are answered from a local cache; /cache shows its stats and /cache clear empties it.")
+    print("Ctrl-C cancels the running request.")
+    print("Type 'quit', 'exit', or 'bye' to stop the conversation.")
     print("=" * 50)
-    
-    while True:
-        try:
-            # Get user input
-            user_input = input("\n👤 You: ").strip()
-            
-            # Check for exit commands
-            if user_input.lower() in ['quit', 'exit', 'bye', 'q']:
-                print("\n👋 Goodbye! Thanks for using the OpenAI Agents SDK demo.")
-                break
-            
-            if not user_input:
-                print("Please enter a question or request.")
-                continue
-            
-            # Run the agent
-            print("\n🤖 Assistant: Thinking...")
-            runner: RunResult = Runner.run_sync(
-                starting_agent=agent,
-                input=user_input
-            )
-            
-            # Display the response
-            print(f"\n🤖 Assistant: {runner.final_output}")
-            
-            # Show which tools were used
-            display_tool_usage(runner)
-            
-        except KeyboardInterrupt:
-            print("\n\n👋 Goodbye! Thanks for using the OpenAI Agents SDK demo.")
-            break
-        except Exception as e:
-            print(f"\n❌ Error: {str(e)}")
-            print("Please try again with a different question.")
+    warm_up()
+    asyncio.run(Repl().run())
 
 if __name__ == "__main__":
-    interactive_mode()
\ No newline at end of file
+    interactive_mode()
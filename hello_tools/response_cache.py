@@ -0,0 +1,264 @@
+"""
+Local semantic response cache for the assistant.
+
+Near-identical questions ("weather in london", "London weather?") get the
+cached answer instead of another model and tool round trip. Queries are
+embedded locally with a hashing vectorizer (word, word-bigram and
+character-trigram features, no vocabulary, no network) and looked up in a NumPy cosine index;
+a cached answer is returned when the best match clears the similarity
+threshold, has the same numbers and operators as the query (so "2+2" never
+answers "2+3" or "2*2"), the same question words and negation (so "where was
+einstein born" never answers "when ...", nor "is it not safe" "is it safe")
+and has not expired. Queries longer than ``LONG_QUERY_TOKENS`` words (pasted
+text to summarize or translate) only hit on the same normalized text: one
+changed word can reverse their meaning without moving the similarity. Answers
+that needed no tools are kept until evicted, answers built from tool results
+(weather, search, ...) expire after a TTL.
+
+The vectorizer is lexical: word order only counts through word bigrams and
+directional words ("usd to eur"), and it does not know synonyms, so keep the
+threshold high. Knobs come from the environment:
+``RESPONSE_CACHE=0`` disables the cache, ``RESPONSE_CACHE_THRESHOLD``
+(default 0.9), ``RESPONSE_CACHE_CAPACITY`` (default 512),
+``RESPONSE_CACHE_TTL`` (seconds for tool-based answers, default 300) and
+``RESPONSE_CACHE_EVICTION`` (``lru`` or ``fifo``).
+"""
+
+import os
+import re
+import statistics
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+
+from tools.extractive import STOPWORDS
+
+DEFAULT_DIMENSIONS = 2048
+DEFAULT_THRESHOLD = 0.9
+DEFAULT_CAPACITY = 512
+DEFAULT_TOOL_TTL = 300.0
+# Best matches checked for an equal signature before giving up
+CANDIDATES = 8
+# How many recent lookups keep their latency for the stats
+LATENCY_WINDOW = 1000
+
+_TOKEN = re.compile(r"[a-z0-9']+")
+# Numbers and arithmetic operators must match exactly and in order ("2+2" vs "2*2" vs "2+3")
+_LITERAL = re.compile(r"\d+(?:\.\d+)?|[-+*/^%=<>]")
+# Question words must match too; a bare "what" ("what's the weather in london") asks nothing specific
+_QUESTION_WORDS = frozenset("when where who whom whose which why how".split())
+# So must negation ("is it not safe" vs "is it safe")
+_NEGATIONS = frozenset("not no never nor cannot".split())
+# Words whose neighbours' order changes the question, and the weight of that order
+_DIRECTIONAL = frozenset("to from into than vs versus".split())
+DIRECTION_WEIGHT = 2.0
+# Weight of each ordered pair of neighbouring words: enough to split "brazil beat germany"
+# from "germany beat brazil", little enough for "london weather" to match "weather in london"
+BIGRAM_WEIGHT = 0.5
+# Longer queries only hit on the same normalized text
+LONG_QUERY_TOKENS = 20
+# Question filler that says nothing about what is asked
+_FILLER = STOPWORDS | frozenset(
+    "what's whats please tell can could would do does give show find like know me".split()
+)
+
+
+def _features(text: str) -> dict[str, float]:
+    """
+    Word features (weight 1) plus each word's character trigrams (weight 1 in total per word).
+
+    Word order counts through bigrams of neighbouring non-filler words (``BIGRAM_WEIGHT``)
+    and around directional words: "usd to eur" also gets a ``usd>eur`` feature, so it
+    does not match "eur to usd".
+    """
+    features: dict[str, float] = {}
+    tokens = _TOKEN.findall(text.lower())
+    for before, word, after in zip(tokens, tokens[1:], tokens[2:]):
+        if word in _DIRECTIONAL:
+            features[f"d:{before}>{after}"] = features.get(f"d:{before}>{after}", 0.0) + DIRECTION_WEIGHT
+    words = [token for token in tokens if token not in _FILLER]
+    for before, after in zip(words, words[1:]):
+        features[f"b:{before}>{after}"] = features.get(f"b:{before}>{after}", 0.0) + BIGRAM_WEIGHT
+    for token in words:
+        features["w:" + token] = features.get("w:" + token, 0.0) + 1.0
+        padded = f" {token} "
+        trigrams = [padded[i:i + 3] for i in range(len(padded) - 2)]
+        for trigram in trigrams:
+            features["c:" + trigram] = features.get("c:" + trigram, 0.0) + 1.0 / len(trigrams)
+    return features
+
+
+def embed(text: str, dimensions: int = DEFAULT_DIMENSIONS) -> np.ndarray:
+    """L2-normalized hashed feature vector of ``text`` (signed hashing, stable across processes)."""
+    vector = np.zeros(dimensions, dtype=np.float32)
+    for feature, weight in _features(text).items():
+        h = zlib.crc32(feature.encode())
+        vector[h % dimensions] += weight if h & 0x80000000 else -weight
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def _signature(text: str) -> tuple:
+    """
+    What a cached question must share exactly with the query: literals, question words,
+    negation and, for a long query, the whole normalized text.
+    """
+    tokens = _TOKEN.findall(text.lower())
+    # "who's" asks what "who" asks
+    question_words = tuple(sorted({token.split("'")[0] for token in tokens} & _QUESTION_WORDS))
+    negated = any(token in _NEGATIONS or token.endswith("n't") for token in tokens)
+    exact = " ".join(tokens) if len(tokens) > LONG_QUERY_TOKENS else None
+    return tuple(_LITERAL.findall(text)), question_words, negated, exact
+
+
+@dataclass
+class CacheHit:
+    """A cached answer and how well its question matched."""
+
+    query: str
+    answer: str
+    similarity: float
+
+
+class ResponseCache:
+    """A fixed-capacity cosine index of past questions and their answers."""
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        capacity: int = DEFAULT_CAPACITY,
+        tool_ttl: float | None = DEFAULT_TOOL_TTL,
+        eviction: Literal["lru", "fifo"] = "lru",
+        dimensions: int = DEFAULT_DIMENSIONS,
+    ):
+        if eviction not in ("lru", "fifo"):
+            raise ValueError(f"eviction must be 'lru' or 'fifo', not {eviction!r}")
+        self.threshold = threshold
+        self.capacity = capacity
+        self.tool_ttl = tool_ttl
+        self.eviction = eviction
+        self.dimensions = dimensions
+        # One row per slot; a free or expired slot never matches (its expiry is in the past)
+        self._vectors = np.zeros((capacity, dimensions), dtype=np.float32)
+        self._expires = np.full(capacity, -np.inf)
+        self._used = np.zeros(capacity)
+        self._stored = np.zeros(capacity)
+        self._queries: list[str | None] = [None] * capacity
+        self._answers: list[str | None] = [None] * capacity
+        self._signatures: list[tuple] = [()] * capacity
+        self._saved: list[float] = [0.0] * capacity
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.seconds_saved = 0.0
+        self._lookup_seconds: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache | None":
+        """A cache configured from the RESPONSE_CACHE_* variables, or None if disabled."""
+        if os.getenv("RESPONSE_CACHE", "1") == "0":
+            return None
+        return cls(
+            threshold=float(os.getenv("RESPONSE_CACHE_THRESHOLD", DEFAULT_THRESHOLD)),
+            capacity=int(os.getenv("RESPONSE_CACHE_CAPACITY", DEFAULT_CAPACITY)),
+            tool_ttl=float(os.getenv("RESPONSE_CACHE_TTL", DEFAULT_TOOL_TTL)),
+            eviction=os.getenv("RESPONSE_CACHE_EVICTION", "lru"),
+        )
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._expires >= time.monotonic()))
+
+    def _match(self, vector: np.ndarray, signature: tuple, now: float) -> tuple[int, float] | None:
+        """The best live slot above the threshold with the same signature, and its similarity."""
+        scores = self._vectors @ vector
+        scores[self._expires < now] = -1.0
+        # Best few candidates first (partial sort); the first with a matching signature wins
+        top = np.argpartition(scores, -CANDIDATES)[-CANDIDATES:] if len(scores) > CANDIDATES else np.arange(len(scores))
+        for slot in top[np.argsort(scores[top])[::-1]]:
+            if scores[slot] < self.threshold:
+                break
+            if self._signatures[slot] == signature:
+                return int(slot), float(scores[slot])
+        return None
+
+    def lookup(self, query: str) -> CacheHit | None:
+        """The cached answer for the most similar live question, if it clears the threshold."""
+        start = time.perf_counter()
+        try:
+            now = time.monotonic()
+            match = self._match(embed(query, self.dimensions), _signature(query), now)
+            if match is None:
+                self.misses += 1
+                return None
+            slot, similarity = match
+            self.hits += 1
+            self.seconds_saved += self._saved[slot]
+            self._used[slot] = now
+            return CacheHit(self._queries[slot], self._answers[slot], similarity)
+        finally:
+            self._lookup_seconds.append(time.perf_counter() - start)
+
+    def store(self, query: str, answer: str, used_tools: bool, seconds: float = 0.0) -> None:
+        """
+        Cache ``answer`` for ``query``.
+
+        Args:
+            query: The question as the user asked it.
+            answer: The assistant's final answer.
+            used_tools: Whether the answer was built from tool results; those expire after ``tool_ttl``.
+            seconds: How long producing the answer took, counted as saved on every hit.
+        """
+        now = time.monotonic()
+        vector, signature = embed(query, self.dimensions), _signature(query)
+        # A question already cached (e.g. asked twice concurrently) is refreshed in place
+        match = self._match(vector, signature, now)
+        slot = match[0] if match is not None else self._free_slot(now)
+        ttl = self.tool_ttl if used_tools else None
+        self._vectors[slot] = vector
+        self._expires[slot] = now + ttl if ttl is not None else np.inf
+        self._used[slot] = self._stored[slot] = now
+        self._queries[slot] = query
+        self._answers[slot] = answer
+        self._signatures[slot] = signature
+        self._saved[slot] = seconds
+        self.stores += 1
+
+    def _free_slot(self, now: float) -> int:
+        """An empty or expired slot, else the victim of the eviction policy."""
+        expired = np.flatnonzero(self._expires < now)
+        if len(expired):
+            slot = int(expired[0])
+            if self._queries[slot] is not None:
+                self.evictions += 1
+            return slot
+        self.evictions += 1
+        return int(np.argmin(self._used if self.eviction == "lru" else self._stored))
+
+    def clear(self) -> None:
+        self._expires[:] = -np.inf
+        self._queries = [None] * self.capacity
+        self._answers = [None] * self.capacity
+
+    def stats(self) -> dict[str, float]:
+        """Hit rate, size and lookup latency, for the REPL or benchmarks."""
+        lookups = self.hits + self.misses
+        latencies = sorted(self._lookup_seconds)
+        return {
+            "entries": len(self),
+            "capacity": self.capacity,
+            "lookups": lookups,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "lookup_ms_mean": statistics.mean(latencies) * 1000 if latencies else 0.0,
+            "lookup_ms_p95": latencies[int(0.95 * (len(latencies) - 1))] * 1000 if latencies else 0.0,
+            "seconds_saved": self.seconds_saved,
+        }
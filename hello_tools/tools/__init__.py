@@ -1,11 +1,43 @@
 """
 Tools module for the hello_tools agent.
 Contains various function tools for the agent to use.
+
+Tool modules are imported lazily: ``from tools import calculator`` only loads
+the calculator module (``calculator_tools``) and its dependencies on first
+access. Use ``tools.registry.get_tools()`` to build an agent without importing
+any tool implementation until the model actually calls it.
+
+Modules are named after what they group (``calculator_tools``), never after a
+tool, so importing a module never rebinds a tool's name on this package.
 """
 
-from .calculator import calculator
-from .text_summarizer import text_summarizer
-from .weather_fetcher import weather_fetcher
-from .web_search import web_search
+import importlib
+
+# Tool name -> module (inside this package) that defines it
+TOOL_MODULES = {
+    'calculator': 'calculator_tools',
+    'calculator_table': 'calculator_tools',
+    'calculator_batch': 'calculator_tools',
+    'text_summarizer': 'summarizer_tools',
+    'file_summarizer': 'summarizer_tools',
+    'text_summarizer_batch': 'batch_summarizer',
+    'weather_fetcher': 'weather_tools',
+    'weather_fetcher_batch': 'weather_tools',
+    'web_search': 'search_tools',
+    'web_search_batch': 'search_tools',
+}
+
+__all__ = list(TOOL_MODULES)
+
+
+def load_tool(name: str):
+    """Import the module defining tool ``name`` and return the tool."""
+    module = importlib.import_module(f".{TOOL_MODULES[name]}", __name__)
+    tool = globals()[name] = getattr(module, name)
+    return tool
+
 
-__all__ = ['calculator', 'text_summarizer', 'weather_fetcher', 'web_search']
+def __getattr__(name: str):
+    if name in TOOL_MODULES:
+        return load_tool(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
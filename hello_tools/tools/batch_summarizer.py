@@ -0,0 +1,164 @@
+"""
+Batch summarizer tool for condensing many documents in one tool call.
+
+Documents are summarized in parallel on a shared process pool. Large documents
+are packed into a single shared-memory block and workers read them in place,
+so only a small (name, offset, size) reference is pickled per document.
+Small batches are summarized serially in a worker thread, where process
+start-up and transfer costs would outweigh the parallelism. The shared-memory
+block is only unlinked once no worker can still be reading it, even when the
+batch is cancelled or fails part-way.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Literal
+
+from agents import function_tool
+
+from .batching import MAX_BATCH_ITEMS, split_batch
+from .summarizer_tools import summarize_text
+
+# Documents at least this large (bytes) travel through shared memory instead of pickling
+SHARED_MEMORY_THRESHOLD = 64 * 1024
+# Batches smaller than this in total (bytes) are not worth a process pool
+PARALLEL_THRESHOLD = 256 * 1024
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Create the shared process pool on first use and reuse it afterwards."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _pool
+
+
+def _summarize_job(document: str | tuple[str, int, int], max_length: int, method: str) -> str:
+    """Worker entry point: read the document (from shared memory if needed) and summarize it."""
+    if isinstance(document, tuple):
+        name, offset, size = document
+        block = shared_memory.SharedMemory(name=name)
+        try:
+            document = bytes(block.buf[offset:offset + size]).decode("utf-8")
+        finally:
+            block.close()
+    return summarize_text(document, max_length, method)
+
+
+def _release_when_done(block: shared_memory.SharedMemory, futures: list[Future]) -> None:
+    """Cancel the jobs still queued, then unlink ``block`` once every job already running has finished."""
+    for future in futures:
+        future.cancel()
+    running = [future for future in futures if not future.done()]
+    if not running:
+        block.close()
+        block.unlink()
+        return
+
+    lock = threading.Lock()
+    remaining = [len(running)]
+
+    def finished(_: Future) -> None:
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            block.close()
+            block.unlink()
+
+    for future in running:
+        future.add_done_callback(finished)
+
+
+def _summarize_serial(texts: list[str], max_length: int, method: str) -> list[str]:
+    return [summarize_text(text, max_length, method) for text in texts]
+
+
+async def summarize_batch(
+    texts: list[str],
+    max_length: int = 150,
+    method: Literal["lead", "tfidf"] = "lead",
+    parallel: bool | None = None,
+) -> tuple[list[str], float]:
+    """
+    Summarize many documents, fanning out over the process pool when it pays off.
+
+    Args:
+        texts: The documents to summarize.
+        max_length: Maximum length of each summary in characters.
+        method: Summarization method, as for ``text_summarizer``.
+        parallel: Force (True) or skip (False) the process pool; by default it is
+            used when the batch is larger than ``PARALLEL_THRESHOLD``.
+
+    Returns:
+        The summaries in input order and the batch wall time in seconds.
+    """
+    start = time.perf_counter()
+    encoded = [text.encode("utf-8") for text in texts]
+    if parallel is None:
+        parallel = len(texts) > 1 and sum(len(data) for data in encoded) >= PARALLEL_THRESHOLD
+
+    if not parallel:
+        summaries = await asyncio.to_thread(_summarize_serial, texts, max_length, method)
+        return summaries, time.perf_counter() - start
+
+    # Pack every large document into one shared-memory block
+    large = [i for i, data in enumerate(encoded) if len(data) >= SHARED_MEMORY_THRESHOLD]
+    block = None
+    documents: list[str | tuple[str, int, int]] = list(texts)
+    if large:
+        block = shared_memory.SharedMemory(create=True, size=sum(len(encoded[i]) for i in large))
+        offset = 0
+        for i in large:
+            size = len(encoded[i])
+            block.buf[offset:offset + size] = encoded[i]
+            documents[i] = (block.name, offset, size)
+            offset += size
+
+    pool = _get_pool()
+    futures = [pool.submit(_summarize_job, document, max_length, method) for document in documents]
+    try:
+        summaries = await asyncio.gather(*(asyncio.wrap_future(future) for future in futures))
+    finally:
+        # On cancellation or a failed job, workers may still be queued or reading the block
+        if block is not None:
+            _release_when_done(block, futures)
+        else:
+            for future in futures:
+                future.cancel()
+    return list(summaries), time.perf_counter() - start
+
+
+@function_tool
+async def text_summarizer_batch(
+    texts: list[str],
+    max_length: int = 150,
+    method: Literal["lead", "tfidf"] = "lead",
+) -> str:
+    """
+    Summarize several documents at once (e.g. a list of web results) and return all summaries together.
+
+    Args:
+        texts: The documents to summarize.
+        max_length: Maximum length of each summary in characters (default: 150).
+        method: "lead" takes the opening sentences (default), "tfidf" picks the most central sentences.
+
+    Returns:
+        One numbered summary per document, in the order given.
+    """
+    texts, skipped = split_batch(texts)
+    if not texts:
+        return "Error: No texts provided to summarize."
+
+    summaries, elapsed = await summarize_batch(texts, max_length, method)
+    lines = [f"📝 Summaries for {len(texts)} documents ({elapsed * 1000:.0f} ms):"]
+    lines.extend(f"{i}. {summary}" for i, summary in enumerate(summaries, 1))
+    if skipped:
+        lines.append(f"⚠️ {skipped} more documents were skipped (at most {MAX_BATCH_ITEMS} per call)")
+    return "\n".join(lines)
@@ -0,0 +1,54 @@
+"""
+Helpers for the batched tool variants (``*_batch``).
+
+A batched tool takes a list of items in one call, runs them concurrently and
+answers with one compact table, so an N-item question costs one model round
+trip instead of N.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+# Most items accepted in one batched call; the rest are reported as skipped
+MAX_BATCH_ITEMS = 25
+# Most items of one batch in flight at once
+BATCH_CONCURRENCY = 8
+
+
+async def gather_bounded(
+    fn: Callable[[T], Awaitable[Any]],
+    items: list[T],
+    max_concurrency: int = BATCH_CONCURRENCY,
+) -> list[Any]:
+    """
+    Await ``fn(item)`` for every item, at most ``max_concurrency`` at a time.
+
+    Returns:
+        One result per item, in input order; a failed item's exception is returned in its place.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(item: T) -> Any:
+        async with semaphore:
+            return await fn(item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+
+
+def format_table(headers: list[str], rows: list[list[str]]) -> str:
+    """Render rows as a Markdown table, keeping every cell on one line."""
+
+    def cell(value: str) -> str:
+        return " ".join(str(value).split()).replace("|", "\\|")
+
+    lines = ["| " + " | ".join(headers) + " |", "|" + "---|" * len(headers)]
+    lines.extend("| " + " | ".join(cell(value) for value in row) + " |" for row in rows)
+    return "\n".join(lines)
+
+
+def split_batch(items: list[str]) -> tuple[list[str], int]:
+    """Strip items, drop empty ones and cap the batch at MAX_BATCH_ITEMS; returns (items, skipped)."""
+    items = [item.strip() for item in items if item and item.strip()]
+    return items[:MAX_BATCH_ITEMS], max(0, len(items) - MAX_BATCH_ITEMS)
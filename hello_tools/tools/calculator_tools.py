@@ -0,0 +1,133 @@
+"""
+Calculator tool for performing basic mathematical operations.
+"""
+
+from agents import function_tool
+from pydantic import BaseModel
+
+from .batching import MAX_BATCH_ITEMS, format_table, gather_bounded, split_batch
+from .executor import ToolExecutor, ToolTimeoutError
+from .expression import evaluate_expression, evaluate_vectorized
+from .memoize import memoize
+
+# Hard wall-clock budget per evaluation, queueing included. Evaluation runs on a
+# worker thread so the event loop driving the Runner is never blocked. The timeout
+# cannot stop a thread stuck in big-integer arithmetic (it holds the GIL), so it is
+# not what bounds the work: expression.py rejects oversized integer results
+# statically and again before every power and product it computes.
+CALCULATOR_TIMEOUT_SECONDS = 2.0
+# At most this many evaluations run at once; further calls queue
+CALCULATOR_MAX_CONCURRENCY = 4
+
+_calculator_executor = ToolExecutor("calculator", "thread", CALCULATOR_TIMEOUT_SECONDS, CALCULATOR_MAX_CONCURRENCY)
+_table_executor = ToolExecutor("calculator_table", "thread", CALCULATOR_TIMEOUT_SECONDS, CALCULATOR_MAX_CONCURRENCY)
+
+TIMEOUT_MESSAGE = f"Error: Calculation took longer than {CALCULATOR_TIMEOUT_SECONDS} seconds and was abandoned."
+
+
+def _expression_key(arguments: dict) -> str:
+    # Runs of whitespace never change the result ("2 + 2" and " 2  +  2 " share an entry)
+    return " ".join(arguments["expression"].split())
+
+
+@memoize(maxsize=1024, key=_expression_key, cache_if=lambda result: result != TIMEOUT_MESSAGE, name="calculator")
+async def calculate(expression: str) -> str:
+    """Evaluate one expression to "Result: ..." or an "Error: ..." message (shared by calculator and calculator_batch)."""
+    try:
+        # Parsed, validated and compiled once per distinct expression, then served from cache
+        result = await _calculator_executor.run(evaluate_expression, expression)
+        return f"Result: {result}"
+        
+    except ToolTimeoutError:
+        return TIMEOUT_MESSAGE
+    except ZeroDivisionError:
+        return "Error: Division by zero is not allowed."
+    except Exception as e:
+        return f"Error: Invalid mathematical expression. {str(e)}"
+
+
+@function_tool
+async def calculator(expression: str) -> str:
+    """
+    Perform basic mathematical calculations on a given expression.
+    
+    Args:
+        expression: A mathematical expression as a string (e.g., "5 + 5", "10 * 3", "100 / 4", "3 squared plus 1")
+        
+    Returns:
+        The result of the calculation as a string, or an error message if the expression is invalid.
+    """
+    return await calculate(expression)
+
+
+@function_tool
+async def calculator_batch(expressions: list[str]) -> str:
+    """
+    Evaluate several independent mathematical expressions in one call.
+
+    Args:
+        expressions: The expressions to evaluate (e.g., ["15 * 8", "2 ^ 10", "square root of 81"]).
+
+    Returns:
+        One table row per expression with its result or error.
+    """
+    expressions, skipped = split_batch(expressions)
+    if not expressions:
+        return "Error: No expressions provided."
+
+    results = await gather_bounded(calculate, expressions)
+    rows = [
+        [expression, f"Error: {result}" if isinstance(result, Exception) else result.removeprefix("Result: ")]
+        for expression, result in zip(expressions, results)
+    ]
+    lines = [f"🧮 Results for {len(expressions)} expressions:", format_table(["Expression", "Result"], rows)]
+    if skipped:
+        lines.append(f"⚠️ {skipped} more expressions were skipped (at most {MAX_BATCH_ITEMS} per call)")
+    return "\n".join(lines)
+
+
+class VariableColumn(BaseModel):
+    """A named variable and the values it takes, one per row."""
+
+    name: str
+    values: list[float]
+
+
+@function_tool
+async def calculator_table(expression: str, columns: list[VariableColumn], include_values: bool = False) -> str:
+    """
+    Evaluate one formula over many rows of variable values in a single call ("what-if" tables).
+    
+    Args:
+        expression: A formula using the column names as variables (e.g., "price * quantity * (1 - discount)").
+        columns: The variables and their values; every column must have the same number of rows.
+        include_values: Also return the full result column instead of only a summary (default: False).
+        
+    Returns:
+        A compact summary (rows, min, max, mean, sum) and optionally every result value.
+    """
+    try:
+        results = await _table_executor.run(
+            evaluate_vectorized, expression, {column.name: column.values for column in columns}
+        )
+    except ToolTimeoutError:
+        return TIMEOUT_MESSAGE
+    except ImportError:
+        return "Error: calculator_table requires NumPy to be installed."
+    except Exception as e:
+        return f"Error: Invalid mathematical expression. {str(e)}"
+
+    import numpy as np
+
+    finite = results[np.isfinite(results)]
+    lines = [f"📊 Table result for {expression} ({len(results)} rows)"]
+    if len(finite):
+        lines.append(
+            f"min={finite.min():.6g}, max={finite.max():.6g}, "
+            f"mean={finite.mean():.6g}, sum={finite.sum():.6g}"
+        )
+    if len(finite) < len(results):
+        lines.append(f"⚠️ {len(results) - len(finite)} rows were not finite (e.g. division by zero)")
+    if include_values:
+        lines.append("Values: " + ", ".join(f"{value:.6g}" for value in results))
+    return "\n".join(lines)
@@ -0,0 +1,168 @@
+"""
+Off-loop execution for synchronous, CPU-heavy tool functions.
+
+Each tool gets its own ``ToolExecutor``: a thread or process pool sized to the
+tool's concurrency cap, so at most ``max_concurrency`` calls of that tool run at
+once (the rest queue in the pool) and the event loop driving the Runner never
+runs tool code itself. Every call has a wall-clock timeout; a call that is
+still queued when it times out is cancelled, a running one is abandoned (a
+thread cannot be interrupted) and keeps its worker until it finishes.
+
+Decorate a sync tool function below ``@function_tool``:
+
+    @function_tool
+    @off_loop(timeout=10.0, max_concurrency=2)
+    def text_summarizer(text: str) -> str: ...
+"""
+
+import asyncio
+import functools
+import importlib
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Literal
+
+ExecutorKind = Literal["thread", "process"]
+
+# Every executor by tool name, for configuration and stats
+executors: dict[str, "ToolExecutor"] = {}
+
+# Undecorated tool functions by "module:qualname". The module attribute is the
+# FunctionTool, so process workers look functions up here instead of unpickling them.
+_functions: dict[str, Callable[..., Any]] = {}
+
+
+class ToolTimeoutError(TimeoutError):
+    """A tool call did not finish within its executor's timeout."""
+
+
+def _call_registered(key: str, args: tuple, kwargs: dict) -> Any:
+    """Process worker entry point: import the tool's module (which registers it) and call it."""
+    if key not in _functions:
+        importlib.import_module(key.split(":", 1)[0])
+    return _functions[key](*args, **kwargs)
+
+
+class ToolExecutor:
+    """Runs one tool's calls in a dedicated pool with a timeout and a concurrency cap."""
+
+    def __init__(
+        self,
+        name: str,
+        kind: ExecutorKind = "thread",
+        timeout: float | None = None,
+        max_concurrency: int | None = None,
+    ):
+        self.name = name
+        self.kind = kind
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self.calls = 0
+        self.timeouts = 0
+        self._pending: set[Future] = set()
+        self._pool: Executor | None = None
+        executors[name] = self
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.kind == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.max_concurrency)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix=f"tool-{self.name}")
+        return self._pool
+
+    def configure(
+        self,
+        kind: ExecutorKind | None = None,
+        timeout: float | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        """Change settings; the pool is rebuilt on the next call (calls already submitted finish on the old one)."""
+        if kind is not None:
+            self.kind = kind
+        if timeout is not None:
+            self.timeout = timeout
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+        self.shutdown(wait=False)
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run ``fn(*args, **kwargs)`` on the pool and await its result.
+
+        Raises:
+            ToolTimeoutError: If the call (queueing included) exceeds ``timeout``.
+        """
+        self.calls += 1
+        key = getattr(fn, "__tool_key__", None)
+        if self.kind == "process" and key is not None:
+            future = self._get_pool().submit(_call_registered, key, args, kwargs)
+        else:
+            future = self._get_pool().submit(fn, *args, **kwargs)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+
+        waiter = asyncio.wrap_future(future)
+        try:
+            # Shielded so a timeout or cancellation here never marks the worker's future cancelled
+            return await asyncio.wait_for(asyncio.shield(waiter), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            future.cancel()
+            raise ToolTimeoutError(f"{self.name} did not finish within {self.timeout} seconds") from None
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        finally:
+            if not waiter.done():
+                # Abandoned: retrieve the eventual outcome so it is not logged as unhandled
+                waiter.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+    def stats(self) -> dict[str, Any]:
+        """Settings and counters, for logging or benchmarks."""
+        return {
+            "kind": self.kind,
+            "timeout": self.timeout,
+            "max_concurrency": self.max_concurrency,
+            "calls": self.calls,
+            "timeouts": self.timeouts,
+            "in_flight": len(self._pending),
+        }
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+            self._pool = None
+
+
+def off_loop(
+    timeout: float | None = None,
+    max_concurrency: int | None = None,
+    kind: ExecutorKind = "thread",
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Turn a sync tool function into an async one that runs on its own ToolExecutor.
+
+    Args:
+        timeout: Wall-clock limit per call in seconds (None for no limit).
+        max_concurrency: How many calls of this tool may run at once (default: CPU count).
+        kind: "thread" for code that releases the GIL or is short, "process" for pure-Python CPU work.
+
+    Returns:
+        A decorator; the wrapped function keeps its name, signature and docstring,
+        so ``@function_tool`` generates the same schema as for the sync function.
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        fn.__tool_key__ = f"{fn.__module__}:{fn.__qualname__}"
+        _functions[fn.__tool_key__] = fn
+        executor = ToolExecutor(fn.__name__, kind, timeout, max_concurrency)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await executor.run(fn, *args, **kwargs)
+
+        wrapper.executor = executor
+        return wrapper
+
+    return decorator
@@ -0,0 +1,458 @@
+"""
+Expression engine for the calculator tool.
+
+Expressions are normalized (word operators such as "plus" or "squared" are
+rewritten to symbols), parsed once into a whitelisted AST and compiled into a
+tree of small closures. Compiled programs are kept in an LRU cache keyed on the
+normalized expression, so repeated expressions skip parsing and validation and
+are evaluated without ever calling ``eval``.
+
+Before compiling, a static cost estimator walks the AST and rejects inputs whose
+size, nesting depth or integer result magnitude (e.g. ``9**9**9``) would pin a
+CPU core. Float results are not limited: they overflow instead of growing. As a
+second line of defence, compiled programs check every integer power, product and
+``round()`` precision against the same budget before computing it, because a
+worker thread busy in a big-integer operation holds the GIL and cannot be
+stopped by a timeout.
+
+The same compiled program can also be evaluated over NumPy columns bound to
+named variables, turning a formula applied to thousands of rows into a single
+vectorized pass.
+"""
+
+import ast
+import math
+import operator
+import re
+from functools import lru_cache
+from typing import Any, Callable, Mapping, Sequence
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression cannot be parsed or uses something not allowed."""
+
+
+class ExpressionCostError(ExpressionError):
+    """Raised when an expression is statically estimated to be too expensive to evaluate."""
+
+
+# Static cost limits, checked before an expression is compiled
+MAX_EXPRESSION_LENGTH = 1000
+MAX_NODES = 400
+MAX_DEPTH = 100
+# Upper bound on the size of any intermediate result; 4096 bits is ~1233 decimal digits
+MAX_RESULT_BITS = 4096
+# Floats (and the float columns variables are bound to) overflow past ~2**1024
+# instead of growing, so only exact integer results are held to MAX_RESULT_BITS
+_FLOAT_BITS = 1024.0
+# Functions that turn a float into an integer of the same magnitude
+_INTEGER_FUNCTIONS = frozenset({"floor", "ceil", "round"})
+# Functions that return an exact integer when given one (abs(9) is the int 9)
+_EXACTNESS_PRESERVING_FUNCTIONS = frozenset({"abs"})
+# Largest |ndigits| accepted by round(); round(5, -n) computes 10**n, so it is held to the same digit budget
+MAX_ROUND_DIGITS = int(MAX_RESULT_BITS * math.log10(2))
+
+
+def _checked_round(number: Any, ndigits: Any = None) -> Any:
+    """``round(number, ndigits)``, refusing an ``ndigits`` beyond MAX_ROUND_DIGITS before computing it."""
+    if ndigits is not None and abs(ndigits) > MAX_ROUND_DIGITS:
+        raise ExpressionCostError(f"round() accepts at most {MAX_ROUND_DIGITS} digits")
+    return round(number, ndigits)
+
+
+# Names an expression may reference, resolved at evaluation time
+MATH_SCOPE: dict[str, Any] = {
+    "pi": math.pi,
+    "e": math.e,
+    "tau": math.tau,
+    "sqrt": math.sqrt,
+    "abs": abs,
+    "round": _checked_round,
+    "floor": math.floor,
+    "ceil": math.ceil,
+    "exp": math.exp,
+    "log": math.log,
+    "log10": math.log10,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+}
+
+# NumPy equivalents of MATH_SCOPE, built on first vectorized evaluation
+_numpy_scope: dict[str, Any] | None = None
+
+
+def _get_numpy_scope() -> dict[str, Any]:
+    """Build (once) the NumPy version of MATH_SCOPE; NumPy is only needed for vectorized use."""
+    global _numpy_scope
+    if _numpy_scope is None:
+        import numpy as np
+
+        _numpy_scope = {
+            "pi": np.pi,
+            "e": np.e,
+            "tau": 2 * np.pi,
+            "sqrt": np.sqrt,
+            "abs": np.abs,
+            "round": np.round,
+            "floor": np.floor,
+            "ceil": np.ceil,
+            "exp": np.exp,
+            "log": np.log,
+            "log10": np.log10,
+            "sin": np.sin,
+            "cos": np.cos,
+            "tan": np.tan,
+        }
+    return _numpy_scope
+
+
+def _too_large() -> ExpressionCostError:
+    return ExpressionCostError(
+        f"Result would be too large (estimated over {MAX_RESULT_BITS} bits); use smaller exponents or operands"
+    )
+
+
+def _checked_mul(left: Any, right: Any) -> Any:
+    """``left * right``, refusing integer products over MAX_RESULT_BITS before computing them."""
+    if isinstance(left, int) and isinstance(right, int):
+        if left.bit_length() + right.bit_length() - 1 > MAX_RESULT_BITS:
+            raise _too_large()
+    return left * right
+
+
+def _checked_pow(base: Any, exponent: Any) -> Any:
+    """``base ** exponent``, refusing integer powers over MAX_RESULT_BITS before computing them."""
+    if isinstance(base, int) and isinstance(exponent, int) and exponent > 0 and abs(base) > 1:
+        if math.log2(abs(base)) * exponent > MAX_RESULT_BITS:
+            raise _too_large()
+    return base ** exponent
+
+
+# Products and powers are the only operators whose integer results can outgrow their operands
+_BINARY_OPERATORS: dict[type, Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: _checked_mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: _checked_pow,
+}
+
+_UNARY_OPERATORS: dict[type, Callable[[Any], Any]] = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+# An operand for "square root of": a number, a name or a flat parenthesized group
+_OPERAND = r"(\d+(?:\.\d+)?|[a-z_]\w*|\([^()]*\))"
+
+# Word operators, longest phrases first so "multiplied by" wins over "by" style overlaps
+_WORD_OPERATORS = [
+    (re.compile(r"\bsquare root of\s*" + _OPERAND), r"sqrt(\1)"),
+    (re.compile(r"\bto the power of\b"), "**"),
+    (re.compile(r"\bmultiplied by\b"), "*"),
+    (re.compile(r"\bdivided by\b"), "/"),
+    (re.compile(r"\bplus\b"), "+"),
+    (re.compile(r"\bminus\b"), "-"),
+    (re.compile(r"\btimes\b"), "*"),
+    (re.compile(r"\bsquared\b"), "**2"),
+    (re.compile(r"\bcubed\b"), "**3"),
+    (re.compile(r"\^"), "**"),
+]
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def normalize_expression(expression: str) -> str:
+    """
+    Rewrite word operators to symbols and canonicalize whitespace and case.
+
+    Args:
+        expression: The raw expression, e.g. "3 squared plus square root of 16".
+
+    Returns:
+        The normalized expression, e.g. "3 **2 + sqrt(16)".
+    """
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise ExpressionCostError(f"Expression is longer than {MAX_EXPRESSION_LENGTH} characters")
+    normalized = _WHITESPACE.sub(" ", expression.strip().lower())
+    for pattern, replacement in _WORD_OPERATORS:
+        normalized = pattern.sub(replacement, normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+class Program:
+    """A compiled expression that can be evaluated repeatedly without re-parsing."""
+
+    __slots__ = ("source", "names", "_fn")
+
+    def __init__(self, source: str, names: frozenset[str], fn: Callable[[Mapping[str, Any]], Any]):
+        self.source = source
+        self.names = names
+        self._fn = fn
+
+    def evaluate(self, scope: Mapping[str, Any] = MATH_SCOPE) -> Any:
+        """Evaluate the program, resolving names from ``scope``."""
+        return self._fn(scope)
+
+    def __repr__(self) -> str:
+        return f"Program({self.source!r})"
+
+
+def _compile_node(node: ast.AST, allowed_names: frozenset[str], names: set[str]) -> Callable[[Mapping[str, Any]], Any]:
+    """Compile a single whitelisted AST node into a closure taking the name scope."""
+    if isinstance(node, ast.Constant):
+        value = node.value
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ExpressionError(f"Unsupported constant: {value!r}")
+        return lambda scope: value
+
+    if isinstance(node, ast.BinOp):
+        op = _BINARY_OPERATORS.get(type(node.op))
+        if op is None:
+            raise ExpressionError(f"Unsupported operator: {type(node.op).__name__}")
+        left = _compile_node(node.left, allowed_names, names)
+        right = _compile_node(node.right, allowed_names, names)
+        return lambda scope: op(left(scope), right(scope))
+
+    if isinstance(node, ast.UnaryOp):
+        op = _UNARY_OPERATORS.get(type(node.op))
+        if op is None:
+            raise ExpressionError(f"Unsupported operator: {type(node.op).__name__}")
+        operand = _compile_node(node.operand, allowed_names, names)
+        return lambda scope: op(operand(scope))
+
+    if isinstance(node, ast.Name):
+        name = node.id
+        if name not in allowed_names:
+            raise ExpressionError(f"Unknown name: {name}")
+        names.add(name)
+        return lambda scope: scope[name]
+
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            raise ExpressionError("Only simple function calls such as sqrt(x) are allowed")
+        func = _compile_node(node.func, allowed_names, names)
+        args = tuple(_compile_node(arg, allowed_names, names) for arg in node.args)
+        return lambda scope: func(scope)(*(arg(scope) for arg in args))
+
+    raise ExpressionError(f"Unsupported syntax: {type(node).__name__}")
+
+
+def _magnitude_bits(value: Any) -> float:
+    """log2(|value|) for a numeric constant, clamped at zero for |value| <= 1."""
+    value = abs(value)
+    return math.log2(value) if value > 1 else 0.0
+
+
+def _check_round_digits(node: ast.Call) -> None:
+    """Require round()'s ``ndigits`` to be a literal integer within MAX_ROUND_DIGITS."""
+    if len(node.args) < 2:
+        return
+    ndigits = node.args[1]
+    sign = 1
+    if isinstance(ndigits, ast.UnaryOp) and isinstance(ndigits.op, (ast.UAdd, ast.USub)):
+        sign = -1 if isinstance(ndigits.op, ast.USub) else 1
+        ndigits = ndigits.operand
+    if not isinstance(ndigits, ast.Constant) or isinstance(ndigits.value, bool) or not isinstance(ndigits.value, int):
+        raise ExpressionCostError("round() needs a whole number of digits, e.g. round(x, 2)")
+    if abs(sign * ndigits.value) > MAX_ROUND_DIGITS:
+        raise ExpressionCostError(f"round() accepts at most {MAX_ROUND_DIGITS} digits")
+
+
+def _has_variable(node: ast.AST) -> bool:
+    return any(isinstance(child, ast.Name) and child.id not in MATH_SCOPE for child in ast.walk(node))
+
+
+def _power_bits(base: float, exponent: float) -> float:
+    """log2 of the bits of ``base ** exponent``: |base ** exponent| <= 2 ** (base_bits * 2 ** exponent_bits)."""
+    return math.log2(base) + exponent if base > 0 else -math.inf
+
+
+def _estimate_bits(node: ast.AST, depth: int, budget: list[int]) -> tuple[float, bool]:
+    """
+    Estimate an upper bound on the magnitude (in bits) of a node's value, and whether it is an exact integer.
+
+    Also enforces the depth and node-count limits while walking the tree.
+    """
+    budget[0] -= 1
+    if budget[0] < 0:
+        raise ExpressionCostError(f"Expression has more than {MAX_NODES} elements")
+    if depth > MAX_DEPTH:
+        raise ExpressionCostError(f"Expression is nested deeper than {MAX_DEPTH} levels")
+
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, (int, float)):
+            return _magnitude_bits(node.value), isinstance(node.value, int)
+        return 0.0, False
+
+    if isinstance(node, ast.Name):
+        value = MATH_SCOPE.get(node.id)
+        return (_magnitude_bits(value), False) if isinstance(value, float) else (_FLOAT_BITS, False)
+
+    if isinstance(node, ast.UnaryOp):
+        return _estimate_bits(node.operand, depth + 1, budget)
+
+    if isinstance(node, ast.Call):
+        args = [_estimate_bits(arg, depth + 1, budget) for arg in node.args]
+        bits = max((arg_bits for arg_bits, _ in args), default=0.0)
+        name = node.func.id if isinstance(node.func, ast.Name) else None
+        if name == "round":
+            # round(5, -10**7) is 10**(10**7) worth of work no matter how small the number is
+            _check_round_digits(node)
+        # floor(1e300) is a 997-bit integer in scalar evaluation (NumPy keeps columns as floats)
+        exact = name in _INTEGER_FUNCTIONS and not _has_variable(node)
+        # abs(9) stays the exact integer 9, so abs(9)**9**9 must be limited like 9**9**9
+        if name in _EXACTNESS_PRESERVING_FUNCTIONS and args:
+            exact = all(arg_exact for _, arg_exact in args)
+        return (bits, True) if exact else (min(bits, _FLOAT_BITS), False)
+
+    if isinstance(node, ast.BinOp):
+        left, left_exact = _estimate_bits(node.left, depth + 1, budget)
+        right, right_exact = _estimate_bits(node.right, depth + 1, budget)
+        exact = left_exact and right_exact and not isinstance(node.op, ast.Div)
+        if isinstance(node.op, (ast.Add, ast.Sub)):
+            bits = max(left, right) + 1
+        elif isinstance(node.op, ast.Mult):
+            bits = left + right
+        elif isinstance(node.op, ast.Pow):
+            if isinstance(node.right, ast.UnaryOp) and isinstance(node.right.op, ast.USub):
+                # A negative exponent always produces a float, which overflows cheaply
+                bits, exact = min(left, _FLOAT_BITS), False
+            else:
+                # Compared in log space: the exponent's bits can be in the thousands
+                log_bits = _power_bits(left, right)
+                limit = MAX_RESULT_BITS if exact else _FLOAT_BITS
+                bits = 2.0 ** log_bits if log_bits <= math.log2(limit) else limit + 1
+        elif isinstance(node.op, ast.Mod):
+            # |a % b| < |b|, and can reach it when the signs differ: (-1) % 2**4000
+            bits = max(left, right)
+        elif isinstance(node.op, ast.FloorDiv):
+            # An integer divisor is at least 1 in magnitude, so the quotient never exceeds the dividend
+            bits = left
+        else:
+            # True division always produces a float
+            bits = left + 1
+        if not exact:
+            return min(bits, _FLOAT_BITS), False
+        if bits > MAX_RESULT_BITS:
+            raise _too_large()
+        return bits, True
+
+    # Anything else is rejected by the compiler with a clearer message
+    return 0.0, False
+
+
+def estimate_cost(tree: ast.AST) -> float:
+    """
+    Statically check a parsed expression against the cost limits.
+
+    Args:
+        tree: The parsed expression body.
+
+    Returns:
+        The estimated upper bound on the result magnitude, in bits.
+
+    Raises:
+        ExpressionCostError: If the expression exceeds any of the limits.
+    """
+    return _estimate_bits(tree, 0, [MAX_NODES])[0]
+
+
+def _compile(normalized: str, allowed_names: frozenset[str]) -> Program:
+    """Parse and compile a normalized expression (uncached)."""
+    if not normalized:
+        raise ExpressionError("Empty expression")
+    try:
+        tree = ast.parse(normalized, mode="eval")
+    except (SyntaxError, ValueError) as e:
+        raise ExpressionError(f"Could not parse expression: {normalized!r}") from e
+    except (RecursionError, MemoryError) as e:
+        raise ExpressionCostError("Expression is nested too deeply") from e
+    estimate_cost(tree.body)
+    names: set[str] = set()
+    fn = _compile_node(tree.body, allowed_names, names)
+    return Program(normalized, frozenset(names), fn)
+
+
+_MATH_NAMES = frozenset(MATH_SCOPE)
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(normalized: str, variables: frozenset[str] = frozenset()) -> Program:
+    """
+    Compile a normalized expression into a cached, reusable program.
+
+    Args:
+        normalized: An expression already passed through ``normalize_expression``.
+        variables: Extra names the expression may reference (bound at evaluation time).
+
+    Returns:
+        The compiled program. Repeated calls with the same expression hit the LRU cache.
+    """
+    return _compile(normalized, _MATH_NAMES | variables)
+
+
+def evaluate_expression(expression: str) -> int | float:
+    """
+    Normalize, compile (or fetch from cache) and evaluate an expression.
+
+    Args:
+        expression: The raw expression, word operators allowed.
+
+    Returns:
+        The numeric result, with integral floats collapsed to ``int``.
+    """
+    try:
+        result = compile_expression(normalize_expression(expression)).evaluate()
+    except OverflowError as e:
+        # A float past ~1.8e308 (or an integer too large to become one); never an expensive computation
+        raise ExpressionCostError("Result is too large to represent as a number") from e
+    if isinstance(result, float) and result.is_integer():
+        result = int(result)
+    return result
+
+
+def evaluate_vectorized(expression: str, columns: Mapping[str, Sequence[float]]) -> Any:
+    """
+    Evaluate one expression over columns of values in a single NumPy pass.
+
+    Args:
+        expression: The raw expression, referencing column names as variables (e.g. "price * qty").
+        columns: Mapping of variable name to its values; all columns must have the same length.
+
+    Returns:
+        A float64 NumPy array with one result per row.
+    """
+    import numpy as np
+
+    arrays: dict[str, Any] = {}
+    rows = None
+    for name, values in columns.items():
+        key = name.strip().lower()
+        if not key.isidentifier():
+            raise ExpressionError(f"Invalid variable name: {name!r}")
+        if key in MATH_SCOPE and callable(MATH_SCOPE[key]):
+            raise ExpressionError(f"Variable name shadows a function: {name!r}")
+        array = np.asarray(values, dtype=np.float64)
+        if array.ndim != 1:
+            raise ExpressionError(f"Column {name!r} must be a flat list of numbers")
+        if rows is None:
+            rows = len(array)
+        elif len(array) != rows:
+            raise ExpressionError(f"Column {name!r} has {len(array)} values, expected {rows}")
+        arrays[key] = array
+    if rows is None:
+        raise ExpressionError("At least one column of values is required")
+
+    program = compile_expression(normalize_expression(expression), frozenset(arrays))
+    scope = {**_get_numpy_scope(), **arrays}
+    with np.errstate(all="ignore"):
+        try:
+            result = program.evaluate(scope)
+        except OverflowError as e:
+            raise ExpressionCostError("Result is too large to represent as a number") from e
+    return np.broadcast_to(np.asarray(result, dtype=np.float64), (rows,))
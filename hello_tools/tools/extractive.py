@@ -0,0 +1,91 @@
+"""
+Extractive summarization engine for the text summarizer tool.
+
+Sentences are scored by TF-IDF centrality: each sentence becomes a sparse,
+L2-normalized TF-IDF row (kept in coordinate form as flat NumPy arrays) and its
+score is the cosine similarity to the document centroid. All weighting,
+normalization and scoring are ``np.bincount`` passes over the non-zeros, so the
+cost is linear in the number of tokens. Everything runs locally.
+"""
+
+import re
+from itertools import chain
+
+import numpy as np
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+_TOKEN = re.compile(r"[a-z0-9']+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have in is it its of on or that the "
+    "this to was were will with which who what when where how not no so than then "
+    "there these those they we you he she his her their our your i me my".split()
+)
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text into sentences on ., ! or ? followed by whitespace."""
+    return [sentence.strip() for sentence in _SENTENCE_BOUNDARY.split(text) if sentence.strip()]
+
+
+def score_sentences(sentences: list[str]) -> np.ndarray:
+    """
+    Score sentences by cosine similarity of their TF-IDF vector to the document centroid.
+
+    Args:
+        sentences: The document's sentences.
+
+    Returns:
+        One score per sentence, higher meaning more central to the document.
+    """
+    n_sentences = len(sentences)
+    # Tokenize each sentence on its own, so no character in the text can shift tokens into another row
+    per_sentence = [_TOKEN.findall(sentence.lower()) for sentence in sentences]
+    tokens = list(chain.from_iterable(per_sentence))
+    vocabulary: dict[str, int] = {}
+    ids = np.fromiter((vocabulary.setdefault(token, len(vocabulary)) for token in tokens), dtype=np.int64, count=len(tokens))
+
+    # Row of every token = index of its sentence; then drop stopwords
+    lengths = np.fromiter(map(len, per_sentence), dtype=np.int64, count=n_sentences)
+    rows = np.repeat(np.arange(n_sentences), lengths)
+    ignored = np.fromiter((term in STOPWORDS for term in vocabulary), dtype=bool, count=len(vocabulary))
+    keep = ~ignored[ids]
+    rows, cols = rows[keep], ids[keep]
+    if not len(cols):
+        return np.zeros(n_sentences)
+    n_terms = len(vocabulary)
+
+    # Collapse duplicate (sentence, term) pairs into counts: a sparse term-count matrix
+    keys, counts = np.unique(rows * n_terms + cols, return_counts=True)
+    rows_arr, cols_arr = np.divmod(keys, n_terms)
+
+    document_frequency = np.bincount(cols_arr, minlength=n_terms)
+    idf = np.log((1 + n_sentences) / (1 + document_frequency)) + 1.0
+    weights = (1.0 + np.log(counts)) * idf[cols_arr]
+
+    # L2-normalize each sentence row
+    norms = np.sqrt(np.bincount(rows_arr, weights=weights * weights, minlength=n_sentences))
+    weights /= norms[rows_arr]
+
+    centroid = np.bincount(cols_arr, weights=weights, minlength=n_terms)
+    centroid /= np.linalg.norm(centroid) or 1.0
+    return np.bincount(rows_arr, weights=weights * centroid[cols_arr], minlength=n_sentences)
+
+
+def select_central_sentences(sentences: list[str], max_length: int) -> list[str]:
+    """
+    Pick the highest-scoring sentences that fit in ``max_length``, in original order.
+
+    Sentences that do not fit are skipped so a shorter, lower-ranked one can still be used.
+    """
+    scores = score_sentences(sentences)
+    budget = max_length - 3  # -3 for "..."
+    chosen: list[int] = []
+    used = 0
+    # Stable sort keeps earlier sentences first among equal scores
+    for index in np.argsort(-scores, kind="stable"):
+        length = len(sentences[index]) + 1
+        if used + length <= budget:
+            chosen.append(int(index))
+            used += length
+    return [sentences[index] for index in sorted(chosen)]
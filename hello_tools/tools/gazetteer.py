@@ -0,0 +1,240 @@
+"""
+Gazetteer index for resolving free-form location strings to known places.
+
+Place names and aliases are normalized and kept as a single sorted list of keys,
+which doubles as an implicit trie: every prefix is a contiguous range found by
+bisection, so exact, prefix and fuzzy (edit distance) lookups need no per-node
+objects and 100k entries stay compact in memory. A word -> key index for
+multi-word names, built on first use, finds places that contain the query as
+whole words ("york" -> "new york"). The index is saved and loaded
+as a gzip-compressed TSV with the keys already sorted, so loading never sorts.
+
+Build an index file from a TSV of ``name<TAB>alias|alias<TAB>payload`` rows:
+    uv run python -m tools.gazetteer places.tsv places.gaz
+"""
+
+import gzip
+import re
+import sys
+import unicodedata
+from bisect import bisect_left
+from functools import cached_property
+from typing import Iterable
+
+_FORMAT_HEADER = "GAZETTEER\t1"
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_place(name: str) -> str:
+    """Lowercase, strip accents and punctuation, and collapse whitespace ("São Paulo!" -> "sao paulo")."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    ascii_name = decomposed.encode("ascii", "ignore").decode("ascii").lower()
+    return _NON_WORD.sub(" ", ascii_name).strip()
+
+
+class Gazetteer:
+    """Sorted-key index over place names with alias, containment, prefix and fuzzy lookup."""
+
+    def __init__(self, names: list[str], payloads: list[str], keys: list[str], key_entries: list[int]):
+        self.names = names
+        self.payloads = payloads
+        self._keys = keys
+        self._key_entries = key_entries
+        self._max_words = max((key.count(" ") + 1 for key in keys), default=1)
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[tuple[str, Iterable[str], str]]) -> "Gazetteer":
+        """
+        Build an index from ``(name, aliases, payload)`` entries.
+
+        Args:
+            entries: Canonical place name, alternative names, and an opaque payload string.
+
+        Returns:
+            The built index.
+        """
+        names: list[str] = []
+        payloads: list[str] = []
+        pairs: dict[str, int] = {}
+        for name, aliases, payload in entries:
+            index = len(names)
+            names.append(name)
+            payloads.append(payload)
+            for alias in (name, *aliases):
+                key = normalize_place(alias)
+                if key:
+                    pairs.setdefault(key, index)
+        keys = sorted(pairs)
+        return cls(names, payloads, keys, [pairs[key] for key in keys])
+
+    @classmethod
+    def load(cls, path: str) -> "Gazetteer":
+        """Load an index written by ``save``."""
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = f.readline().rstrip("\n").split("\t")
+            if "\t".join(header[:2]) != _FORMAT_HEADER:
+                raise ValueError(f"{path} is not a gazetteer index")
+            n_entries, n_keys = int(header[2]), int(header[3])
+            names: list[str] = []
+            payloads: list[str] = []
+            for _ in range(n_entries):
+                name, payload = f.readline().rstrip("\n").split("\t", 1)
+                names.append(name)
+                payloads.append(payload)
+            keys: list[str] = []
+            key_entries: list[int] = []
+            for _ in range(n_keys):
+                key, index = f.readline().rstrip("\n").split("\t")
+                keys.append(key)
+                key_entries.append(int(index))
+        return cls(names, payloads, keys, key_entries)
+
+    def save(self, path: str) -> None:
+        """Write the index as gzip-compressed TSV, keys pre-sorted."""
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(f"{_FORMAT_HEADER}\t{len(self.names)}\t{len(self._keys)}\n")
+            for name, payload in zip(self.names, self.payloads):
+                f.write(f"{name}\t{payload}\n")
+            for key, index in zip(self._keys, self._key_entries):
+                f.write(f"{key}\t{index}\n")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _exact(self, key: str) -> int | None:
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            return self._key_entries[position]
+        return None
+
+    def _contained(self, key: str) -> int | None:
+        """Find the longest known place spelled out as whole words inside the query."""
+        words = key.split(" ")
+        for size in range(min(len(words), self._max_words), 0, -1):
+            for start in range(len(words) - size + 1):
+                found = self._exact(" ".join(words[start:start + size]))
+                if found is not None:
+                    return found
+        return None
+
+    @cached_property
+    def _word_keys(self) -> dict[str, list[int]]:
+        """Positions of the multi-word keys containing each word (single-word keys are found exactly)."""
+        word_keys: dict[str, list[int]] = {}
+        for position, key in enumerate(self._keys):
+            if " " in key:
+                for word in set(key.split(" ")):
+                    word_keys.setdefault(word, []).append(position)
+        return word_keys
+
+    def _within(self, key: str) -> int | None:
+        """Find the shortest known place whose name contains the query as whole words."""
+        candidates = [self._word_keys.get(word) for word in set(key.split(" "))]
+        if not all(candidates):
+            return None
+        padded = f" {key} "
+        best: int | None = None
+        for position in min(candidates, key=len):
+            name = self._keys[position]
+            if padded in f" {name} " and (best is None or len(name) < len(self._keys[best])):
+                best = position
+        return None if best is None else self._key_entries[best]
+
+    def _prefixed(self, key: str) -> int | None:
+        """Find the shortest known place whose name starts with the query."""
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position].startswith(key):
+            end = bisect_left(self._keys, key + "\x7f", position)
+            shortest = min(range(position, end), key=lambda i: len(self._keys[i]))
+            return self._key_entries[shortest]
+        return None
+
+    def _fuzzy(self, key: str, max_distance: int) -> int | None:
+        """
+        Levenshtein search, walking the sorted keys as an implicit trie.
+
+        Only the diagonal band of width ``max_distance`` is computed for each
+        trie row, and branches whose band is already over the limit are pruned.
+        """
+        keys = self._keys
+        if not keys:
+            return None
+        size = len(key)
+        limit = max_distance + 1
+        best: tuple[int, int] | None = None
+        stack = [(0, len(keys), 0, [min(j, limit) for j in range(size + 1)])]
+        while stack:
+            lo, hi, depth, row = stack.pop()
+            # Within a prefix range, a key ending exactly at this depth sorts first
+            if len(keys[lo]) == depth:
+                if row[size] <= max_distance and (best is None or (row[size], lo) < best):
+                    best = (row[size], lo)
+                lo += 1
+            first = max(1, depth + 1 - max_distance)
+            last = min(size, depth + 1 + max_distance)
+            while lo < hi:
+                char = keys[lo][depth]
+                end = bisect_left(keys, keys[lo][:depth] + chr(ord(char) + 1), lo, hi)
+                next_row = [limit] * (size + 1)
+                next_row[0] = min(depth + 1, limit)
+                best_in_row = next_row[0]
+                for j in range(first, last + 1):
+                    cost = min(next_row[j - 1] + 1, row[j] + 1, row[j - 1] + (key[j - 1] != char), limit)
+                    next_row[j] = cost
+                    if cost < best_in_row:
+                        best_in_row = cost
+                if best_in_row <= max_distance:
+                    stack.append((lo, end, depth + 1, next_row))
+                lo = end
+        return None if best is None else self._key_entries[best[1]]
+
+    def lookup(self, query: str) -> tuple[str, str] | None:
+        """
+        Resolve a free-form location to a known place.
+
+        Tries, in order: exact name or alias, a known place contained in the query
+        ("weather in london uk"), a place containing the query as whole words
+        ("york"), a place starting with the query ("new yo"), and finally a fuzzy
+        match within a small edit distance ("londn").
+
+        Args:
+            query: The location as written by the user or model.
+
+        Returns:
+            The canonical ``(name, payload)``, or None if nothing matches.
+        """
+        key = normalize_place(query)
+        if not key:
+            return None
+        index = self._exact(key)
+        if index is None:
+            index = self._contained(key)
+        if index is None and len(key) >= 3:
+            index = self._within(key)
+        if index is None and len(key) >= 3:
+            index = self._prefixed(key)
+        if index is None and len(key) >= 4:
+            index = self._fuzzy(key, 1 if len(key) <= 6 else 2)
+        if index is None:
+            return None
+        return self.names[index], self.payloads[index]
+
+
+def read_tsv(path: str) -> Iterable[tuple[str, list[str], str]]:
+    """Read ``name<TAB>alias|alias<TAB>payload`` rows (aliases and payload optional)."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            fields = line.rstrip("\n").split("\t")
+            if not fields[0]:
+                continue
+            aliases = [alias for alias in fields[1].split("|") if alias] if len(fields) > 1 else []
+            yield fields[0], aliases, fields[2] if len(fields) > 2 else ""
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python -m tools.gazetteer <places.tsv> <output.gaz>")
+        sys.exit(1)
+    gazetteer = Gazetteer.from_entries(read_tsv(sys.argv[1]))
+    gazetteer.save(sys.argv[2])
+    print(f"Wrote {len(gazetteer)} places to {sys.argv[2]}")
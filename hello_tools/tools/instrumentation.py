@@ -0,0 +1,213 @@
+"""
+Per-tool call metrics for function tools.
+
+``instrument`` wraps a FunctionTool's ``on_invoke_tool`` and records, per tool,
+call and error counts, calls in flight, argument and result sizes (in
+characters) and a latency histogram. Recording is a few counter updates per
+call, so it is meant to stay on; set ``TOOL_METRICS=0`` to skip wrapping. The
+registry instruments every tool it builds:
+
+    from tools import instrumentation
+
+    print(instrumentation.format_stats())   # table for the REPL
+    instrumentation.to_json()               # JSON snapshot
+    instrumentation.to_prometheus()         # Prometheus text exposition format
+"""
+
+import json
+import os
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Any
+
+from agents import FunctionTool, RunContextWrapper
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is +Inf
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# How many recent calls keep their latency, for per-run reports keyed by tool call ID
+MAX_RECENT_CALLS = 1000
+
+ENABLED = os.getenv("TOOL_METRICS", "1") != "0"
+
+
+class ToolStats:
+    """Counters and latency histogram of one tool."""
+
+    __slots__ = (
+        "name", "calls", "errors", "error_results", "in_flight",
+        "argument_chars", "result_chars", "latency_sum", "latency_max", "buckets", "last_error",
+    )
+
+    def __init__(self, name: str):
+        self.name = name
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.error_results = 0
+        self.in_flight = 0
+        self.argument_chars = 0
+        self.result_chars = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.last_error: str | None = None
+
+    def observe(self, seconds: float) -> None:
+        self.latency_sum += seconds
+        if seconds > self.latency_max:
+            self.latency_max = seconds
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def quantile(self, q: float) -> float:
+        """Latency quantile estimated from the histogram (the bucket's upper bound, capped at the max)."""
+        finished = sum(self.buckets)
+        if not finished:
+            return 0.0
+        rank = q * finished
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS + (self.latency_max,), self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.latency_max)
+        return self.latency_max
+
+    def snapshot(self) -> dict[str, Any]:
+        finished = sum(self.buckets)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "error_results": self.error_results,
+            "in_flight": self.in_flight,
+            "argument_chars": self.argument_chars,
+            "result_chars": self.result_chars,
+            "latency_mean": self.latency_sum / finished if finished else 0.0,
+            "latency_p50": self.quantile(0.5),
+            "latency_p95": self.quantile(0.95),
+            "latency_max": self.latency_max,
+            "latency_sum": self.latency_sum,
+            "latency_buckets": dict(zip([*map(str, LATENCY_BUCKETS), "+Inf"], self.buckets)),
+            "last_error": self.last_error,
+        }
+
+
+# Every instrumented tool's stats by name
+tool_stats: dict[str, ToolStats] = {}
+# Tool call ID -> seconds, for the most recent calls
+call_latency: "OrderedDict[str, float]" = OrderedDict()
+
+
+def _is_error_result(result: Any) -> bool:
+    # The tools here report failures as "Error: ..." / "Error performing ..." strings
+    return isinstance(result, str) and result.startswith("Error")
+
+
+def instrument(tool: FunctionTool) -> FunctionTool:
+    """
+    Record metrics for every call of ``tool`` (wrapped in place, at most once).
+
+    Returns:
+        The same tool, for use in list comprehensions.
+    """
+    if not ENABLED or getattr(tool.on_invoke_tool, "instrumented", False):
+        return tool
+    stats = tool_stats.setdefault(tool.name, ToolStats(tool.name))
+    invoke = tool.on_invoke_tool
+
+    async def on_invoke_tool(ctx: RunContextWrapper[Any], input: str) -> Any:
+        stats.calls += 1
+        stats.in_flight += 1
+        stats.argument_chars += len(input)
+        start = time.perf_counter()
+        try:
+            result = await invoke(ctx, input)
+        except Exception as e:
+            stats.errors += 1
+            stats.last_error = f"{type(e).__name__}: {e}"
+            raise
+        else:
+            stats.result_chars += len(result) if isinstance(result, str) else len(str(result))
+            if _is_error_result(result):
+                stats.error_results += 1
+                stats.last_error = result[:200]
+            return result
+        finally:
+            seconds = time.perf_counter() - start
+            stats.in_flight -= 1
+            stats.observe(seconds)
+            call_id = getattr(ctx, "tool_call_id", None)
+            if call_id:
+                call_latency[call_id] = seconds
+                if len(call_latency) > MAX_RECENT_CALLS:
+                    call_latency.popitem(last=False)
+
+    on_invoke_tool.instrumented = True
+    tool.on_invoke_tool = on_invoke_tool
+    return tool
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    """Every tool's metrics, by tool name."""
+    return {name: stats.snapshot() for name, stats in sorted(tool_stats.items())}
+
+
+def reset() -> None:
+    for stats in tool_stats.values():
+        stats.reset()
+    call_latency.clear()
+
+
+def to_json(indent: int | None = 2) -> str:
+    return json.dumps(snapshot(), indent=indent)
+
+
+def _labels(tool: str, **extra: str) -> str:
+    labels = {"tool": tool, **extra}
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels.items()) + "}"
+
+
+def to_prometheus() -> str:
+    """All metrics in the Prometheus text exposition format."""
+    families = [
+        ("tool_calls_total", "counter", "Tool invocations.", "calls"),
+        ("tool_errors_total", "counter", "Tool invocations that raised.", "errors"),
+        ("tool_error_results_total", "counter", "Tool invocations that returned an error message.", "error_results"),
+        ("tool_in_flight", "gauge", "Tool invocations running now.", "in_flight"),
+        ("tool_argument_chars_total", "counter", "Characters of tool call arguments.", "argument_chars"),
+        ("tool_result_chars_total", "counter", "Characters of tool results.", "result_chars"),
+    ]
+    lines = []
+    tools = sorted(tool_stats.items())
+    for metric, kind, help_text, field in families:
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}"]
+        lines += [f"{metric}{_labels(name)} {getattr(stats, field)}" for name, stats in tools]
+
+    lines += ["# HELP tool_latency_seconds Tool invocation latency.", "# TYPE tool_latency_seconds histogram"]
+    for name, stats in tools:
+        cumulative = 0
+        for bound, count in zip([*map(str, LATENCY_BUCKETS), "+Inf"], stats.buckets):
+            cumulative += count
+            lines.append(f"tool_latency_seconds_bucket{_labels(name, le=bound)} {cumulative}")
+        lines.append(f"tool_latency_seconds_sum{_labels(name)} {stats.latency_sum}")
+        lines.append(f"tool_latency_seconds_count{_labels(name)} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+def format_stats() -> str:
+    """A table of the tools called so far, busiest first."""
+    called = sorted((stats for stats in tool_stats.values() if stats.calls), key=lambda stats: -stats.latency_sum)
+    if not called:
+        return "  No tool calls yet."
+    lines = [
+        f"  {'tool':<22} {'calls':>5} {'errors':>6} {'p50':>8} {'p95':>8} {'max':>8} {'total':>8} {'args':>7} {'result':>8}"
+    ]
+    for stats in called:
+        lines.append(
+            f"  {stats.name:<22} {stats.calls:>5} {stats.errors + stats.error_results:>6}"
+            f" {stats.quantile(0.5) * 1000:>6.0f}ms {stats.quantile(0.95) * 1000:>6.0f}ms"
+            f" {stats.latency_max * 1000:>6.0f}ms {stats.latency_sum:>7.2f}s"
+            f" {stats.argument_chars:>7} {stats.result_chars:>8}"
+        )
+    return "\n".join(lines)
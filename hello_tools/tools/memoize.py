@@ -0,0 +1,148 @@
+"""
+Opt-in memoization for deterministic function tools.
+
+``@memoize`` goes between ``@function_tool`` and the tool function. Calls are
+keyed on the canonicalized arguments (bound to the signature with defaults
+applied and serialized as sorted JSON), results live in a size-bounded LRU
+with an optional TTL, and identical calls that overlap, such as the parallel
+tool calls of one model turn, share a single execution. That holds for sync
+tools too, which may be called from several worker threads at once. Each tool's hit, miss
+and coalesced counters are available from ``memos``:
+
+    @function_tool
+    @memoize(maxsize=1024, ttl=300)
+    async def weather_fetcher(location: str) -> str: ...
+"""
+
+import asyncio
+import functools
+import inspect
+import json
+from typing import Any, Callable
+
+from agents import RunContextWrapper
+from pydantic import BaseModel
+
+from .cache import MISSING, SingleFlight, ThreadSingleFlight, TTLCache
+
+# Every memoized tool by name, for stats and cache clearing
+memos: dict[str, "Memo"] = {}
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    raise TypeError(f"cannot build a cache key from {type(value).__name__}")
+
+
+def canonical_key(arguments: dict[str, Any]) -> str:
+    """Stable cache key for bound arguments, ignoring the run context."""
+    arguments = {name: value for name, value in arguments.items() if not isinstance(value, RunContextWrapper)}
+    return json.dumps(arguments, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_jsonable)
+
+
+class Memo:
+    """The result cache, in-flight table and counters of one memoized tool."""
+
+    def __init__(self, name: str, maxsize: int, ttl: float | None):
+        self.name = name
+        self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.executions = 0
+        self._flights = SingleFlight()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Sync tools run on worker threads, so they coalesce across threads instead of tasks
+        self.thread_flights = ThreadSingleFlight()
+        memos[name] = self
+
+    def flights(self) -> SingleFlight:
+        """The in-flight table for the running loop (tasks cannot be shared across loops)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            coalesced = self._flights.coalesced
+            self._flights = SingleFlight()
+            self._flights.coalesced = coalesced
+            self._loop = loop
+        return self._flights
+
+    def stats(self) -> dict[str, float]:
+        """Hit/miss counters, for logging or benchmarks."""
+        return {
+            "hits": self.cache.hits,
+            "misses": self.cache.misses,
+            "hit_rate": self.cache.hit_rate,
+            "coalesced": self._flights.coalesced + self.thread_flights.coalesced,
+            "executions": self.executions,
+            "size": len(self.cache),
+        }
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+
+def memoize(
+    maxsize: int = 256,
+    ttl: float | None = None,
+    key: Callable[[dict[str, Any]], Any] | None = None,
+    cache_if: Callable[[Any], bool] | None = None,
+    name: str | None = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Cache a deterministic tool function's results by its arguments.
+
+    Args:
+        maxsize: Most results kept; the least recently used is evicted first.
+        ttl: Seconds a result stays valid (None to keep it until evicted).
+        key: Builds the cache key from the bound arguments (default: canonical JSON of all of them).
+        cache_if: Return False to not cache a result (e.g. a timeout message); exceptions are never cached.
+        name: Name for the stats in ``memos`` (default: the function's name).
+
+    Returns:
+        A decorator; the wrapped function keeps its name, signature and docstring,
+        so ``@function_tool`` generates the same schema.
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(fn)
+        memo = Memo(name or fn.__name__, maxsize, ttl)
+
+        def make_key(args: tuple, kwargs: dict) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return key(bound.arguments) if key is not None else canonical_key(bound.arguments)
+
+        def store(cache_key: Any, result: Any) -> Any:
+            memo.executions += 1
+            if cache_if is None or cache_if(result):
+                memo.cache.set(cache_key, result)
+            return result
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                cache_key = make_key(args, kwargs)
+                result = memo.cache.get(cache_key)
+                if result is not MISSING:
+                    return result
+
+                async def execute() -> Any:
+                    return store(cache_key, await fn(*args, **kwargs))
+
+                return await memo.flights().run(cache_key, execute)
+
+        else:
+
+            @functools.wraps(fn)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                cache_key = make_key(args, kwargs)
+                result = memo.cache.get(cache_key)
+                if result is not MISSING:
+                    return result
+                return memo.thread_flights.run(cache_key, lambda: store(cache_key, fn(*args, **kwargs)))
+
+        wrapper.memo = memo
+        return wrapper
+
+    return decorator
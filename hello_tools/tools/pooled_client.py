@@ -0,0 +1,78 @@
+"""
+A pooled ``httpx.AsyncClient`` that follows the running event loop.
+
+An ``httpx.AsyncClient`` is bound to the loop it first ran on, but a tool can
+be called from more than one loop over a process's lifetime (e.g. a REPL turn
+run through ``Runner.run_sync`` creates a fresh loop each time). ``PooledClient``
+hands out one shared client per loop: when the loop changes it closes the old
+client in the background instead of leaking its connections, builds a new one
+and lets its owner reset any other per-loop state.
+"""
+
+import asyncio
+from typing import Callable
+
+import httpx
+
+
+class PooledClient:
+    """One shared ``httpx.AsyncClient`` for the running loop, recreated when the loop changes."""
+
+    def __init__(
+        self,
+        factory: Callable[[], httpx.AsyncClient],
+        on_new_loop: Callable[[], None] | None = None,
+    ):
+        """
+        Args:
+            factory: Builds a new client; called on first use and after every loop change.
+            on_new_loop: Called when a client is built for a different loop than the last one,
+                to drop state (in-flight tasks, pending writes) that belonged to the old loop.
+        """
+        self._factory = factory
+        self._on_new_loop = on_new_loop
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._closing: set[asyncio.Task] = set()
+
+    def get(self) -> httpx.AsyncClient:
+        """Return the client for the running loop, creating it (and retiring a stale one) if needed."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            if self._client is not None:
+                self._close_stale(self._client)
+                if self._on_new_loop is not None:
+                    self._on_new_loop()
+            self._client = self._factory()
+            self._loop = loop
+        return self._client
+
+    def _close_stale(self, client: httpx.AsyncClient) -> None:
+        """Close a client bound to a previous loop in the background instead of leaking its connections."""
+        # Tasks left on an older loop can never be awaited from this one
+        loop = asyncio.get_running_loop()
+        self._closing.difference_update([task for task in self._closing if task.get_loop() is not loop])
+        closing = asyncio.ensure_future(close_quietly(client))
+        self._closing.add(closing)
+        closing.add_done_callback(self._closing.discard)
+
+    async def aclose(self) -> None:
+        """Close the current client and wait for stale ones still closing on this loop."""
+        loop = asyncio.get_running_loop()
+        closing = [task for task in self._closing if task.get_loop() is loop]
+        if closing:
+            await asyncio.gather(*closing, return_exceptions=True)
+        self._closing.clear()
+        if self._client is not None:
+            await close_quietly(self._client)
+            self._client = None
+            self._loop = None
+
+
+async def close_quietly(client: httpx.AsyncClient) -> None:
+    """Close a client, tolerating one whose loop is already gone."""
+    try:
+        await client.aclose()
+    except RuntimeError:
+        # Its loop is already closed, so the transports cannot be shut down; the sockets are freed when collected
+        pass
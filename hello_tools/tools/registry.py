@@ -0,0 +1,107 @@
+"""
+Lazy registry for the hello_tools function tools.
+
+Tool schemas are read from ``manifest.json`` so an agent can be built, and its
+tools advertised to the model, without importing any tool implementation (or
+NumPy, httpx and friends). Each implementation is imported on the first call
+to that tool. Regenerate the manifest after changing a tool's signature or
+docstring:
+
+    uv run python -m tools.registry          # rewrite tools/manifest.json
+    uv run python -m tools.registry --check  # fail if the manifest is stale
+"""
+
+import argparse
+import json
+import os
+import sys
+from functools import lru_cache
+from typing import Any
+
+from agents import FunctionTool, RunContextWrapper
+
+from . import TOOL_MODULES, load_tool
+from .instrumentation import instrument
+
+MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "manifest.json")
+
+
+def load_implementation(name: str) -> FunctionTool:
+    """Import the module defining ``name`` and return the real FunctionTool."""
+    return load_tool(name)
+
+
+@lru_cache(maxsize=1)
+def load_manifest() -> dict[str, dict[str, Any]]:
+    """Tool name -> {description, params_json_schema, strict_json_schema}, read once."""
+    with open(MANIFEST_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def lazy_tool(name: str) -> FunctionTool:
+    """
+    Build a FunctionTool from the manifest that imports its implementation on first use.
+
+    Args:
+        name: A tool name from ``TOOL_MODULES``.
+
+    Returns:
+        A FunctionTool with the real tool's schema, delegating every call to it.
+    """
+    spec = load_manifest()[name]
+    implementation: FunctionTool | None = None
+
+    async def on_invoke_tool(ctx: RunContextWrapper[Any], input: str) -> Any:
+        nonlocal implementation
+        if implementation is None:
+            implementation = load_implementation(name)
+        return await implementation.on_invoke_tool(ctx, input)
+
+    return FunctionTool(
+        name=name,
+        description=spec["description"],
+        params_json_schema=spec["params_json_schema"],
+        on_invoke_tool=on_invoke_tool,
+        strict_json_schema=spec["strict_json_schema"],
+    )
+
+
+def get_tools(names: list[str] | None = None) -> list[FunctionTool]:
+    """Lazy, instrumented FunctionTools for ``names`` (default: every registered tool)."""
+    return [instrument(lazy_tool(name)) for name in (names or TOOL_MODULES)]
+
+
+def build_manifest() -> dict[str, dict[str, Any]]:
+    """Import every tool and collect the schema the model sees."""
+    manifest = {}
+    for name in TOOL_MODULES:
+        tool = load_implementation(name)
+        manifest[name] = {
+            "description": tool.description,
+            "params_json_schema": tool.params_json_schema,
+            "strict_json_schema": tool.strict_json_schema,
+        }
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate or check tools/manifest.json")
+    parser.add_argument("--check", action="store_true", help="exit 1 if the manifest is out of date")
+    args = parser.parse_args()
+
+    manifest = build_manifest()
+    if args.check:
+        if load_manifest() != manifest:
+            print("❌ tools/manifest.json is out of date; run: uv run python -m tools.registry")
+            sys.exit(1)
+        print("✅ tools/manifest.json is up to date")
+        return
+
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    print(f"Wrote {len(manifest)} tool schemas to {MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
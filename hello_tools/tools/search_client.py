@@ -0,0 +1,214 @@
+"""
+Async, cached client for the Tavily search API.
+
+Searches go through one pooled ``httpx.AsyncClient``. Results are cached in an
+in-memory LRU+TTL keyed on the normalized query and, optionally, in a SQLite
+file that survives restarts. Concurrent identical searches share one upstream
+request. ``TAVILY_API_URL`` can point at a local stand-in endpoint for offline
+benchmarks.
+"""
+
+import asyncio
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any
+
+import httpx
+
+from .cache import MISSING, SingleFlight, TTLCache
+from .pooled_client import PooledClient
+
+DEFAULT_TAVILY_API_URL = "https://api.tavily.com"
+# Expired rows are deleted when the disk cache opens and after every this many writes
+DISK_PRUNE_INTERVAL = 256
+
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Canonical cache key for a query: lowercase, single spaces, no trailing punctuation."""
+    return _SPACES.sub(" ", query.lower()).strip().rstrip("?!.").strip()
+
+
+class DiskCache:
+    """A tiny SQLite key/value store with per-entry expiry, safe to use from worker threads."""
+
+    def __init__(self, path: str, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            # WAL with relaxed syncing keeps each cache write from waiting on an fsync
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+        self._writes = 0
+        self.prune()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM search_cache WHERE key = ? AND expires >= ?", (key, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else MISSING
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO search_cache (key, value, expires) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time() + self.ttl),
+            )
+            self._writes += 1
+            prune = self._writes % DISK_PRUNE_INTERVAL == 0
+        if prune:
+            self.prune()
+
+    def prune(self) -> int:
+        """Delete expired rows, so the file does not grow with queries that are never repeated."""
+        with self._lock, self._connection:
+            return self._connection.execute("DELETE FROM search_cache WHERE expires < ?", (time.time(),)).rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class SearchClient:
+    """Pooled, cached, coalescing Tavily search client."""
+
+    def __init__(
+        self,
+        api_key: str | None,
+        base_url: str = DEFAULT_TAVILY_API_URL,
+        ttl: float = 3600.0,
+        max_entries: int = 512,
+        disk_cache_path: str | None = None,
+        timeout: float = 20.0,
+        max_connections: int = 10,
+        max_results: int = 5,
+    ):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_results = max_results
+        self.cache = TTLCache(maxsize=max_entries, ttl=ttl)
+        self.disk_cache = DiskCache(disk_cache_path, ttl) if disk_cache_path else None
+        self.disk_hits = 0
+        self.upstream_calls = 0
+        self._pending_writes: set[asyncio.Task] = set()
+        self._flights = SingleFlight()
+        self._client = PooledClient(self._new_client, on_new_loop=self._reset_loop_state)
+
+    def _new_client(self) -> httpx.AsyncClient:
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
+
+    def _reset_loop_state(self) -> None:
+        # In-flight searches and write-behind tasks belong to the old loop; keep only the counter
+        coalesced = self._flights.coalesced
+        self._flights = SingleFlight()
+        self._flights.coalesced = coalesced
+        self._pending_writes = set()
+
+    async def _fetch(self, key: str, query: str) -> dict[str, Any]:
+        if self.disk_cache is not None:
+            results = await asyncio.to_thread(self.disk_cache.get, key)
+            if results is not MISSING:
+                self.disk_hits += 1
+                self.cache.set(key, results)
+                return results
+
+        self.upstream_calls += 1
+        response = await self._client.get().post(
+            "/search", json={"query": query, "search_depth": "basic", "max_results": self.max_results}
+        )
+        response.raise_for_status()
+        results = response.json()
+        self.cache.set(key, results)
+        if self.disk_cache is not None:
+            # Write behind: callers get their results without waiting for SQLite
+            write = asyncio.ensure_future(asyncio.to_thread(self.disk_cache.set, key, results))
+            self._pending_writes.add(write)
+            write.add_done_callback(self._pending_writes.discard)
+        return results
+
+    async def search(self, query: str) -> dict[str, Any]:
+        """
+        Search the web, answering from the memory or disk cache when possible.
+
+        Args:
+            query: The search query.
+
+        Returns:
+            The Tavily response (``results`` list of title/url/content/score, plus metadata).
+        """
+        key = normalize_query(query)
+        results = self.cache.get(key)
+        if results is not MISSING:
+            return results
+        self._client.get()  # binds the pooled client and in-flight table to this loop
+        return await self._flights.run(key, lambda: self._fetch(key, query))
+
+    def stats(self) -> dict[str, float]:
+        """Cache and upstream counters, for logging or benchmarks."""
+        lookups = self.cache.hits + self.cache.misses
+        return {
+            "memory_hits": self.cache.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.cache.misses - self.disk_hits,
+            "hit_rate": (self.cache.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "coalesced": self._flights.coalesced,
+            "upstream_calls": self.upstream_calls,
+        }
+
+    async def aclose(self) -> None:
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+        await self._client.aclose()
+        if self.disk_cache is not None:
+            self.disk_cache.close()
+
+
+_client: SearchClient | None = None
+
+
+def get_search_client() -> SearchClient:
+    """
+    Return the shared search client, created on first use from the environment.
+
+    ``TAVILY_API_KEY`` authenticates, ``TAVILY_API_URL`` overrides the endpoint,
+    ``WEB_SEARCH_CACHE_PATH`` enables the SQLite cache and ``WEB_SEARCH_CACHE_TTL``
+    sets the cache lifetime in seconds.
+    """
+    global _client
+    if _client is None:
+        _client = SearchClient(
+            api_key=os.getenv("TAVILY_API_KEY"),
+            base_url=os.getenv("TAVILY_API_URL", DEFAULT_TAVILY_API_URL),
+            ttl=float(os.getenv("WEB_SEARCH_CACHE_TTL", "3600")),
+            disk_cache_path=os.getenv("WEB_SEARCH_CACHE_PATH") or None,
+        )
+    return _client
+
+
+async def close_search_client() -> None:
+    """Close the shared search client if one was created (never builds one just to close it)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,159 @@
+"""
+Compaction of raw web search responses before they reach the model.
+
+Hits are parsed out of the Tavily response, deduplicated by URL and title,
+ranked by score and trimmed to a token budget, then rendered in a compact,
+stable plain-text format. Every call records how many bytes and (estimated)
+tokens were saved compared with sending the titles, URLs, snippets and answer
+of every raw hit.
+"""
+
+import logging
+import os
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Token budget for one compacted result set; roughly 4 characters per token
+DEFAULT_TOKEN_BUDGET = int(os.getenv("WEB_SEARCH_TOKEN_BUDGET", "600"))
+CHARS_PER_TOKEN = 4
+MAX_HITS = 5
+# Titles come out of the same budget; past this length they are trimmed like snippets
+MAX_TITLE_CHARS = 100
+# Below this much room for a title, the remaining hits are dropped rather than shown as "[4] …"
+MIN_TITLE_CHARS = 16
+
+_SPACES = re.compile(r"\s+")
+
+
+@dataclass
+class CompactionReport:
+    """Size of one search result before and after compaction (tokens estimated from bytes)."""
+
+    query: str
+    hits_before: int
+    hits_after: int
+    bytes_before: int
+    bytes_after: int
+
+    @property
+    def tokens_before(self) -> int:
+        return (self.bytes_before + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+    @property
+    def tokens_after(self) -> int:
+        return (self.bytes_after + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+    def __str__(self) -> str:
+        saved = 1 - self.bytes_after / self.bytes_before if self.bytes_before else 0.0
+        return (
+            f"compacted {self.query!r}: {self.hits_before} -> {self.hits_after} hits, "
+            f"{self.bytes_before} -> {self.bytes_after} bytes, "
+            f"~{self.tokens_before} -> ~{self.tokens_after} tokens ({saved:.0%} saved)"
+        )
+
+
+# The most recent reports, for the REPL or benchmarks
+reports: deque[CompactionReport] = deque(maxlen=1000)
+
+
+def _url_key(url: str) -> str:
+    parts = urlsplit(url.strip().lower())
+    host = parts.netloc.removeprefix("www.")
+    return host + parts.path.rstrip("/")
+
+
+def _display_url(url: str) -> str:
+    parts = urlsplit(url.strip())
+    return (parts.netloc.removeprefix("www.") + parts.path.rstrip("/")) or url
+
+
+def _trim(text: str, limit: int) -> str:
+    """Cut text to ``limit`` characters at a word boundary, marking the cut with an ellipsis."""
+    if len(text) <= limit:
+        return text
+    cut = text[: max(0, limit - 1)]
+    space = cut.rfind(" ")
+    if space > limit // 2:
+        cut = cut[:space]
+    return cut.rstrip(" ,;:.") + "…"
+
+
+def _text(hit: dict, field: str) -> str:
+    """A string field of a hit, treating a missing or null value as empty."""
+    return str(hit.get(field) or "")
+
+
+def _raw_bytes(hits: list[dict], answer: Any) -> int:
+    """Size of the fields compaction draws from, as the provider sent them."""
+    fields = (_text(hit, name) for hit in hits for name in ("title", "url", "content"))
+    return sum(len(field.encode()) for field in fields) + len(str(answer or "").encode())
+
+
+def compact_results(results: Any, query: str = "", token_budget: int = DEFAULT_TOKEN_BUDGET) -> str:
+    """
+    Turn a raw search response into a compact, ranked, size-bounded text block.
+
+    Args:
+        results: The search response (a dict with a ``results`` list of
+            title/url/content/score entries, and optionally an ``answer``).
+        query: The query, used in the header.
+        token_budget: Approximate token budget for the whole block.
+
+    Returns:
+        The compacted results, e.g. ``[1] Title (example.com/page)`` followed by a trimmed snippet.
+    """
+    hits = results.get("results", []) if isinstance(results, dict) else []
+    query = query or (results.get("query", "") if isinstance(results, dict) else "")
+
+    # Rank by score (stable, so equal scores keep the provider's order) and drop duplicates
+    ranked = sorted(hits, key=lambda hit: -float(hit.get("score") or 0.0))
+    seen: set[str] = set()
+    unique = []
+    for hit in ranked:
+        url_key = _url_key(_text(hit, "url"))
+        title_key = _SPACES.sub(" ", _text(hit, "title").lower()).strip()
+        if (url_key and url_key in seen) or (title_key and title_key in seen):
+            continue
+        seen.update(key for key in (url_key, title_key) if key)
+        unique.append(hit)
+    unique = unique[:MAX_HITS]
+
+    lines = [f'Search results for "{query}":']
+    answer = results.get("answer") if isinstance(results, dict) else None
+    if answer:
+        lines.append(f"Answer: {_trim(_SPACES.sub(' ', answer).strip(), token_budget * CHARS_PER_TOKEN // 4)}")
+    if not unique:
+        lines.append("No results found.")
+
+    remaining = token_budget * CHARS_PER_TOKEN - sum(len(line) + 1 for line in lines)
+    shown = 0
+    for rank, hit in enumerate(unique, 1):
+        hits_left = len(unique) - rank + 1
+        # A title may take at most half of this hit's share, leaving room for its snippet
+        title_limit = min(MAX_TITLE_CHARS, remaining // hits_left // 2)
+        if title_limit < MIN_TITLE_CHARS and shown:
+            break
+        title = _trim(_SPACES.sub(" ", _text(hit, "title")).strip() or "Untitled", max(title_limit, MIN_TITLE_CHARS))
+        header = f"[{rank}] {title} ({_display_url(_text(hit, 'url'))})"
+        remaining -= len(header) + 1
+        shown += 1
+        # Split what is left evenly over the remaining hits, so lower ranks still get a snippet
+        share = remaining // hits_left - 5
+        # Only the head of the page can survive trimming, so only normalize that much
+        content = _SPACES.sub(" ", (hit.get("content") or "")[: max(share, 0) * 2]).strip()
+        lines.append(header)
+        if share > 40 and content:
+            snippet = _trim(content, share)
+            lines.append(f"    {snippet}")
+            remaining -= len(snippet) + 5
+
+    compacted = "\n".join(lines)
+    report = CompactionReport(query, len(hits), shown, _raw_bytes(hits, answer), len(compacted.encode()))
+    reports.append(report)
+    logger.info("%s", report)
+    return compacted
@@ -0,0 +1,65 @@
+"""
+Web search tool using Tavily API.
+"""
+
+from agents import function_tool
+
+from .batching import MAX_BATCH_ITEMS, gather_bounded, split_batch
+from .search_client import get_search_client
+from .search_compaction import DEFAULT_TOKEN_BUDGET, compact_results
+
+# Floor for each query's share of the token budget in web_search_batch
+MIN_BATCH_TOKEN_BUDGET = 150
+
+
+@function_tool
+async def web_search(query: str) -> str:
+    """
+    Search the web for the given query using Tavily API.
+    
+    Args:
+        query: The search query to look up on the web.
+        
+    Returns:
+        The top web results for the query: title, source and a short snippet each.
+    """
+    if not query or not query.strip():
+        return "Error: No search query provided."
+    
+    try:
+        print(f"Searching for: {query}")
+        # Async, pooled and cached (memory + optional SQLite); nothing blocks the event loop
+        results = await get_search_client().search(query)
+        # Ranked, deduplicated and trimmed to a token budget instead of the raw response
+        return compact_results(results, query)
+    except Exception as e:
+        return f"Error performing web search: {str(e)}"
+
+
+@function_tool
+async def web_search_batch(queries: list[str]) -> str:
+    """
+    Search the web for several queries in one call (e.g. comparing a few topics).
+
+    Args:
+        queries: The search queries to look up on the web.
+
+    Returns:
+        The top results for each query, with a smaller snippet budget per query than a single search.
+    """
+    queries, skipped = split_batch(queries)
+    if not queries:
+        return "Error: No search queries provided."
+
+    # All queries share one token budget, so the answer stays about the size of a single search
+    token_budget = max(MIN_BATCH_TOKEN_BUDGET, DEFAULT_TOKEN_BUDGET // len(queries))
+    responses = await gather_bounded(get_search_client().search, queries)
+    sections = [
+        f"Error performing web search for {query!r}: {response}"
+        if isinstance(response, Exception)
+        else compact_results(response, query, token_budget)
+        for query, response in zip(queries, responses)
+    ]
+    if skipped:
+        sections.append(f"⚠️ {skipped} more queries were skipped (at most {MAX_BATCH_ITEMS} per call)")
+    return "\n\n".join(sections)
@@ -0,0 +1,195 @@
+"""
+Text summarizer tool for condensing long text into shorter summaries.
+
+Sentences are segmented lazily, so summarization stops reading as soon as the
+``max_length`` budget is filled. Files are memory-mapped rather than read, which
+keeps time and memory proportional to the summary instead of the document.
+
+In-memory text can alternatively be summarized extractively, picking the most
+central sentences by TF-IDF (see ``extractive.py``) instead of the leading ones.
+
+``file_summarizer`` only reads files under ``FILE_SUMMARIZER_ROOT`` (default:
+the working directory), and never hidden files such as ``.env``.
+
+Both tools run on their own executor (see ``executor.py``), off the event loop
+and with a timeout. ``SUMMARIZER_EXECUTOR=process`` moves them to a process
+pool, which keeps long TF-IDF runs from competing with the loop for the GIL.
+"""
+
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, Literal
+
+from agents import function_tool
+
+from .executor import off_loop
+
+# A sentence ends at ., ! or ? followed by whitespace (same rule as extractive.split_sentences)
+SENTENCE_BOUNDARY = re.compile(r"[.!?]\s")
+_BYTES_SENTENCE_BOUNDARY = re.compile(SENTENCE_BOUNDARY.pattern.encode())
+# A UTF-8 character is at most this many bytes
+_MAX_CHAR_BYTES = 4
+
+# Directory file_summarizer may read from; paths outside it (or hidden) are refused
+FILE_SUMMARIZER_ROOT = os.getenv("FILE_SUMMARIZER_ROOT", ".")
+
+# Executor settings shared by text_summarizer and file_summarizer
+SUMMARIZER_EXECUTOR = os.getenv("SUMMARIZER_EXECUTOR", "thread")
+SUMMARIZER_TIMEOUT_SECONDS = 10.0
+SUMMARIZER_MAX_CONCURRENCY = os.cpu_count() or 1
+
+
+def iter_sentences(text: str) -> Iterator[str]:
+    """Yield the sentences of ``text`` one at a time, each with its closing punctuation."""
+    start = 0
+    for boundary in SENTENCE_BOUNDARY.finditer(text):
+        yield text[start:boundary.start() + 1]
+        start = boundary.end()
+    yield text[start:]
+
+
+def iter_file_sentences(path: str, max_sentence_length: int | None = None) -> Iterator[str]:
+    """
+    Yield the sentences of a UTF-8 file one at a time from a memory map.
+
+    Only the pages actually scanned are touched, so stopping early never reads
+    the rest of the file. With ``max_sentence_length``, a sentence that cannot
+    fit in that many characters is yielded cut short and ends the scan, instead
+    of scanning (and decoding) to the end of a file without sentence breaks.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            start = 0
+            while True:
+                window = size if max_sentence_length is None else min(size, start + max_sentence_length * _MAX_CHAR_BYTES + 2)
+                boundary = _BYTES_SENTENCE_BOUNDARY.search(mapped, start, window)
+                if boundary is None:
+                    yield mapped[start:window].decode("utf-8", errors="replace")
+                    return
+                yield mapped[start:boundary.start() + 1].decode("utf-8", errors="replace")
+                start = boundary.end()
+
+
+def select_leading_sentences(sentences: Iterable[str], max_length: int) -> list[str]:
+    """Take leading sentences until the next one would overflow ``max_length``."""
+    summary_sentences = []
+    current_length = 0
+
+    for sentence in sentences:
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+
+        # Add period if sentence doesn't end with punctuation
+        if not sentence.endswith(('.', '!', '?')):
+            sentence += '.'
+
+        if current_length + len(sentence) + 1 <= max_length - 3:  # -3 for "..."
+            summary_sentences.append(sentence)
+            current_length += len(sentence) + 1
+        else:
+            break
+
+    return summary_sentences
+
+
+def _format_summary(summary_sentences: list[str], source_length: int) -> str:
+    summary = " ".join(summary_sentences)
+    if len(summary) < source_length:
+        summary = summary.rstrip('.') + "..."
+
+    return f"📝 Summary ({len(summary)} chars): {summary}"
+
+
+def summarize_text(text: str, max_length: int = 150, method: Literal["lead", "tfidf"] = "lead") -> str:
+    """Summarize an in-memory string (the implementation behind ``text_summarizer``)."""
+    if not text or not text.strip():
+        return "Error: No text provided to summarize."
+
+    # Clean the text
+    text = text.strip()
+
+    # If text is already shorter than max_length, return as is
+    if len(text) <= max_length:
+        return f"Summary: {text}"
+
+    if method == "tfidf":
+        # Imported here so NumPy is only loaded when extractive summaries are requested
+        from .extractive import select_central_sentences, split_sentences
+
+        return _format_summary(select_central_sentences(split_sentences(text), max_length), len(text))
+
+    return _format_summary(select_leading_sentences(iter_sentences(text), max_length), len(text))
+
+
+def summarize_file(path: str, max_length: int = 150) -> str:
+    """Summarize a file by streaming sentences from a memory map (behind ``file_summarizer``)."""
+    try:
+        size = os.path.getsize(path)
+    except OSError as e:
+        return f"Error: Cannot read file {path!r}. {str(e)}"
+
+    # Small files gain nothing from streaming
+    if size <= max_length * 4:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return summarize_text(f.read(), max_length)
+
+    return _format_summary(select_leading_sentences(iter_file_sentences(path, max_length), max_length), size)
+
+
+def resolve_allowed_path(file_path: str, root: str = FILE_SUMMARIZER_ROOT) -> str:
+    """
+    Resolve ``file_path`` (relative to ``root``) to a real path inside ``root``.
+
+    Raises:
+        PermissionError: If the path leaves ``root`` (symlinks included) or names a hidden file or directory.
+    """
+    base = Path(root).resolve()
+    resolved = (base / file_path).resolve()
+    if not resolved.is_relative_to(base):
+        raise PermissionError(f"{file_path!r} is outside the summarizer's root directory")
+    if any(part.startswith(".") for part in resolved.relative_to(base).parts):
+        raise PermissionError(f"{file_path!r} is a hidden file")
+    return str(resolved)
+
+
+@function_tool
+@off_loop(SUMMARIZER_TIMEOUT_SECONDS, SUMMARIZER_MAX_CONCURRENCY, SUMMARIZER_EXECUTOR)
+def text_summarizer(text: str, max_length: int = 150, method: Literal["lead", "tfidf"] = "lead") -> str:
+    """
+    Summarize a given text to a specified maximum length.
+
+    Args:
+        text: The text to be summarized.
+        max_length: Maximum length of the summary in characters (default: 150).
+        method: "lead" takes the opening sentences (default), "tfidf" picks the most central sentences.
+
+    Returns:
+        A summarized version of the input text.
+    """
+    return summarize_text(text, max_length, method)
+
+
+@function_tool
+@off_loop(SUMMARIZER_TIMEOUT_SECONDS, SUMMARIZER_MAX_CONCURRENCY, SUMMARIZER_EXECUTOR)
+def file_summarizer(file_path: str, max_length: int = 150) -> str:
+    """
+    Summarize a local text file without loading it into memory, suitable for very large documents.
+
+    Args:
+        file_path: Path to a UTF-8 text file, relative to the summarizer's root directory.
+        max_length: Maximum length of the summary in characters (default: 150).
+
+    Returns:
+        A summarized version of the file's text.
+    """
+    try:
+        path = resolve_allowed_path(file_path)
+    except PermissionError as e:
+        return f"Error: Cannot read file. {str(e)}"
+    return summarize_file(path, max_length)
@@ -0,0 +1,141 @@
+"""
+Async weather provider backing weather_fetcher when a real API is configured.
+
+One pooled ``httpx.AsyncClient`` is shared by every call, results are cached
+per location with a TTL, and concurrent requests for the same location are
+coalesced into a single upstream call. Speaks the OpenWeatherMap "current
+weather" API; point ``WEATHER_API_URL`` at any compatible endpoint (including
+a local stand-in server for testing).
+"""
+
+import os
+
+import httpx
+
+from .cache import MISSING, SingleFlight, TTLCache
+from .pooled_client import PooledClient
+
+DEFAULT_WEATHER_API_URL = "https://api.openweathermap.org/data/2.5"
+
+
+class WeatherProvider:
+    """Cached, coalescing client for an OpenWeatherMap-compatible API."""
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_WEATHER_API_URL,
+        api_key: str | None = None,
+        ttl: float = 600.0,
+        max_entries: int = 1024,
+        timeout: float = 10.0,
+        max_connections: int = 20,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.cache = TTLCache(maxsize=max_entries, ttl=ttl)
+        self.upstream_calls = 0
+        self._flights = SingleFlight()
+        self._client = PooledClient(self._new_client, on_new_loop=self._reset_flights)
+
+    def _new_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
+
+    def _reset_flights(self) -> None:
+        # In-flight tasks belong to the old loop; keep only the counter
+        coalesced = self._flights.coalesced
+        self._flights = SingleFlight()
+        self._flights.coalesced = coalesced
+
+    async def _fetch(self, key: str) -> str:
+        self.upstream_calls += 1
+        params = {"q": key, "units": "metric"}
+        if self.api_key:
+            params["appid"] = self.api_key
+        response = await self._client.get().get("/weather", params=params)
+        response.raise_for_status()
+        report = format_report(response.json())
+        self.cache.set(key, report)
+        return report
+
+    async def get(self, location: str) -> str:
+        """
+        Return a one-line weather report for ``location``.
+
+        Served from the cache when fresh; otherwise one upstream request is made
+        and shared by every concurrent caller asking for the same location.
+        """
+        key = " ".join(location.lower().split())
+        report = self.cache.get(key)
+        if report is not MISSING:
+            return report
+        self._client.get()  # binds the pooled client and in-flight table to this loop
+        return await self._flights.run(key, lambda: self._fetch(key))
+
+    def stats(self) -> dict[str, float]:
+        """Cache and upstream counters, for logging or benchmarks."""
+        return {
+            "hits": self.cache.hits,
+            "misses": self.cache.misses,
+            "hit_rate": self.cache.hit_rate,
+            "coalesced": self._flights.coalesced,
+            "upstream_calls": self.upstream_calls,
+        }
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def format_report(data: dict) -> str:
+    """Format an OpenWeatherMap current-weather response as a single line."""
+    description = (data.get("weather") or [{}])[0].get("description", "unknown conditions")
+    main = data.get("main", {})
+    wind = data.get("wind", {})
+    parts = [description.capitalize()]
+    if "temp" in main:
+        parts.append(f"{main['temp']:.0f}°C ({main['temp'] * 9 / 5 + 32:.0f}°F)")
+    if "humidity" in main:
+        parts.append(f"Humidity: {main['humidity']}%")
+    if "speed" in wind:
+        parts.append(f"Wind: {wind['speed']} m/s")
+    return ", ".join(parts)
+
+
+_provider: WeatherProvider | None = None
+
+
+def get_weather_provider() -> WeatherProvider | None:
+    """
+    Return the shared provider, or None when no weather API is configured.
+
+    Enabled by ``WEATHER_API_KEY`` (or ``WEATHER_API_URL`` for keyless stand-ins);
+    ``WEATHER_CACHE_TTL`` overrides the cache lifetime in seconds.
+    """
+    global _provider
+    if _provider is None:
+        api_key = os.getenv("WEATHER_API_KEY")
+        base_url = os.getenv("WEATHER_API_URL")
+        if not api_key and not base_url:
+            return None
+        _provider = WeatherProvider(
+            base_url=base_url or DEFAULT_WEATHER_API_URL,
+            api_key=api_key,
+            ttl=float(os.getenv("WEATHER_CACHE_TTL", "600")),
+        )
+    return _provider
+
+
+async def close_weather_provider() -> None:
+    """Close the shared provider if one was created."""
+    global _provider
+    if _provider is not None:
+        await _provider.aclose()
+        _provider = None
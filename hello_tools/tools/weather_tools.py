@@ -0,0 +1,141 @@
+"""
+Weather information fetcher tool.
+Note: By default this is a mock implementation. Set WEATHER_API_KEY (or WEATHER_API_URL)
+to fetch live data through the cached, coalescing provider in weather_provider.py.
+"""
+
+import os
+
+from agents import function_tool
+
+from .batching import MAX_BATCH_ITEMS, format_table, gather_bounded, split_batch
+from .gazetteer import Gazetteer, normalize_place
+from .memoize import memoize
+from .weather_provider import get_weather_provider
+
+# Mock weather data based on location with more realistic and varied data
+MOCK_WEATHER_DATA = {
+    "new york": "🌤️ Partly cloudy, 22°C (72°F), Humidity: 65%, Wind: 8 mph from the west",
+    "london": "☁️ Overcast, 15°C (59°F), Humidity: 78%, Wind: 12 mph from the south",
+    "tokyo": "🌤️ Partly cloudy, 18°C (64°F), Humidity: 55%, Wind: 5 mph calm conditions",
+    "paris": "🌧️ Light rain, 16°C (61°F), Humidity: 82%, Wind: 10 mph from the north",
+    "sydney": "☀️ Clear skies, 25°C (77°F), Humidity: 45%, Wind: 6 mph from the east",
+    "berlin": "🌦️ Light drizzle, 14°C (57°F), Humidity: 70%, Wind: 7 mph from the northwest",
+    "madrid": "☀️ Sunny, 28°C (82°F), Humidity: 40%, Wind: 4 mph light breeze",
+    "moscow": "❄️ Snow flurries, -5°C (23°F), Humidity: 85%, Wind: 15 mph from the northeast",
+    "dubai": "☀️ Clear, 32°C (90°F), Humidity: 25%, Wind: 3 mph light winds",
+    "mumbai": "🌧️ Heavy rain, 26°C (79°F), Humidity: 90%, Wind: 18 mph from the southwest"
+}
+
+# Alternative names for the built-in cities
+MOCK_ALIASES = {
+    "new york": ["nyc", "new york city", "big apple"],
+    "london": ["ldn"],
+    "mumbai": ["bombay"],
+    "sydney": ["syd"],
+}
+
+# Optional prebuilt gazetteer index (see tools/gazetteer.py); defaults to the mock cities
+GAZETTEER_PATH = os.getenv("WEATHER_GAZETTEER_PATH")
+
+# Repeated questions about the same place are answered from memory for this long
+WEATHER_MEMO_TTL = float(os.getenv("WEATHER_MEMO_TTL", "300"))
+
+_gazetteer: Gazetteer | None = None
+
+
+def get_gazetteer() -> Gazetteer:
+    """Load the place index once, on first lookup."""
+    global _gazetteer
+    if _gazetteer is None:
+        if GAZETTEER_PATH:
+            _gazetteer = Gazetteer.load(GAZETTEER_PATH)
+        else:
+            _gazetteer = Gazetteer.from_entries(
+                (city, MOCK_ALIASES.get(city, []), "") for city in MOCK_WEATHER_DATA
+            )
+    return _gazetteer
+
+
+DEFAULT_MOCK_WEATHER = "Partly cloudy, 20°C (68°F), Light winds. (Note: This is mock data - integrate with a real weather API for actual data)"
+
+
+@memoize(maxsize=512, ttl=WEATHER_MEMO_TTL, name="weather_fetcher")
+async def get_weather_report(location: str) -> str | None:
+    """
+    Weather for one (stripped, non-empty) location, shared by weather_fetcher and weather_fetcher_batch.
+
+    Returns:
+        The report, or None for a place without mock data when no weather API is configured.
+
+    Raises:
+        Exception: If the configured weather API fails (failures are not cached).
+    """
+    # Resolve exact names, aliases, places inside the query, prefixes and typos through the index
+    match = get_gazetteer().lookup(location)
+
+    provider = get_weather_provider()
+    if provider is not None:
+        # Canonical names let "London" and "london, uk" share one cache entry and upstream call
+        return await provider.get(match[0] if match is not None else location)
+
+    # Otherwise fall back to the mock data
+    if match is not None:
+        return MOCK_WEATHER_DATA.get(normalize_place(match[0]))
+    return None
+
+
+@function_tool
+async def weather_fetcher(location: str) -> str:
+    """
+    Fetch current weather information for a given location.
+    
+    Args:
+        location: The city or location to get weather for (e.g., "New York", "London", "Tokyo").
+        
+    Returns:
+        Current weather information for the specified location.
+    """
+    location = location.strip()
+    if not location:
+        return "Error: No location specified."
+
+    try:
+        weather = await get_weather_report(location)
+    except Exception as e:
+        return f"Error fetching weather for {location}: {str(e)}"
+    if weather is not None:
+        return f"Weather in {location}: {weather}"
+    
+    # Default response for unknown locations
+    return f"Weather information for {location}: {DEFAULT_MOCK_WEATHER}"
+
+
+@function_tool
+async def weather_fetcher_batch(locations: list[str]) -> str:
+    """
+    Fetch current weather for several locations in one call (e.g. "weather in London, Paris and Tokyo").
+
+    Args:
+        locations: The cities or locations to get weather for.
+
+    Returns:
+        One table row per location with its current weather.
+    """
+    locations, skipped = split_batch(locations)
+    if not locations:
+        return "Error: No locations specified."
+
+    reports = await gather_bounded(get_weather_report, locations)
+    rows = []
+    for location, weather in zip(locations, reports):
+        if isinstance(weather, Exception):
+            weather = f"Error: {weather}"
+        elif weather is None:
+            weather = DEFAULT_MOCK_WEATHER
+        rows.append([location, weather])
+
+    lines = [f"🌤️ Weather for {len(locations)} locations:", format_table(["Location", "Weather"], rows)]
+    if skipped:
+        lines.append(f"⚠️ {skipped} more locations were skipped (at most {MAX_BATCH_ITEMS} per call)")
+    return "\n".join(lines)
@@ -0,0 +1,131 @@
+"""
+Streamed run latency with tools started after the response vs while it streams.
+
+A local streaming mock model issues tool calls whose arguments are streamed
+chunk by chunk; the tools are slow async stand-ins (e.g. an HTTP lookup). The
+same run is timed with the Runner's default (tools start once the whole
+response has arrived) and with ``EarlyToolStarter`` (each tool starts as soon
+as its own arguments are complete). The gain is the tool time that overlaps
+with the rest of the response, so a single call at the end of a response gains
+little while a slow call followed by others gains most of its latency.
+
+A final check replays a run with a consumer that falls behind the stream
+(the Runner invokes the tools before the consumer sees their arguments) and
+fails unless every tool call executed exactly once.
+
+Run from the streaming directory:
+    uv run python -m benchmarks.bench_early_tools
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from agents import Agent, Runner, function_tool, set_tracing_disabled
+
+from benchmarks.streaming_model import StreamingMockModel
+from early_tools import EarlyToolStarter
+
+TOOL_SECONDS = {"search": 0.6, "lookup": 0.3, "convert": 0.1}
+
+
+def make_tools():
+    @function_tool
+    async def search(query: str) -> str:
+        """Search the web."""
+        await asyncio.sleep(TOOL_SECONDS["search"])
+        return f"results for {query}"
+
+    @function_tool
+    async def lookup(key: str) -> str:
+        """Look up a record."""
+        await asyncio.sleep(TOOL_SECONDS["lookup"])
+        return f"record {key}"
+
+    @function_tool
+    async def convert(amount: float, currency: str) -> str:
+        """Convert an amount of money."""
+        await asyncio.sleep(TOOL_SECONDS["convert"])
+        return f"{amount} {currency}"
+
+    return [search, lookup, convert]
+
+
+SCENARIOS = {
+    "one call": [[("lookup", {"key": "jokes"})]],
+    "slow call first": [[
+        ("search", {"query": "latest agent frameworks benchmark results"}),
+        ("lookup", {"key": "customer-42"}),
+        ("convert", {"amount": 125.5, "currency": "EUR"}),
+    ]],
+    "two turns": [
+        [("search", {"query": "weather in Lahore this week"}), ("lookup", {"key": "city-lahore"})],
+        [("convert", {"amount": 30, "currency": "PKR"})],
+    ],
+}
+
+
+async def run_once(turns, chunk_delay: float, early: bool) -> tuple[float, int]:
+    tools = make_tools()
+    starter = EarlyToolStarter(tools) if early else None
+    model = StreamingMockModel(turns, chunk_delay=chunk_delay)
+    agent = Agent(name="Bench", instructions="Use the tools.", model=model, tools=tools)
+
+    start = time.perf_counter()
+    result = Runner.run_streamed(agent, input="Go", max_turns=len(turns) + 2)
+    events = starter.stream_events(result) if starter else result.stream_events()
+    async for _ in events:
+        pass
+    return time.perf_counter() - start, starter.reused if starter else 0
+
+
+async def check_slow_consumer(chunk_delay: float, consumer_delay: float = 0.05) -> tuple[int, int, int]:
+    """Run a sync tool call with a consumer sleeping ``consumer_delay`` per event; returns (executions, started, reused)."""
+    executions = 0
+
+    @function_tool
+    def charge(account: str, amount: float) -> str:
+        """Charge an account (must never run twice for one call)."""
+        nonlocal executions
+        executions += 1
+        return f"charged {amount} to {account}"
+
+    starter = EarlyToolStarter([charge])
+    model = StreamingMockModel([[("charge", {"account": "acct-7", "amount": 12.5})]], chunk_delay=chunk_delay)
+    agent = Agent(name="Bench", instructions="Use the tools.", model=model, tools=[charge])
+    result = Runner.run_streamed(agent, input="Go", max_turns=3)
+    async for _ in starter.stream_events(result):
+        await asyncio.sleep(consumer_delay)
+    return executions, starter.started, starter.reused
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunk-delay", type=float, default=0.02, help="seconds between streamed argument chunks")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    set_tracing_disabled(True)
+
+    print(f"⏱️ Tool latency {TOOL_SECONDS}, {args.chunk_delay * 1000:.0f} ms per streamed chunk")
+    print(f"{'scenario':<18} {'after response':>15} {'while streaming':>16} {'saved':>8}  reused")
+    print("-" * 68)
+    for name, turns in SCENARIOS.items():
+        baseline = min([(await run_once(turns, args.chunk_delay, early=False))[0] for _ in range(args.repeat)])
+        runs = [await run_once(turns, args.chunk_delay, early=True) for _ in range(args.repeat)]
+        overlapped, reused = min(runs)
+        print(
+            f"{name:<18} {baseline * 1000:>12.0f} ms {overlapped * 1000:>13.0f} ms "
+            f"{(baseline - overlapped) * 1000:>5.0f} ms  {reused}/{sum(len(turn) for turn in turns)}"
+        )
+
+    executions, started, reused = await check_slow_consumer(args.chunk_delay)
+    print(f"\n🐢 Slow consumer: charge ran {executions}x (started early {started}, reused {reused})")
+    if executions != 1:
+        print("❌ A tool call the Runner already ran was started again from the stream")
+        sys.exit(1)
+    print("✅ Every tool call ran exactly once")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,146 @@
+"""
+A local streaming stand-in for the LLM, for offline streaming benchmarks.
+
+``StreamingMockModel`` plays back a fixed plan of tool calls, one model turn
+at a time, as Responses API stream events: each call's arguments are streamed
+in chunks with ``chunk_delay`` seconds between them, the way a real model
+generates them token by token. Once every planned call has a result in the
+conversation it streams a final message.
+"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator
+
+from agents import ModelResponse
+from agents.models.interface import Model
+from openai.types.responses import (
+    Response,
+    ResponseCompletedEvent,
+    ResponseFunctionCallArgumentsDeltaEvent,
+    ResponseFunctionToolCall,
+    ResponseOutputItemAddedEvent,
+    ResponseOutputItemDoneEvent,
+    ResponseOutputMessage,
+    ResponseOutputText,
+    ResponseUsage,
+)
+from openai.types.responses.response_usage import InputTokensDetails, OutputTokensDetails
+
+# One planned tool call: (tool name, arguments)
+ToolCall = tuple[str, dict[str, Any]]
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)] or [""]
+
+
+class StreamingMockModel(Model):
+    """Streams ``turns`` (each a list of tool calls issued together), then a final answer."""
+
+    def __init__(
+        self,
+        turns: list[list[ToolCall]],
+        chunk_delay: float = 0.02,
+        chunk_size: int = 4,
+        final_output: str = "Done.",
+    ):
+        self.turns = turns
+        self.chunk_delay = chunk_delay
+        self.chunk_size = chunk_size
+        self.final_output = final_output
+        self.round_trips = 0
+
+    def _next_turn(self, input: str | list[Any]) -> list[ToolCall]:
+        """The planned calls not answered yet in ``input``, as the next turn (empty when finished)."""
+        answered = 0 if isinstance(input, str) else sum(
+            1 for item in input if isinstance(item, dict) and item.get("type") == "function_call_output"
+        )
+        issued = 0
+        for turn in self.turns:
+            if issued == answered:
+                return turn
+            issued += len(turn)
+        return []
+
+    async def get_response(self, *args, **kwargs) -> ModelResponse:
+        raise NotImplementedError("StreamingMockModel only supports streamed runs")
+
+    async def stream_response(
+        self,
+        system_instructions,
+        input,
+        model_settings,
+        tools,
+        output_schema,
+        handoffs,
+        tracing,
+        *,
+        previous_response_id=None,
+        conversation_id=None,
+        prompt=None,
+    ) -> AsyncIterator[Any]:
+        self.round_trips += 1
+        sequence = iter(range(1_000_000))
+        output: list[Any] = []
+
+        for index, (name, arguments) in enumerate(self._next_turn(input)):
+            call = ResponseFunctionToolCall(
+                id=f"fc_{self.round_trips}_{index}",
+                call_id=f"call_{self.round_trips}_{index}",
+                name=name,
+                arguments="",
+                type="function_call",
+            )
+            yield ResponseOutputItemAddedEvent(
+                item=call, output_index=index, sequence_number=next(sequence), type="response.output_item.added"
+            )
+            for chunk in _chunks(json.dumps(arguments), self.chunk_size):
+                await asyncio.sleep(self.chunk_delay)
+                yield ResponseFunctionCallArgumentsDeltaEvent(
+                    delta=chunk,
+                    item_id=call.id,
+                    output_index=index,
+                    sequence_number=next(sequence),
+                    type="response.function_call_arguments.delta",
+                )
+            call = call.model_copy(update={"arguments": json.dumps(arguments)})
+            output.append(call)
+            yield ResponseOutputItemDoneEvent(
+                item=call, output_index=index, sequence_number=next(sequence), type="response.output_item.done"
+            )
+
+        if not output:
+            for _ in _chunks(self.final_output, self.chunk_size):
+                await asyncio.sleep(self.chunk_delay)
+            message = ResponseOutputMessage(
+                id=f"msg_{self.round_trips}",
+                content=[ResponseOutputText(text=self.final_output, type="output_text", annotations=[])],
+                role="assistant",
+                status="completed",
+                type="message",
+            )
+            output.append(message)
+            yield ResponseOutputItemDoneEvent(
+                item=message, output_index=0, sequence_number=next(sequence), type="response.output_item.done"
+            )
+
+        usage = ResponseUsage(
+            input_tokens=0,
+            output_tokens=0,
+            total_tokens=0,
+            input_tokens_details=InputTokensDetails(cached_tokens=0),
+            output_tokens_details=OutputTokensDetails(reasoning_tokens=0),
+        )
+        response = Response(
+            id=f"resp_{self.round_trips}",
+            created_at=0,
+            model="streaming-mock",
+            object="response",
+            output=output,
+            tool_choice="auto",
+            tools=[],
+            parallel_tool_calls=True,
+            usage=usage,
+        )
+        yield ResponseCompletedEvent(response=response, sequence_number=next(sequence), type="response.completed")
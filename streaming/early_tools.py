@@ -0,0 +1,137 @@
+"""
+Start tool calls while the model response is still streaming.
+
+Normally the Runner executes tool calls only after the whole model response
+has arrived, although each call's arguments are complete much earlier in the
+``raw_response_event`` stream. ``EarlyToolStarter`` watches those raw events,
+and as soon as a call's arguments are complete (the ``output_item.done`` event,
+or earlier, once the streamed arguments form a complete JSON object) it starts
+the tool in the background. When the Runner later invokes the tool for that
+call, it gets the already running (or finished) result, so tool latency
+overlaps with the rest of the generation:
+
+    early = EarlyToolStarter([how_many_jokes])
+    result = Runner.run_streamed(agent, input="Hello")
+    async for event in early.stream_events(result):
+        ...
+
+Only use it for tools that are safe to run before the response is final: a
+call is started even if the run later stops without executing it (for example
+a guardrail trips), in which case the started call is cancelled. Sync tools
+run on the event loop like they do in the Runner, so async tools gain the most.
+
+Early starts follow the consumer of ``stream_events``, while the Runner invokes
+tools on its own schedule. A consumer that falls behind may see a call's
+arguments only after the Runner has already run it; such calls are never
+started again.
+"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator
+
+from agents import FunctionTool, RunContextWrapper, RunResultStreaming, StreamEvent
+from agents.tool_context import ToolContext
+from openai.types.responses import ResponseFunctionToolCall
+
+
+def _complete_arguments(arguments: str) -> bool:
+    """True once streamed arguments form a whole JSON object (nothing valid can follow it)."""
+    if not arguments.rstrip().endswith("}"):
+        return False
+    try:
+        return isinstance(json.loads(arguments), dict)
+    except ValueError:
+        return False
+
+
+def _same_arguments(a: str, b: str) -> bool:
+    try:
+        return json.loads(a or "{}") == json.loads(b or "{}")
+    except ValueError:
+        return a == b
+
+
+class EarlyToolStarter:
+    """Wraps function tools so calls started from the stream are reused when the Runner invokes them."""
+
+    def __init__(self, tools: list[FunctionTool]):
+        self.tools = {tool.name: tool for tool in tools}
+        self.started = 0
+        self.reused = 0
+        self._invokes: dict[str, Any] = {}
+        # call_id -> (arguments, task) of calls started from the stream
+        self._tasks: dict[str, tuple[str, asyncio.Task]] = {}
+        # call_ids the Runner has invoked; a late stream event must not start them again
+        self._claimed: set[str] = set()
+        # output_index -> tool call being streamed
+        self._streaming: dict[int, ResponseFunctionToolCall] = {}
+        for tool in tools:
+            self._invokes[tool.name] = tool.on_invoke_tool
+            tool.on_invoke_tool = self._make_invoke(tool.name)
+
+    def _make_invoke(self, name: str):
+        invoke = self._invokes[name]
+
+        async def on_invoke_tool(ctx: ToolContext[Any], arguments: str) -> Any:
+            call_id = getattr(ctx, "tool_call_id", None)
+            if call_id:
+                self._claimed.add(call_id)
+            started = self._tasks.pop(call_id, None)
+            if started is not None:
+                started_arguments, task = started
+                if _same_arguments(started_arguments, arguments):
+                    self.reused += 1
+                    return await task
+                task.cancel()
+            return await invoke(ctx, arguments)
+
+        return on_invoke_tool
+
+    def _start(self, call: ResponseFunctionToolCall, context: RunContextWrapper[Any]) -> None:
+        if call.name not in self.tools or not call.call_id:
+            return
+        if call.call_id in self._tasks or call.call_id in self._claimed:
+            return
+        ctx = ToolContext.from_agent_context(context, call.call_id, tool_call=call)
+        task = asyncio.ensure_future(self._invokes[call.name](ctx, call.arguments))
+        self._tasks[call.call_id] = (call.arguments, task)
+        self.started += 1
+
+    def observe(self, event: StreamEvent, context: RunContextWrapper[Any]) -> None:
+        """Feed one stream event; starts any tool call whose arguments are now complete."""
+        if event.type != "raw_response_event":
+            return
+        data = event.data
+        if data.type == "response.output_item.added" and data.item.type == "function_call":
+            self._streaming[data.output_index] = data.item.model_copy()
+        elif data.type == "response.function_call_arguments.delta":
+            call = self._streaming.get(data.output_index)
+            if call is not None:
+                call.arguments += data.delta
+                if _complete_arguments(call.arguments):
+                    self._start(call, context)
+        elif data.type == "response.output_item.done" and data.item.type == "function_call":
+            self._streaming.pop(data.output_index, None)
+            self._start(data.item, context)
+        elif data.type == "response.completed":
+            self._streaming.clear()
+
+    def cancel(self) -> None:
+        """Cancel started calls the Runner never asked for."""
+        for _, task in self._tasks.values():
+            if task.done() and not task.cancelled():
+                task.exception()  # retrieved, so a failed call is not reported as never awaited
+            task.cancel()
+        self._tasks.clear()
+        self._claimed.clear()
+        self._streaming.clear()
+
+    async def stream_events(self, result: RunResultStreaming) -> AsyncIterator[StreamEvent]:
+        """``result.stream_events()``, starting tool calls early along the way."""
+        try:
+            async for event in result.stream_events():
+                self.observe(event, result.context_wrapper)
+                yield event
+        finally:
+            self.cancel()
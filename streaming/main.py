@@ -2,12 +2,16 @@ import asyncio
 import random
 from agents import Agent, ItemHelpers, Runner, function_tool
 
+from early_tools import EarlyToolStarter
+
 @function_tool
 def how_many_jokes() -> int:
     return random.randint(1, 10)
 
 
 async def main():
+    # Start how_many_jokes as soon as its arguments have streamed, not after the whole response
+    early = EarlyToolStarter([how_many_jokes])
     agent = Agent(
         name="Joker",
         instructions="First call the `how_many_jokes` tool, then tell that many jokes.",
@@ -20,7 +24,7 @@ async def main():
     )
     print("=== Run starting ===")
 
-    async for event in result.stream_events():
+    async for event in early.stream_events(result):
         # We'll ignore the raw responses event deltas
         if event.type == "raw_response_event":
             continue
@@ -40,6 +44,7 @@ async def main():
                 pass  # Ignore other event types
 
     print("=== Run complete ===")
+    print(f"Tool calls started while streaming: {early.started} (used by the run: {early.reused})")
 
 
 if __name__ == "__main__":